@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from interview_insider.storage import write_json_atomic
+from interview_insider.usage_rollup import usage_record_from_payload
+
+ANALYTICS_DIRNAME = "_analytics"
+CACHE_FILENAME = "corpus.json"
+CACHE_VERSION = 1
+GROUP_COLUMNS = ("model", "vacancy", "language", "month", "quarter")
+
+# Interview-level columns (one row per saved extraction) and their array
+# type codes; string columns hold codes into the matching ``StringPool``.
+_INTERVIEW_COLUMNS = {
+    "model": "I",
+    "vacancy": "I",
+    "language": "I",
+    "month": "I",
+    "quarter": "I",
+    "created_at": "d",
+    "items": "I",
+    "input_tokens": "q",
+    "output_tokens": "q",
+    "cost_usd": "d",
+}
+# One row per (interview, error) pair from ``errors_and_problems``.
+_ERROR_COLUMNS = {"error_interview": "I", "error": "I"}
+_POOLED = (*GROUP_COLUMNS, "error")
+
+_TRAILING_PUNCTUATION = " .;:,!"
+
+
+def _normalize_error(text: Any) -> str:
+    return " ".join(str(text or "").split()).strip(_TRAILING_PUNCTUATION).lower()
+
+
+def normalize_vacancy(text: Any) -> str:
+    return " ".join(str(text or "").split()).lower() or "unknown"
+
+
+class StringPool:
+    """Interns strings: each distinct value is stored once and referenced by code."""
+
+    def __init__(self, values: list[str] | None = None) -> None:
+        self.values: list[str] = list(values or [])
+        self._codes = {value: code for code, value in enumerate(self.values)}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def intern(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def code(self, value: str) -> int | None:
+        return self._codes.get(value)
+
+
+def _numpy() -> Any:
+    """NumPy if installed (it comes with Streamlit), else ``None`` for the pure-Python paths."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _view(column: array) -> Any:
+    """Zero-copy NumPy view of an ``array`` column."""
+    import numpy as np
+
+    return np.frombuffer(column, dtype=np.dtype(column.typecode))
+
+
+def _bincount(codes: array, size: int, *, weights: array | None = None, keep: bytearray | None = None) -> list[float]:
+    """Sum ``weights`` (or count rows) per code, over the rows where ``keep`` is set."""
+    np = _numpy()
+    if np is None:
+        totals = [0.0] * size
+        for row, code in enumerate(codes):
+            if keep is None or keep[row]:
+                totals[code] += weights[row] if weights is not None else 1
+        return totals
+    np_codes = _view(codes)
+    np_weights = _view(weights) if weights is not None else None
+    if keep is not None:
+        mask = np.frombuffer(keep, dtype=np.bool_)
+        np_codes = np_codes[mask]
+        np_weights = np_weights[mask] if np_weights is not None else None
+    return np.bincount(np_codes, weights=np_weights, minlength=size).tolist()
+
+
+@dataclass
+class QACorpus:
+    """Every saved extraction of an output directory, stored column by column.
+
+    Strings (models, vacancies, languages, periods, error texts) are
+    interned in ``pools``; everything else lives in ``array`` columns, so
+    tens of thousands of interviews take a few MB and group-by operations
+    are array scans (NumPy ``bincount`` when available).
+    """
+
+    pools: dict[str, StringPool] = field(default_factory=lambda: {name: StringPool() for name in _POOLED})
+    columns: dict[str, array] = field(
+        default_factory=lambda: {
+            name: array(typecode) for name, typecode in {**_INTERVIEW_COLUMNS, **_ERROR_COLUMNS}.items()
+        }
+    )
+    files: dict[str, float] = field(default_factory=dict)
+    _error_codes: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.columns["items"])
+
+    def add(self, qa_json: dict[str, Any], usage_payload: dict[str, Any], *, fallback_time: float) -> None:
+        created = usage_payload.get("created_at")
+        moment = datetime.fromisoformat(created) if created else datetime.fromtimestamp(fallback_time, timezone.utc)
+        record = usage_record_from_payload(usage_payload) if usage_payload else {}
+        items = [item for item in qa_json.get("items") or [] if isinstance(item, dict)]
+        interview = len(self)
+        values = {
+            "model": str(usage_payload.get("model") or "unknown"),
+            "vacancy": normalize_vacancy(usage_payload.get("vacancy") or qa_json.get("vacancy")),
+            "language": str(usage_payload.get("language") or "unknown"),
+            "month": moment.strftime("%Y-%m"),
+            "quarter": f"{moment.year}-Q{(moment.month - 1) // 3 + 1}",
+        }
+        for name, value in values.items():
+            self.columns[name].append(self.pools[name].intern(value))
+        self.columns["created_at"].append(moment.timestamp())
+        self.columns["items"].append(len(items))
+        self.columns["input_tokens"].append(int(record.get("input_tokens", 0)))
+        self.columns["output_tokens"].append(int(record.get("output_tokens", 0)))
+        self.columns["cost_usd"].append(float(record.get("cost_usd", 0.0)))
+        for item in items:
+            errors = item.get("errors_and_problems") or []
+            for error in errors if isinstance(errors, list) else [errors]:
+                code = self._error_codes.get(error) if isinstance(error, str) else None
+                if code is None:
+                    normalized = _normalize_error(error)
+                    if not normalized:
+                        continue
+                    code = self.pools["error"].intern(normalized)
+                    if isinstance(error, str):
+                        self._error_codes[error] = code
+                self.columns["error_interview"].append(interview)
+                self.columns["error"].append(code)
+
+    def mask(
+        self,
+        *,
+        model: str | None = None,
+        vacancy: str | None = None,
+        language: str | None = None,
+        quarter: str | None = None,
+        month: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> bytearray:
+        """Interviews matching every given filter, as a 0/1 byte per interview."""
+        filters = {
+            "model": model,
+            "vacancy": normalize_vacancy(vacancy) if vacancy else None,
+            "language": language,
+            "quarter": quarter,
+            "month": month,
+        }
+        codes = {
+            name: self.pools[name].code(value)
+            for name, value in filters.items()
+            if value is not None
+        }
+        low = since.timestamp() if since else float("-inf")
+        high = until.timestamp() if until else float("inf")
+        np = _numpy()
+        if np is not None:
+            keep = np.ones(len(self), dtype=np.bool_)
+            for name, code in codes.items():
+                keep &= _view(self.columns[name]) == (-1 if code is None else code)
+            if since or until:
+                created_at = _view(self.columns["created_at"])
+                keep &= (created_at >= low) & (created_at < high)
+            return bytearray(keep.tobytes())
+        keep = bytearray(b"\x01") * len(self)
+        for name, code in codes.items():
+            column = self.columns[name]
+            for row in range(len(keep)):
+                if keep[row] and column[row] != code:
+                    keep[row] = 0
+        if since or until:
+            created_at = self.columns["created_at"]
+            for row in range(len(keep)):
+                if keep[row] and not low <= created_at[row] < high:
+                    keep[row] = 0
+        return keep
+
+    def group_by(self, by: str, *, keep: bytearray | None = None) -> list[dict[str, Any]]:
+        """Interviews, items, average items per interview, tokens and cost per ``by`` value."""
+        if by not in GROUP_COLUMNS:
+            raise ValueError(f"Unsupported group '{by}'. Supported: {', '.join(GROUP_COLUMNS)}")
+        codes = self.columns[by]
+        size = len(self.pools[by])
+        interviews = _bincount(codes, size, keep=keep)
+        sums = {
+            name: _bincount(codes, size, weights=self.columns[name], keep=keep)
+            for name in ("items", "input_tokens", "output_tokens", "cost_usd")
+        }
+        rows = []
+        for code, count in enumerate(interviews):
+            if not count:
+                continue
+            rows.append(
+                {
+                    by: self.pools[by].values[code],
+                    "interviews": int(count),
+                    "items": int(sums["items"][code]),
+                    "avg_items": round(sums["items"][code] / count, 2),
+                    "input_tokens": int(sums["input_tokens"][code]),
+                    "output_tokens": int(sums["output_tokens"][code]),
+                    "cost_usd": round(sums["cost_usd"][code], 4),
+                }
+            )
+        return sorted(rows, key=lambda row: row["interviews"], reverse=True)
+
+    def top_errors(self, *, keep: bytearray | None = None, limit: int = 10) -> list[dict[str, Any]]:
+        """Most frequent normalized ``errors_and_problems`` among the kept interviews."""
+        error_keep = None
+        if keep is not None:
+            np = _numpy()
+            if np is not None:
+                error_keep = bytearray(np.frombuffer(keep, dtype=np.bool_)[_view(self.columns["error_interview"])].tobytes())
+            else:
+                error_keep = bytearray(keep[interview] for interview in self.columns["error_interview"])
+        counts = _bincount(self.columns["error"], len(self.pools["error"]), keep=error_keep)
+        ranked = sorted(
+            (code for code, count in enumerate(counts) if count),
+            key=lambda code: counts[code],
+            reverse=True,
+        )
+        return [{"error": self.pools["error"].values[code], "count": int(counts[code])} for code in ranked[:limit]]
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "version": CACHE_VERSION,
+            "files": self.files,
+            "pools": {name: pool.values for name, pool in self.pools.items()},
+            "columns": {
+                name: [column.typecode, base64.b64encode(column.tobytes()).decode("ascii")]
+                for name, column in self.columns.items()
+            },
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> QACorpus:
+        columns = {}
+        for name, (typecode, data) in payload["columns"].items():
+            column = array(typecode)
+            column.frombytes(base64.b64decode(data))
+            columns[name] = column
+        return cls(
+            pools={name: StringPool(values) for name, values in payload["pools"].items()},
+            columns=columns,
+            files=dict(payload["files"]),
+        )
+
+
+def _output_files(output_dir: Path) -> dict[str, float]:
+    files = {}
+    for path in output_dir.glob("*_qa.json"):
+        try:
+            files[path.name] = path.stat().st_mtime
+        except OSError:
+            continue
+    return files
+
+
+def cache_path(output_dir: str | Path) -> Path:
+    return Path(output_dir) / ANALYTICS_DIRNAME / CACHE_FILENAME
+
+
+def build_corpus(output_dir: str | Path, *, use_cache: bool = True) -> QACorpus:
+    """Load every ``*_qa.json`` (with its ``.usage.json``) of ``output_dir`` into a ``QACorpus``.
+
+    The compacted corpus is cached in ``_analytics/corpus.json`` and reused
+    while the set of outputs and their mtimes is unchanged.
+    """
+    output_path = Path(output_dir)
+    files = _output_files(output_path)
+    cache = cache_path(output_path)
+    if use_cache and cache.exists():
+        try:
+            payload = json.loads(cache.read_text(encoding="utf-8"))
+            if payload.get("version") == CACHE_VERSION and payload.get("files") == files:
+                return QACorpus.from_payload(payload)
+        except (OSError, ValueError, KeyError):
+            pass
+    corpus = QACorpus(files=files)
+    for name in sorted(files):
+        path = output_path / name
+        try:
+            qa_json = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        try:
+            usage_payload = json.loads(path.with_suffix(".usage.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            usage_payload = {}
+        corpus.add(qa_json, usage_payload, fallback_time=files[name])
+    if use_cache:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(cache, corpus.to_payload())
+    return corpus
+
+
+def format_table(rows: list[dict[str, Any]]) -> str:
+    if not rows:
+        return "No matching interviews."
+    keys = list(rows[0])
+    table = [keys, *[[str(row.get(key, "")) for key in keys] for row in rows]]
+    widths = [max(len(line[idx]) for line in table) for idx in range(len(keys))]
+    lines = []
+    for line_index, line in enumerate(table):
+        cells = [
+            cell.ljust(width) if idx == 0 else cell.rjust(width)
+            for idx, (cell, width) in enumerate(zip(line, widths))
+        ]
+        lines.append("  ".join(cells))
+        if line_index == 0:
+            lines.append("  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def _date(value: str) -> datetime:
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Aggregate statistics over every saved QA extraction."
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="interview_insider/interview_insights",
+        help="Directory with QA JSON outputs.",
+    )
+    parser.add_argument(
+        "--report",
+        choices=["items", "errors"],
+        default="items",
+        help="items: interviews, items and cost per group; errors: most frequent errors_and_problems.",
+    )
+    parser.add_argument(
+        "--by",
+        choices=GROUP_COLUMNS,
+        default="model",
+        help="Group for the items report (default: model).",
+    )
+    parser.add_argument("--model", default=None, help="Only interviews served by this model.")
+    parser.add_argument("--vacancy", default=None, help="Only interviews for this vacancy (case-insensitive).")
+    parser.add_argument("--language", default=None, help="Only interviews in this output language.")
+    parser.add_argument("--quarter", default=None, help="Only this quarter, e.g. 2026-Q3.")
+    parser.add_argument("--month", default=None, help="Only this month, e.g. 2026-08.")
+    parser.add_argument("--since", type=_date, default=None, help="Only runs on or after this date (YYYY-MM-DD).")
+    parser.add_argument("--until", type=_date, default=None, help="Only runs before this date (YYYY-MM-DD).")
+    parser.add_argument("--limit", type=int, default=10, help="Rows in the errors report (default: 10).")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the cached corpus and rescan all outputs.")
+    parser.add_argument("--json", action="store_true", help="Print rows as JSON.")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.output_dir, use_cache=not args.rebuild)
+    keep = corpus.mask(
+        model=args.model,
+        vacancy=args.vacancy,
+        language=args.language,
+        quarter=args.quarter,
+        month=args.month,
+        since=args.since,
+        until=args.until,
+    )
+    if args.report == "errors":
+        rows = corpus.top_errors(keep=keep, limit=args.limit)
+    else:
+        rows = corpus.group_by(args.by, keep=keep)
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+    else:
+        print(format_table(rows))
+
+
+__all__ = [
+    "GROUP_COLUMNS",
+    "QACorpus",
+    "StringPool",
+    "build_corpus",
+    "cache_path",
+    "format_table",
+    "normalize_vacancy",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 import html
-from typing import Any
 import json
+import os
 import sys
+import uuid
 
 import streamlit as st
 
@@ -14,77 +16,51 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from interview_insider.qa_extractor import (  # noqa: E402
+    PIPELINES,
     extract_resume_text_from_bytes,
     run_qa_extraction,
     run_qa_extraction_for_file,
 )
-from interview_insider.qa_markdown_exporter import qa_json_to_markdown  # noqa: E402
-
-
-LLM_MODELS = ["o3", "5.2", "4.1", "o4-mini"]
-QA_OUTPUT_DIR = REPO_ROOT / "interview_insider" / "interview_insights"
-MODEL_CARDS = [
-    {
-        "name": "o3",
-        "summary": "Reasoning model for complex tasks.",
-        "tagline": "Reasoning first",
-        "reasoning": "5/5",
-        "speed": "1/3",
-        "reasoning_supported": True,
-        "reasoning_tokens": True,
-        "theme": "sunset",
-        "pricing": {
-            "input": "$2.00",
-            "cached_input": "$0.50",
-            "output": "$8.00",
-        },
-    },
-    {
-        "name": "5.2",
-        "summary": "Best for coding and agentic tasks.",
-        "tagline": "Agentic coding",
-        "reasoning": "5/5",
-        "speed": "3/3",
-        "reasoning_supported": True,
-        "reasoning_tokens": True,
-        "theme": "ocean",
-        "pricing": {
-            "input": "$1.75",
-            "cached_input": "$0.18",
-            "output": "$14.00",
-        },
-    },
-    {
-        "name": "o4-mini",
-        "summary": "Fast, cost-efficient reasoning model.",
-        "tagline": "Fast + efficient",
-        "reasoning": "4/5",
-        "speed": "3/3",
-        "reasoning_supported": True,
-        "reasoning_tokens": True,
-        "theme": "dawn",
-        "pricing": {
-            "input": "$1.10",
-            "cached_input": "$0.28",
-            "output": "$4.40",
-        },
-    },
-    {
-        "name": "4.1",
-        "summary": "Strongest non-reasoning model.",
-        "tagline": "Pure intelligence",
-        "intelligence": "4/5",
-        "speed": "3/3",
-        "reasoning_supported": False,
-        "reasoning_tokens": False,
-        "theme": "cloud",
-        "pricing": {
-            "input": "$2.00",
-            "cached_input": "$0.50",
-            "output": "$8.00",
-        },
-    },
-]
+from interview_insider.analytics import GROUP_COLUMNS, QACorpus, build_corpus  # noqa: E402
+from interview_insider.deep_dive import deep_dive_items, pending_deep_dive_items  # noqa: E402
+from interview_insider.ingestion import read_text_stream  # noqa: E402
+from interview_insider.llm_client import AUTO_MODEL, HedgePolicy, LLMClient  # noqa: E402
+from interview_insider.model_cards import MODEL_CARDS  # noqa: E402
+from interview_insider.model_compare import (  # noqa: E402
+    COMPARE_MODELS,
+    apply_speed_ratings,
+    compare_models,
+    history_path,
+    measured_speed_ratings,
+)
+from interview_insider.qa_markdown_exporter import normalize_list, qa_json_to_markdown  # noqa: E402
+from interview_insider.question_index import hit_rate_summary, load_question_index  # noqa: E402
+from interview_insider.fair_executor import FairExecutor  # noqa: E402
+from interview_insider.resume_summary import condense_resume, load_resume_summary, resume_hash  # noqa: E402
+from interview_insider.segments import SEGMENTS_SUFFIX  # noqa: E402
+from interview_insider.schema_profiles import (  # noqa: E402
+    SCHEMA_DESCRIPTIONS,
+    SCHEMA_FULL,
+    SCHEMA_PROFILES,
+    schema_of_payload,
+)
+from interview_insider.usage_rollup import (  # noqa: E402
+    ROLLUP_DIMENSIONS,
+    extract_usage_numbers,
+    load_rollup,
+    rollup_rows,
+    rollup_totals,
+)
+
+
+LLM_MODELS = ["o3", "5.2", "4.1", "o4-mini", AUTO_MODEL]
+# INTERVIEW_INSIGHTS_DIR points the app at another outputs folder (e.g. the
+# synthetic corpus of ``app_load_test``).
+QA_OUTPUT_DIR = Path(os.environ.get("INTERVIEW_INSIGHTS_DIR") or REPO_ROOT / "interview_insider" / "interview_insights")
+# Extractions (and comparisons, deep dives) running at once across all
+# sessions of this server process; the rest wait in a per-session fair queue.
+MAX_CONCURRENT_EXTRACTIONS = 4
+QUEUE_POLL_SECONDS = 0.5
 
 QA_PROGRESS_STAGES = [
     "Validating input data",
@@ -98,33 +74,7 @@ QA_PROGRESS_STAGES = [
 QA_PROGRESS_INDEX = {stage: idx for idx, stage in enumerate(QA_PROGRESS_STAGES)}
 
 
-def _extract_usage_numbers(usage: dict) -> dict[str, int]:
-    if not isinstance(usage, dict):
-        return {}
-    summary: dict[str, int] = {}
-    input_tokens = usage.get("input_tokens")
-    output_tokens = usage.get("output_tokens")
-    total_tokens = usage.get("total_tokens")
-    if isinstance(input_tokens, int):
-        summary["input_tokens"] = input_tokens
-    if isinstance(output_tokens, int):
-        summary["output_tokens"] = output_tokens
-    if isinstance(total_tokens, int):
-        summary["total_tokens"] = total_tokens
-    input_details = usage.get("input_tokens_details") or {}
-    output_details = usage.get("output_tokens_details") or {}
-    cached_tokens = input_details.get("cached_tokens")
-    reasoning_tokens = output_details.get("reasoning_tokens")
-    if isinstance(cached_tokens, int):
-        summary["cached_input_tokens"] = cached_tokens
-    if isinstance(reasoning_tokens, int):
-        summary["reasoning_tokens"] = reasoning_tokens
-    return summary
-
-
-st.set_page_config(page_title="Interview Insights (QA only)", page_icon="I", layout="wide")
-st.markdown(
-    """
+APP_CSS = """
     <style>
       @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;600;700&family=Plus+Jakarta+Sans:wght@400;500;600&display=swap');
 
@@ -355,23 +305,7 @@ st.markdown(
         color: var(--text);
       }
     </style>
-    """,
-    unsafe_allow_html=True,
-)
-st.title("Interview Insights (QA only)")
-st.markdown("<p class='hero-subtitle'>Upload transcripts or provide a path; no transcription step.</p>", unsafe_allow_html=True)
-
-with st.sidebar:
-    st.header("LLM settings")
-    model = st.selectbox("Model", LLM_MODELS, index=0)
-    language = st.text_input("Answer language", value="ru")
-    vacancy = st.text_input("Vacancy name", value="")
-    resume_file = st.file_uploader(
-        "Resume (pdf/txt/md, optional)",
-        type=["pdf", "txt", "md"],
-    )
-
-st.markdown("<div class='section-title'>Model comparison</div>", unsafe_allow_html=True)
+    """
 
 
 def render_card(card: dict[str, object]) -> str:
@@ -462,8 +396,8 @@ def _render_qa_json_structured(qa_json: dict[str, Any]) -> None:
     if role:
         st.markdown(f"**Role identified:** {role}")
 
-    stages = qa_json.get("stages_of_conversation_short") or []
-    if isinstance(stages, list) and stages:
+    stages = normalize_list(qa_json.get("stages_of_conversation_short"))
+    if stages:
         st.markdown("**Conversation stages:**")
         stages_list = _render_bulleted_list(
             stages,
@@ -516,8 +450,8 @@ def _render_qa_json_structured(qa_json: dict[str, Any]) -> None:
             st.markdown("<div class='qa-section'><div class='qa-section-title'>Key idea:</div></div>", unsafe_allow_html=True)
             st.markdown(key_idea)
 
-        errors = item.get("errors_and_problems") or []
-        if isinstance(errors, list) and errors:
+        errors = normalize_list(item.get("errors_and_problems"))
+        if errors:
             errors_list = _render_bulleted_list(errors, "<span class='qa-error-icon'>x</span>")
             if errors_list:
                 st.markdown("<div class='qa-section'><div class='qa-section-title'>Issues:</div></div>", unsafe_allow_html=True)
@@ -537,6 +471,13 @@ def _render_qa_json_structured(qa_json: dict[str, Any]) -> None:
         ideal_en = str(item.get("the_ideal_answer_example_eng") or "").strip()
         if ideal_ru or ideal_en:
             st.markdown("<div class='qa-section'><div class='qa-section-title'>Ideal answer:</div></div>", unsafe_allow_html=True)
+            reused_from = item.get("reused_from")
+            if isinstance(reused_from, dict):
+                st.caption(
+                    f"Reused from \"{reused_from.get('question') or ''}\" "
+                    f"({reused_from.get('source') or 'unknown file'}, similarity {reused_from.get('similarity')}). "
+                    "Select the item under Deep dive to replace it with a generated answer."
+                )
             st.markdown("<div class='qa-label'>RU:</div>", unsafe_allow_html=True)
             st.markdown(f"<div class='qa-quote'>{_escape_with_breaks(ideal_ru or '--')}</div>", unsafe_allow_html=True)
             st.markdown("<div class='qa-label'>EN:</div>", unsafe_allow_html=True)
@@ -545,28 +486,192 @@ def _render_qa_json_structured(qa_json: dict[str, Any]) -> None:
         st.markdown("</div>", unsafe_allow_html=True)
 
 
-model_columns = st.columns(len(MODEL_CARDS), gap="large")
-for column, card in zip(model_columns, MODEL_CARDS):
-    with column:
-        st.markdown(render_card(card), unsafe_allow_html=True)
 
-st.subheader("Transcripts")
-transcript_files = st.file_uploader(
-    "Transcript TXT files",
-    type=["txt"],
-    accept_multiple_files=True,
-)
-transcript_path_input = st.text_input(
-    "Or path to a transcript file/folder",
-    value="",
-)
+def _read_markdown(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        return path.read_text(encoding="cp1251")
 
-st.markdown(
-    "**Extraction stages:**\n"
-    + "\n".join(f"- {stage}" for stage in QA_PROGRESS_STAGES)
-)
 
-if st.button("Extract QA"):
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+# Cached helpers: the mtime arguments are part of the cache key, so entries
+# are invalidated as soon as a file is added, replaced or rewritten.
+@st.cache_data(show_spinner=False)
+def _model_cards_html(speed_ratings: tuple[tuple[str, str], ...] = ()) -> list[str]:
+    return [render_card(card) for card in apply_speed_ratings(MODEL_CARDS, dict(speed_ratings))]
+
+
+@st.cache_data(show_spinner=False)
+def _measured_speed_ratings(history_mtime: float) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted(measured_speed_ratings(QA_OUTPUT_DIR).items()))
+
+
+@st.cache_data(show_spinner=False)
+def _list_outputs(directory: str, pattern: str, directory_mtime: float) -> list[Path]:
+    return sorted(Path(directory).glob(pattern), key=_mtime, reverse=True)
+
+
+@st.cache_data(show_spinner=False)
+def _load_json(path: str, file_mtime: float) -> dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _saved_outputs(pattern: str) -> list[Path]:
+    if not QA_OUTPUT_DIR.exists():
+        return []
+    return _list_outputs(str(QA_OUTPUT_DIR), pattern, _mtime(QA_OUTPUT_DIR))
+
+
+@st.fragment
+def _render_model_comparison(settings: dict[str, Any]) -> None:
+    st.markdown("<div class='section-title'>Model comparison</div>", unsafe_allow_html=True)
+    measured = st.checkbox(
+        "Speed from measured runs",
+        value=False,
+        help="Replace the static speed ratings with ratings from comparison runs below.",
+    )
+    speed_ratings = _measured_speed_ratings(_mtime(history_path(QA_OUTPUT_DIR))) if measured else ()
+    model_columns = st.columns(len(MODEL_CARDS), gap="large")
+    for column, card_html in zip(model_columns, _model_cards_html(speed_ratings)):
+        with column:
+            st.markdown(card_html, unsafe_allow_html=True)
+
+    with st.expander("Compare models on a transcript"):
+        compare_selection = st.multiselect("Models", COMPARE_MODELS, default=list(COMPARE_MODELS))
+        compare_file = st.file_uploader("Transcript TXT file", type=["txt"], key="compare_transcript")
+        if st.button("Run comparison", disabled=not compare_selection or compare_file is None):
+            resume_file = settings["resume_file"]
+            resume_text = (
+                _resume_text(resume_file.getvalue(), Path(resume_file.name).suffix)
+                if resume_file is not None
+                else None
+            )
+            queue_note = st.empty()
+            with st.spinner(f"Running {len(compare_selection)} models concurrently..."):
+                st.session_state["model_comparison_rows"] = _run_queued(
+                    compare_models,
+                    on_wait=lambda position, stats: queue_note.caption(_queue_caption(position, stats)),
+                    on_poll=queue_note.empty,
+                    transcript_text=read_text_stream(compare_file),
+                    models=compare_selection,
+                    output_dir=QA_OUTPUT_DIR,
+                    name=Path(compare_file.name).stem,
+                    resume_text=resume_text,
+                    vacancy=settings["vacancy"] or None,
+                    language=settings["language"],
+                    pipeline=settings["pipeline"],
+                    schema=settings["schema"],
+                    llm_client=_llm_client(settings["hedge"]),
+                )
+        rows = st.session_state.get("model_comparison_rows")
+        if rows:
+            st.dataframe(
+                [{key: value for key, value in row.items() if key not in ("output", "transcript_chars")} for row in rows],
+                use_container_width=True,
+            )
+
+
+# Process-wide resources shared by every session: one LLM client (and
+# connection pool) per hedging mode, and one executor that caps how many
+# extractions run at once across sessions and starts them round-robin per
+# session.
+@st.cache_resource(show_spinner=False)
+def _llm_client(hedge: bool) -> LLMClient:
+    # With hedging, its counters and rate cap cover every session (latency
+    # history is process-wide anyway).
+    return LLMClient(hedge_policy=HedgePolicy() if hedge else None)
+
+
+@st.cache_resource(show_spinner=False)
+def _extraction_executor() -> FairExecutor:
+    return FairExecutor(MAX_CONCURRENT_EXTRACTIONS, thread_name_prefix="qa-extraction")
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _resume_text(data: bytes, suffix: str) -> str:
+    # Keyed by content, so sessions uploading the same resume parse it once.
+    return extract_resume_text_from_bytes(data, suffix)
+
+
+def _session_id() -> str:
+    if "session_id" not in st.session_state:
+        st.session_state["session_id"] = uuid.uuid4().hex
+    return st.session_state["session_id"]
+
+
+def _run_queued(
+    fn: Callable[..., Any],
+    /,
+    *,
+    on_wait: Callable[[int, dict[str, int]], None],
+    on_poll: Callable[[], None] | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Run ``fn(**kwargs)`` on the shared executor and wait for the result.
+
+    ``on_wait(position, stats)`` is called while the task is queued and
+    ``on_poll()`` while it runs. Elements can only be updated from the
+    script thread, so progress reported by ``fn`` is rendered from here.
+    """
+    executor = _extraction_executor()
+    future = executor.submit(_session_id(), fn, **kwargs)
+    while True:
+        try:
+            return future.result(timeout=QUEUE_POLL_SECONDS)
+        except FutureTimeoutError:
+            position = executor.queue_position(future)
+            if position is not None:
+                on_wait(position, executor.stats())
+            elif on_poll is not None:
+                on_poll()
+
+
+def _queue_caption(position: int, stats: dict[str, int]) -> str:
+    return (
+        f"Waiting in the shared queue: position {position} "
+        f"({stats['running']} of {stats['max_workers']} extraction slots busy)."
+    )
+
+
+@st.fragment
+def _render_extraction_panel(settings: dict[str, Any]) -> None:
+    model = settings["model"]
+    pipeline = settings["pipeline"]
+    schema = settings["schema"]
+    language = settings["language"]
+    vacancy = settings["vacancy"]
+    resume_file = settings["resume_file"]
+    llm_client = _llm_client(settings["hedge"])
+
+    st.subheader("Transcripts")
+    notice = st.session_state.pop("qa_extraction_notice", None)
+    if notice:
+        st.success(notice)
+    transcript_files = st.file_uploader(
+        "Transcript TXT files",
+        type=["txt"],
+        accept_multiple_files=True,
+    )
+    transcript_path_input = st.text_input(
+        "Or path to a transcript file/folder",
+        value="",
+    )
+
+    st.markdown(
+        "**Extraction stages:**\n"
+        + "\n".join(f"- {stage}" for stage in QA_PROGRESS_STAGES)
+    )
+
+    if not st.button("Extract QA"):
+        return
+
     stage_text = st.empty()
     stage_list = st.empty()
     progress_bar = st.progress(0, text="Preparing QA extraction...")
@@ -597,8 +702,38 @@ if st.button("Extract QA"):
         stage_text.caption(stage_label)
         stage_list.markdown(_render_stage_list(stage_index))
 
-    def stage_callback(stage_label: str, detail: str = "") -> None:
-        set_stage(stage_label, detail)
+    def run_queued(fn: Callable[..., Any], name: str, *, stages: bool = True, **kwargs: Any) -> Any:
+        # The worker thread only records its stage; it is rendered on each poll.
+        latest: dict[str, str] = {}
+
+        def on_wait(position: int, stats: dict[str, int]) -> None:
+            progress_bar.progress(0, text=f"{name}: queued (position {position})")
+            stage_text.caption(_queue_caption(position, stats))
+
+        def on_poll() -> None:
+            if "stage" in latest:
+                set_stage(latest["stage"], name)
+
+        def record_stage(stage_label: str, *_: Any) -> None:
+            latest["stage"] = stage_label
+
+        if stages:
+            kwargs["stage_callback"] = record_stage
+        return _run_queued(fn, on_wait=on_wait, on_poll=on_poll, **kwargs)
+
+    def finish() -> None:
+        # The saved-output and usage sections are separate fragments; a full
+        # rerun refreshes them, and the notice survives it via session state.
+        progress_bar.progress(100, text="Done")
+        notice = f"Done. QA saved to {QA_OUTPUT_DIR}."
+        if settings["hedge"]:
+            stats = llm_client.hedge_stats.snapshot()
+            notice += (
+                f" Hedged {stats['hedged']} of {stats['calls']} calls ({stats['hedge_rate']:.0%}), "
+                f"extra tokens: {stats['extra_input_tokens'] + stats['extra_output_tokens']}."
+            )
+        st.session_state["qa_extraction_notice"] = notice
+        st.rerun()
 
     set_stage(0)
     QA_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -607,17 +742,28 @@ if st.button("Extract QA"):
         st.warning("Upload files or provide a path.")
         progress_bar.progress(0, text="Transcripts are required to start.")
         stage_text.empty()
-        st.stop()
+        return
 
     resume_text: str | None = None
     set_stage(1)
     if resume_file is not None:
-        resume_text = extract_resume_text_from_bytes(
-            resume_file.getvalue(),
-            Path(resume_file.name).suffix,
-        )
+        resume_text = _resume_text(resume_file.getvalue(), Path(resume_file.name).suffix)
     else:
         stage_text.caption("Skipping resume extraction - no resume uploaded.")
+    resume_summary = None
+    if settings["condense_resume"] and resume_text:
+        stage_text.caption("Condensing resume (cached per resume)...")
+        if load_resume_summary(QA_OUTPUT_DIR, resume_hash(resume_text)) is not None:
+            resume_text, resume_summary = condense_resume(resume_text, output_dir=QA_OUTPUT_DIR)
+        else:
+            resume_text, resume_summary = run_queued(
+                condense_resume,
+                "resume",
+                stages=False,
+                resume_text=resume_text,
+                output_dir=QA_OUTPUT_DIR,
+                llm_client=llm_client,
+            )
 
     if transcript_files:
         set_stage(2, f"files: {len(transcript_files)}")
@@ -626,11 +772,14 @@ if st.button("Extract QA"):
             file_progress = st.progress(0, text="Preparing transcripts...")
         for index, transcript in enumerate(transcript_files, start=1):
             set_stage(2, transcript.name)
-            transcript_text = transcript.getvalue().decode("utf-8", errors="ignore").strip()
+            # Decodes the upload in chunks and closes it, so its buffer is
+            # released before the next file is read.
+            transcript_text = read_text_stream(transcript)
             if not transcript_text:
                 continue
-            file_stage_callback = lambda label, name=transcript.name: stage_callback(label, name)
-            run_qa_extraction(
+            run_queued(
+                run_qa_extraction,
+                transcript.name,
                 transcript_text=transcript_text,
                 resume_text=resume_text,
                 model=model,
@@ -638,31 +787,36 @@ if st.button("Extract QA"):
                 language=language,
                 output_dir=QA_OUTPUT_DIR,
                 output_name=f"{Path(transcript.name).stem}_qa.json",
-                stage_callback=file_stage_callback,
+                pipeline=pipeline,
+                schema=schema,
+                resume_summary=resume_summary,
+                llm_client=llm_client,
             )
             if file_progress is not None:
                 file_progress.progress(
                     min(100, int(index / len(transcript_files) * 100)),
                     text=f"Processed: {transcript.name}",
                 )
-        progress_bar.progress(100, text="Done")
-        st.success(f"Done. QA saved to {QA_OUTPUT_DIR}.")
+        finish()
     elif transcript_path_input:
         input_path = Path(transcript_path_input)
         if input_path.is_file():
             set_stage(2, input_path.name)
-            file_stage_callback = lambda label, name=input_path.name: stage_callback(label, name)
-            run_qa_extraction_for_file(
+            run_queued(
+                run_qa_extraction_for_file,
+                input_path.name,
                 transcript_path=input_path,
                 resume_text=resume_text,
                 model=model,
                 vacancy=vacancy or None,
                 language=language,
                 output_dir=QA_OUTPUT_DIR,
-                stage_callback=file_stage_callback,
+                pipeline=pipeline,
+                schema=schema,
+                resume_summary=resume_summary,
+                llm_client=llm_client,
             )
-            progress_bar.progress(100, text="Done")
-            st.success(f"Done. QA saved to {QA_OUTPUT_DIR}.")
+            finish()
         elif input_path.is_dir():
             transcript_paths = sorted(input_path.glob("*.txt"))
             if not transcript_paths:
@@ -674,15 +828,19 @@ if st.button("Extract QA"):
                     file_progress = st.progress(0, text="Preparing transcripts...")
                 for index, transcript_path in enumerate(transcript_paths, start=1):
                     set_stage(2, transcript_path.name)
-                    file_stage_callback = lambda label, name=transcript_path.name: stage_callback(label, name)
-                    run_qa_extraction_for_file(
+                    run_queued(
+                        run_qa_extraction_for_file,
+                        transcript_path.name,
                         transcript_path=transcript_path,
                         resume_text=resume_text,
                         model=model,
                         vacancy=vacancy or None,
                         language=language,
                         output_dir=QA_OUTPUT_DIR,
-                        stage_callback=file_stage_callback,
+                        pipeline=pipeline,
+                        schema=schema,
+                        resume_summary=resume_summary,
+                        llm_client=llm_client,
                     )
                     if file_progress is not None:
                         file_progress.progress(
@@ -692,102 +850,193 @@ if st.button("Extract QA"):
                             ),
                             text=f"Processed: {transcript_path.name}",
                         )
-                progress_bar.progress(100, text="Done")
-                st.success(f"Done. QA saved to {QA_OUTPUT_DIR}.")
+                finish()
         else:
             st.warning("Path not found.")
 
-st.divider()
-st.subheader("Saved QA outputs")
-if not QA_OUTPUT_DIR.exists():
-    st.info("No QA JSON files yet.")
-else:
-    qa_files = sorted(
-        QA_OUTPUT_DIR.glob("*.json"),
-        key=lambda path: path.stat().st_mtime,
-        reverse=True,
-    )
+
+def _render_usage_summary(usage_path: Path) -> None:
+    try:
+        usage_payload = _load_json(str(usage_path), _mtime(usage_path))
+    except (json.JSONDecodeError, OSError) as exc:
+        st.error(f"Failed to read {usage_path.name}: {exc}")
+        return
+    usage = usage_payload.get("usage") if isinstance(usage_payload, dict) else {}
+    summary = extract_usage_numbers(usage)
+    if summary:
+        st.markdown("**Token usage:**")
+        labels = [
+            ("total_tokens", "Total"),
+            ("input_tokens", "Input"),
+            ("output_tokens", "Output"),
+            ("cached_input_tokens", "Cached input"),
+            ("reasoning_tokens", "Reasoning"),
+        ]
+        metrics = [(key, label) for key, label in labels if key in summary]
+        columns = st.columns(len(metrics))
+        for column, (key, label) in zip(columns, metrics):
+            column.metric(label, summary[key])
+    routing = usage_payload.get("routing") if isinstance(usage_payload, dict) else None
+    if isinstance(routing, dict) and routing.get("served_by"):
+        routing_note = f"Routed ({routing.get('mode', 'single')}): served by **{routing['served_by']}**"
+        if "tier" in routing:
+            routing_note += f" (tier {routing['tier'] + 1})"
+        if routing.get("escalated"):
+            reasons = [
+                problem
+                for attempt in routing.get("attempts") or []
+                for problem in attempt.get("problems") or []
+            ]
+            routing_note += f", escalated: {'; '.join(reasons)}"
+        st.caption(routing_note)
+    if isinstance(usage_payload, dict):
+        schema = schema_of_payload(usage_payload)
+        if schema != SCHEMA_FULL:
+            st.caption(f"Output schema: **{schema}** ({SCHEMA_DESCRIPTIONS[schema]}).")
+
+
+@st.fragment
+def _render_saved_outputs(model: str) -> None:
+    st.subheader("Saved QA outputs")
+    # Segment indexes written before _segments/ still sit next to the outputs.
+    qa_files = [path for path in _saved_outputs("*.json") if not path.name.endswith(SEGMENTS_SUFFIX)]
     if not qa_files:
         st.info("No QA JSON files yet.")
-    else:
-        selected_file = st.selectbox(
-            "Select a QA JSON file",
-            qa_files,
-            format_func=lambda path: path.name,
+        return
+
+    selected_file = st.selectbox(
+        "Select a QA JSON file",
+        qa_files,
+        format_func=lambda path: path.name,
+    )
+    if not selected_file:
+        return
+    try:
+        qa_data = _load_json(str(selected_file), _mtime(selected_file))
+    except (json.JSONDecodeError, OSError) as exc:
+        st.error(f"Failed to read {selected_file.name}: {exc}")
+        return
+
+    usage_path = selected_file.with_suffix(".usage.json")
+    if usage_path.exists():
+        _render_usage_summary(usage_path)
+    pending_items = pending_deep_dive_items(qa_data)
+    if pending_items:
+        qa_items = qa_data.get("items") or []
+        deep_dive_selection = st.multiselect(
+            "Deep dive (generate fixes and ideal answers)",
+            pending_items,
+            format_func=lambda index: f"Q{index + 1}. {qa_items[index].get('question') or ''}"
+            + (" (reused answer)" if qa_items[index].get("reused_from") else ""),
         )
-        if selected_file:
-            try:
-                qa_data = json.loads(selected_file.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError) as exc:
-                st.error(f"Failed to read {selected_file.name}: {exc}")
-            else:
-                usage_path = selected_file.with_suffix(".usage.json")
-                if usage_path.exists():
-                    try:
-                        usage_payload = json.loads(usage_path.read_text(encoding="utf-8"))
-                    except (json.JSONDecodeError, OSError) as exc:
-                        st.error(f"Failed to read {usage_path.name}: {exc}")
-                    else:
-                        usage = usage_payload.get("usage") if isinstance(usage_payload, dict) else {}
-                        summary = _extract_usage_numbers(usage)
-                        if summary:
-                            st.markdown("**Token usage:**")
-                            labels = [
-                                ("total_tokens", "Total"),
-                                ("input_tokens", "Input"),
-                                ("output_tokens", "Output"),
-                                ("cached_input_tokens", "Cached input"),
-                                ("reasoning_tokens", "Reasoning"),
-                            ]
-                            metrics = [(key, label) for key, label in labels if key in summary]
-                            columns = st.columns(len(metrics))
-                            for column, (key, label) in zip(columns, metrics):
-                                column.metric(label, summary[key])
-                show_markdown = st.checkbox(
-                    "Render as markdown",
-                    value=False,
-                    help="Use the markdown exporter instead of the structured UI renderer.",
+        if st.button("Deep dive selected", disabled=not deep_dive_selection):
+            queue_note = st.empty()
+            with st.spinner("Generating details..."):
+                qa_data = _run_queued(
+                    deep_dive_items,
+                    on_wait=lambda position, stats: queue_note.caption(_queue_caption(position, stats)),
+                    on_poll=queue_note.empty,
+                    json_path=selected_file,
+                    item_indexes=deep_dive_selection,
+                    model=model,
+                    llm_client=_llm_client(False),
                 )
-                if show_markdown:
-                    st.markdown(qa_json_to_markdown(qa_data))
-                else:
-                    _render_qa_json_structured(qa_data)
+    show_markdown = st.checkbox(
+        "Render as markdown",
+        value=False,
+        help="Use the markdown exporter instead of the structured UI renderer.",
+    )
+    if show_markdown:
+        st.markdown(qa_json_to_markdown(qa_data))
+    else:
+        _render_qa_json_structured(qa_data)
+
+
+@st.fragment
+def _render_usage_and_cost() -> None:
+    st.subheader("Usage and cost")
+    usage_rollup = load_rollup(QA_OUTPUT_DIR)
+    rollup_summary = rollup_totals(usage_rollup)
+    if not rollup_summary.get("runs"):
+        st.info("No usage recorded yet.")
+        return
+    total_columns = st.columns(5)
+    total_columns[0].metric("Runs", rollup_summary["runs"])
+    total_columns[1].metric("Total tokens", rollup_summary["total_tokens"])
+    total_columns[2].metric("Cached input", f"{rollup_summary['cached_input_ratio'] * 100:.1f}%")
+    total_columns[3].metric("Reasoning tokens", rollup_summary["reasoning_tokens"])
+    total_columns[4].metric("Cost", f"${rollup_summary['cost_usd']:.2f}")
+    rollup_dimension = st.radio(
+        "Group by",
+        ROLLUP_DIMENSIONS,
+        horizontal=True,
+        format_func=lambda dimension: dimension.capitalize(),
+    )
+    st.dataframe(rollup_rows(usage_rollup, rollup_dimension), use_container_width=True)
+    index_summary = hit_rate_summary(load_question_index(QA_OUTPUT_DIR))
+    if index_summary["lookups"]:
+        st.caption(
+            f"Ideal answer reuse: {index_summary['hits']}/{index_summary['lookups']} "
+            f"near-duplicate hits ({index_summary['hit_rate'] * 100:.1f}%), "
+            f"{index_summary['questions']} indexed questions."
+        )
 
-st.divider()
-st.subheader("Markdown viewer")
 
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _corpus(directory: str, directory_mtime: float) -> QACorpus:
+    # Shared read-only across sessions; a new or replaced output changes the
+    # directory mtime and rebuilds it (from _analytics/corpus.json when valid).
+    return build_corpus(directory)
+
+
+@st.fragment
+def _render_corpus_analytics() -> None:
+    st.subheader("Corpus analytics")
+    if not QA_OUTPUT_DIR.exists():
+        st.info("No saved outputs yet.")
+        return
+    corpus = _corpus(str(QA_OUTPUT_DIR), _mtime(QA_OUTPUT_DIR))
+    if not len(corpus):
+        st.info("No saved outputs yet.")
+        return
+    filter_columns = st.columns(3)
+    vacancy_filter = filter_columns[0].selectbox("Vacancy", ["All", *corpus.pools["vacancy"].values])
+    quarter_filter = filter_columns[1].selectbox("Quarter", ["All", *sorted(corpus.pools["quarter"].values, reverse=True)])
+    group = filter_columns[2].selectbox("Group by", GROUP_COLUMNS)
+    keep = corpus.mask(
+        vacancy=None if vacancy_filter == "All" else vacancy_filter,
+        quarter=None if quarter_filter == "All" else quarter_filter,
+    )
+    st.dataframe(corpus.group_by(group, keep=keep), use_container_width=True)
+    st.markdown("**Most frequent errors and problems:**")
+    st.dataframe(corpus.top_errors(keep=keep, limit=15), use_container_width=True)
 
-def _read_markdown(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        return path.read_text(encoding="cp1251")
 
+def _show_markdown(name: str, content: str) -> None:
+    st.markdown(f"### {name}")
+    st.markdown(content)
 
-available_markdowns = []
-if QA_OUTPUT_DIR.exists():
-    available_markdowns = sorted(
-        QA_OUTPUT_DIR.glob("*.md"),
-        key=lambda path: path.stat().st_mtime,
-        reverse=True,
-    )
 
-selected_markdowns = st.multiselect(
-    "Select saved markdowns",
-    available_markdowns,
-    format_func=lambda path: path.name,
-)
-uploaded_markdowns = st.file_uploader(
-    "Upload markdown files",
-    type=["md"],
-    accept_multiple_files=True,
-)
-markdown_path_input = st.text_input(
-    "Or path to a markdown file/folder",
-    value="",
-)
+@st.fragment
+def _render_markdown_viewer() -> None:
+    st.subheader("Markdown viewer")
+    selected_markdowns = st.multiselect(
+        "Select saved markdowns",
+        _saved_outputs("*.md"),
+        format_func=lambda path: path.name,
+    )
+    uploaded_markdowns = st.file_uploader(
+        "Upload markdown files",
+        type=["md"],
+        accept_multiple_files=True,
+    )
+    markdown_path_input = st.text_input(
+        "Or path to a markdown file/folder",
+        value="",
+    )
 
-if st.button("View selected markdowns"):
+    if not st.button("View selected markdowns"):
+        return
     rendered_any = False
 
     for markdown_path in selected_markdowns:
@@ -796,14 +1045,11 @@ if st.button("View selected markdowns"):
         except OSError as exc:
             st.error(f"Failed to read {markdown_path.name}: {exc}")
         else:
-            st.markdown(f"### {markdown_path.name}")
-            st.markdown(content)
+            _show_markdown(markdown_path.name, content)
             rendered_any = True
 
     for markdown_file in uploaded_markdowns or []:
-        content = markdown_file.getvalue().decode("utf-8", errors="ignore")
-        st.markdown(f"### {markdown_file.name}")
-        st.markdown(content)
+        _show_markdown(markdown_file.name, markdown_file.getvalue().decode("utf-8", errors="ignore"))
         rendered_any = True
 
     if markdown_path_input:
@@ -814,8 +1060,7 @@ if st.button("View selected markdowns"):
             except OSError as exc:
                 st.error(f"Failed to read {input_path.name}: {exc}")
             else:
-                st.markdown(f"### {input_path.name}")
-                st.markdown(content)
+                _show_markdown(input_path.name, content)
                 rendered_any = True
         elif input_path.is_dir():
             markdown_paths = sorted(input_path.glob("*.md"))
@@ -827,11 +1072,79 @@ if st.button("View selected markdowns"):
                 except OSError as exc:
                     st.error(f"Failed to read {markdown_path.name}: {exc}")
                 else:
-                    st.markdown(f"### {markdown_path.name}")
-                    st.markdown(content)
+                    _show_markdown(markdown_path.name, content)
                     rendered_any = True
         else:
             st.warning("Path not found or not a markdown file.")
 
     if not rendered_any:
         st.info("No markdowns selected.")
+
+
+# Page layout. Sidebar changes rerun the whole script; every interaction
+# inside a section (buttons, selects, toggles) reruns only that section's
+# fragment.
+st.set_page_config(page_title="Interview Insights (QA only)", page_icon="I", layout="wide")
+st.markdown(APP_CSS, unsafe_allow_html=True)
+st.title("Interview Insights (QA only)")
+st.markdown("<p class='hero-subtitle'>Upload transcripts or provide a path; no transcription step.</p>", unsafe_allow_html=True)
+
+with st.sidebar:
+    st.header("LLM settings")
+    model = st.selectbox("Model", LLM_MODELS, index=0)
+    pipeline = st.selectbox(
+        "Pipeline",
+        PIPELINES,
+        index=0,
+        help="two-phase: cheap segmentation call, then parallel per-question evaluation.",
+    )
+    schema = st.selectbox(
+        "Output schema",
+        SCHEMA_PROFILES,
+        index=SCHEMA_PROFILES.index(SCHEMA_FULL),
+        help="; ".join(f"{name}: {SCHEMA_DESCRIPTIONS[name]}" for name in SCHEMA_PROFILES)
+        + ". Fixes and ideal answers missing from smaller profiles can be generated later with Deep dive.",
+    )
+    hedge = st.checkbox(
+        "Hedge slow requests",
+        value=False,
+        help=(
+            "Send a backup request when a call runs longer than 90% of recent calls to the same model; "
+            "the first answer wins. Costs extra tokens on hedged calls."
+        ),
+    )
+    condense = st.checkbox(
+        "Condense resume",
+        value=False,
+        help=(
+            "Send a compact summary of long resumes instead of the full text. "
+            "The summary is made once per resume and cached."
+        ),
+    )
+    language = st.text_input("Answer language", value="ru")
+    vacancy = st.text_input("Vacancy name", value="")
+    resume_file = st.file_uploader(
+        "Resume (pdf/txt/md, optional)",
+        type=["pdf", "txt", "md"],
+    )
+
+settings = {
+    "model": model,
+    "pipeline": pipeline,
+    "schema": schema,
+    "hedge": hedge,
+    "condense_resume": condense,
+    "language": language,
+    "vacancy": vacancy,
+    "resume_file": resume_file,
+}
+_render_model_comparison(settings)
+_render_extraction_panel(settings)
+st.divider()
+_render_saved_outputs(model)
+st.divider()
+_render_usage_and_cost()
+st.divider()
+_render_corpus_analytics()
+st.divider()
+_render_markdown_viewer()
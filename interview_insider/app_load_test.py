@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+from unittest import mock
+
+from interview_insider.stub_server import StubProfile, StubServer, add_profile_arguments, profile_from_args
+from interview_insider.throughput_bench import percentile, synthetic_transcripts
+
+APP_PATH = Path(__file__).with_name("app.py")
+DEFAULT_SESSIONS = (1, 5, 10, 20)
+DEFAULT_OUTPUTS = 30
+SYNTHETIC_VACANCIES = ("Data Analyst", "ML Engineer", "Backend Developer")
+# Extractions should cost little next to the reruns being measured.
+LOAD_TEST_PROFILE = StubProfile(latency_ms=50, latency_sigma=0.0)
+
+REPORT_COLUMNS = [
+    ("sessions", "Sessions"),
+    ("interaction", "Interaction"),
+    ("runs", "Runs"),
+    ("failed", "Failed"),
+    ("p50_ms", "p50 ms"),
+    ("p95_ms", "p95 ms"),
+    ("max_ms", "Max ms"),
+    ("rss_mb", "RSS MB"),
+]
+
+
+@dataclass
+class _Session:
+    app: Any  # streamlit.testing.v1.AppTest
+    number: int
+    transcript: Path
+
+
+def _widget(at: Any, kind: str, label: str) -> Any:
+    for widget in getattr(at, kind):
+        if widget.label == label:
+            return widget
+    raise LookupError(f"No {kind} labelled {label!r} on the page.")
+
+
+# Each interaction changes one widget of a session and reruns the script;
+# sessions and rounds pick different options.
+def _open(session: _Session, round_: int) -> None:
+    session.app.run()
+
+
+def _select_output(session: _Session, round_: int) -> None:
+    selectbox = _widget(session.app, "selectbox", "Select a QA JSON file")
+    selectbox.select_index((session.number + round_) % len(selectbox.options)).run()
+
+
+def _toggle_markdown(session: _Session, round_: int) -> None:
+    checkbox = _widget(session.app, "checkbox", "Render as markdown")
+    checkbox.set_value(not checkbox.value).run()
+
+
+def _group_usage(session: _Session, round_: int) -> None:
+    radio = _widget(session.app, "radio", "Group by")
+    radio.set_value(radio.options[(session.number + round_) % len(radio.options)]).run()
+
+
+def _filter_analytics(session: _Session, round_: int) -> None:
+    selectbox = _widget(session.app, "selectbox", "Vacancy")
+    selectbox.select_index((session.number + round_) % len(selectbox.options)).run()
+
+
+def _view_markdowns(session: _Session, round_: int) -> None:
+    multiselect = _widget(session.app, "multiselect", "Select saved markdowns")
+    options = multiselect.options
+    multiselect.set_value([options[(session.number + round_) % len(options)]])
+    _widget(session.app, "button", "View selected markdowns").click().run()
+
+
+def _extract(session: _Session, round_: int) -> None:
+    _widget(session.app, "text_input", "Or path to a transcript file/folder").set_value(str(session.transcript))
+    _widget(session.app, "button", "Extract QA").click().run()
+
+
+INTERACTIONS: dict[str, Callable[[_Session, int], None]] = {
+    "open": _open,
+    "select_output": _select_output,
+    "toggle_markdown": _toggle_markdown,
+    "group_usage": _group_usage,
+    "filter_analytics": _filter_analytics,
+    "view_markdowns": _view_markdowns,
+    "extract": _extract,
+}
+
+
+def synthetic_outputs(directory: Path, count: int, *, base_url: str, chars: int = 6_000) -> None:
+    """Fill ``directory`` with ``count`` saved extractions made against a stub server.
+
+    The outputs go through the normal pipeline, so the QA JSON, Markdown,
+    ``.usage.json``, rollup and question index are what a real folder holds.
+    """
+    from openai import OpenAI
+
+    from interview_insider.llm_client import LLMClient
+    from interview_insider.qa_extractor import run_qa_extraction_for_file
+
+    llm_client = LLMClient(client=OpenAI(base_url=base_url, api_key="stub", max_retries=0))
+    for number, transcript_path in enumerate(synthetic_transcripts(directory.parent / "corpus", count, chars)):
+        run_qa_extraction_for_file(
+            transcript_path=transcript_path,
+            resume_text=None,
+            model="o4-mini",
+            vacancy=SYNTHETIC_VACANCIES[number % len(SYNTHETIC_VACANCIES)],
+            language="ru",
+            output_dir=directory,
+            llm_client=llm_client,
+        )
+
+
+def _rss_mb() -> float | None:
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return round(pages * os.sysconf("SC_PAGE_SIZE") / 2**20, 1)
+
+
+def _stats(sessions: int, interaction: str, timings: list[float], failed: int) -> dict[str, Any]:
+    row: dict[str, Any] = {"sessions": sessions, "interaction": interaction, "runs": len(timings), "failed": failed}
+    for name, fraction in (("p50_ms", 0.5), ("p95_ms", 0.95), ("max_ms", 1.0)):
+        value = percentile(timings, fraction)
+        row[name] = round(value * 1000, 1) if value is not None else None
+    return row
+
+
+def run_load_test(
+    *,
+    session_counts: list[int] | tuple[int, ...] = DEFAULT_SESSIONS,
+    outputs: int = DEFAULT_OUTPUTS,
+    rounds: int = 2,
+    interactions: list[str] | tuple[str, ...] = tuple(INTERACTIONS),
+    profile: StubProfile | None = None,
+    seed: int | None = None,
+    timeout: float = 120.0,
+    work_dir: str | Path | None = None,
+) -> list[dict[str, Any]]:
+    """Drive ``app.py`` with a growing number of simulated sessions.
+
+    Every session is an ``AppTest`` of the app pointed (via
+    ``INTERVIEW_INSIGHTS_DIR``) at ``outputs`` synthetic saved extractions;
+    extractions go to a ``StubServer`` with ``profile``. Sessions stay
+    connected as the count grows, and each level runs ``rounds`` rounds in
+    which every session performs each of ``interactions`` in turn.
+
+    ``AppTest`` reruns the whole script in this process, one rerun at a
+    time, so the times are server-side script time of full reruns (an upper
+    bound for fragment reruns) and a level's round is what the last of N
+    users clicking at once would wait on a GIL-bound server. All sessions
+    share one data cache, as sessions of one server do. Returns a row per
+    level and interaction plus an ``all`` row with the process RSS.
+    """
+    from streamlit.testing.v1 import AppTest
+    from streamlit.testing.v1 import app_test as app_test_module
+
+    unknown = [name for name in interactions if name not in INTERACTIONS]
+    if unknown:
+        raise ValueError(f"Unsupported interactions: {', '.join(unknown)}. Supported: {', '.join(INTERACTIONS)}")
+    server = StubServer(profile or LOAD_TEST_PROFILE, seed=seed).start()
+    rows = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="app-load-test-", dir=work_dir) as tmp:
+            output_dir = Path(tmp) / "interview_insights"
+            synthetic_outputs(output_dir, outputs, base_url=server.url)
+            transcripts = synthetic_transcripts(Path(tmp) / "transcripts", max(session_counts), 4_000)
+            environment = {
+                "INTERVIEW_INSIGHTS_DIR": str(output_dir),
+                "OPENAI_BASE_URL": server.url,
+                "OPENAI_API_KEY": "stub",
+            }
+            # A fresh AppTest run gets an empty st.cache_data store; a server
+            # keeps one for all sessions.
+            shared_cache = app_test_module.MemoryCacheStorageManager()
+            with mock.patch.dict(os.environ, environment), mock.patch.object(
+                app_test_module, "MemoryCacheStorageManager", return_value=shared_cache
+            ):
+                sessions: list[_Session] = []
+                for count in sorted(session_counts):
+                    while len(sessions) < count:
+                        at = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+                        at.run()
+                        sessions.append(_Session(at, len(sessions), transcripts[len(sessions)]))
+                    timings: dict[str, list[float]] = {name: [] for name in interactions}
+                    failures = dict.fromkeys(interactions, 0)
+                    for round_ in range(rounds):
+                        for name in interactions:
+                            for session in sessions:
+                                started = time.perf_counter()
+                                try:
+                                    INTERACTIONS[name](session, round_)
+                                    failed = bool(session.app.exception)
+                                except Exception:
+                                    failed = True
+                                timings[name].append(time.perf_counter() - started)
+                                failures[name] += failed
+                    for name in interactions:
+                        rows.append(_stats(count, name, timings[name], failures[name]))
+                    gc.collect()
+                    total = _stats(count, "all", [value for values in timings.values() for value in values], sum(failures.values()))
+                    total["rss_mb"] = _rss_mb()
+                    rows.append(total)
+    finally:
+        server.stop()
+    return rows
+
+
+def format_report(rows: list[dict[str, Any]]) -> str:
+    table = [[label for _, label in REPORT_COLUMNS]]
+    for row in rows:
+        table.append(["-" if row.get(key) is None else str(row[key]) for key, _ in REPORT_COLUMNS])
+    widths = [max(len(line[idx]) for line in table) for idx in range(len(REPORT_COLUMNS))]
+    lines = []
+    for line_index, line in enumerate(table):
+        lines.append("  ".join(cell.rjust(width) for cell, width in zip(line, widths)))
+        if line_index == 0:
+            lines.append("  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Load-test the Streamlit app with simulated sessions browsing synthetic outputs and running "
+            "stubbed extractions; reports server time per interaction and process memory as sessions grow."
+        )
+    )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SESSIONS),
+        help=f"Session counts to run (default: {' '.join(map(str, DEFAULT_SESSIONS))}).",
+    )
+    parser.add_argument(
+        "--outputs",
+        type=int,
+        default=DEFAULT_OUTPUTS,
+        help=f"Synthetic saved extractions to browse (default: {DEFAULT_OUTPUTS}).",
+    )
+    parser.add_argument("--rounds", type=int, default=2, help="Rounds of interactions per level (default: 2).")
+    parser.add_argument(
+        "--interactions",
+        nargs="+",
+        default=list(INTERACTIONS),
+        choices=list(INTERACTIONS),
+        help="Interactions every session performs each round (default: all).",
+    )
+    parser.add_argument("--timeout", type=float, default=120.0, help="Timeout of one script run in seconds.")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed of the stub server.")
+    add_profile_arguments(parser, LOAD_TEST_PROFILE)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    args = parser.parse_args()
+
+    rows = run_load_test(
+        session_counts=args.sessions,
+        outputs=args.outputs,
+        rounds=args.rounds,
+        interactions=args.interactions,
+        profile=profile_from_args(args),
+        seed=args.seed,
+        timeout=args.timeout,
+    )
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(rows))
+
+
+__all__ = [
+    "INTERACTIONS",
+    "format_report",
+    "run_load_test",
+    "synthetic_outputs",
+]
+
+
+if __name__ == "__main__":
+    main()
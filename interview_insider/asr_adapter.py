@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import itertools
+import multiprocessing
+import queue
 import sys
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, as_completed
 from pathlib import Path
 from typing import Any
 
+from interview_insider.storage import write_text_atomic
+
 
 SPEECH_TO_TEXT_DIR = Path(__file__).resolve().parent.parent.parent / "speech-to-text"
 
@@ -41,7 +50,238 @@ def run_batch_transcribe(**kwargs: Any) -> None:
     batch_transcribe(**kwargs)
 
 
+RECORDING_SUFFIXES = (".mp3", ".mp4", ".m4a", ".wav", ".webm", ".mkv", ".mov", ".ogg", ".flac")
+
+
+def _timecode(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+
+class WhisperBackend:
+    """Whisper model loaded once per worker process.
+
+    Unlike ``run_batch_transcribe`` this does not go through the
+    speech-to-text submodule: it imports ``whisper`` directly and writes
+    ``[mm:ss] text`` lines itself, so its transcripts may differ in format
+    from the submodule's.
+    """
+
+    def __init__(self, *, model_size: str = "medium", device: str | None = None, language: str | None = None):
+        import whisper  # type: ignore
+
+        self._model = whisper.load_model(model_size, device=device)
+        self._language = language
+
+    def transcribe(self, input_path: Path, output_dir: Path) -> Path:
+        result = self._model.transcribe(str(input_path), language=self._language)
+        lines = [
+            f"[{_timecode(segment['start'])}] {segment['text'].strip()}"
+            for segment in result.get("segments") or []
+        ]
+        output_path = output_dir / f"{input_path.stem}.txt"
+        write_text_atomic(output_path, "\n".join(lines))
+        return output_path
+
+
+class StubBackend:
+    """Writes a fixed transcript; the delays simulate model load and inference."""
+
+    def __init__(self, *, load_seconds: float = 0.0, seconds_per_job: float = 0.0, text: str = "[00:00] stub transcript"):
+        time.sleep(load_seconds)
+        self._seconds_per_job = seconds_per_job
+        self._text = text
+
+    def transcribe(self, input_path: Path, output_dir: Path) -> Path:
+        time.sleep(self._seconds_per_job)
+        output_path = output_dir / f"{input_path.stem}.txt"
+        write_text_atomic(output_path, self._text)
+        return output_path
+
+
+TRANSCRIPTION_BACKENDS = {
+    "stub": StubBackend,
+    "whisper": WhisperBackend,
+}
+
+
+def _worker_main(backend: str, options: dict[str, Any], jobs: Any, results: Any) -> None:
+    try:
+        engine = TRANSCRIPTION_BACKENDS[backend](**options)
+    except BaseException as exc:
+        results.put((None, None, f"{type(exc).__name__}: {exc}"))
+        return
+    results.put((None, "ready", None))
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        job_id, input_path, output_dir = job
+        try:
+            output_path = engine.transcribe(Path(input_path), Path(output_dir))
+        except Exception as exc:
+            results.put((job_id, None, f"{type(exc).__name__}: {exc}"))
+        else:
+            results.put((job_id, str(output_path), None))
+
+
+class TranscriptionWorker:
+    """Long-lived transcription process that loads the model once.
+
+    Jobs are sent over a local multiprocessing queue and processed in
+    submission order; each ``submit`` returns a ``Future`` with the written
+    transcript path. Use as a context manager::
+
+        with TranscriptionWorker("whisper", model_size="medium") as worker:
+            for transcript_path in worker.map(recordings, Path("transcriptions")):
+                ...
+    """
+
+    def __init__(self, backend: str = "whisper", **options: Any) -> None:
+        if backend not in TRANSCRIPTION_BACKENDS:
+            raise ValueError(f"Unknown transcription backend: {backend}")
+        self.backend = backend
+        self.options = options
+        self._ids = itertools.count(1)
+        self._futures: dict[int, Future[Path]] = {}
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._startup_error: str | None = None
+        self._process: Any = None
+
+    def start(self) -> TranscriptionWorker:
+        if self._process is not None:
+            return self
+        context = multiprocessing.get_context("spawn")
+        self._jobs = context.Queue()
+        self._results = context.Queue()
+        self._process = context.Process(
+            target=_worker_main,
+            args=(self.backend, self.options, self._jobs, self._results),
+            name=f"transcription-{self.backend}",
+            daemon=True,
+        )
+        self._process.start()
+        self._receiver = threading.Thread(target=self._receive, name="transcription-results", daemon=True)
+        self._receiver.start()
+        return self
+
+    def _fail_pending(self, message: str) -> None:
+        with self._lock:
+            futures, self._futures = self._futures, {}
+        for future in futures.values():
+            future.set_exception(RuntimeError(message))
+
+    def _receive(self) -> None:
+        while True:
+            try:
+                job_id, output_path, error = self._results.get(timeout=1.0)
+            except queue.Empty:
+                if not self._process.is_alive():
+                    message = f"Transcription worker exited with code {self._process.exitcode}."
+                    if not self._ready.is_set():
+                        self._startup_error = message
+                        self._ready.set()
+                    self._fail_pending(message)
+                    return
+                continue
+            if job_id is None:
+                if output_path == "ready":
+                    self._ready.set()
+                    continue
+                if output_path == "closed":
+                    return
+                self._startup_error = error
+                self._ready.set()
+                self._fail_pending(f"Transcription backend failed to load: {error}")
+                return
+            with self._lock:
+                future = self._futures.pop(job_id, None)
+            if future is None:
+                continue
+            if error:
+                future.set_exception(RuntimeError(error))
+            else:
+                future.set_result(Path(output_path))
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """Block until the model is loaded; raises if loading failed."""
+        self.start()
+        ready = self._ready.wait(timeout)
+        if self._startup_error:
+            raise RuntimeError(f"Transcription backend failed to load: {self._startup_error}")
+        return ready
+
+    def submit(self, input_path: Path, output_dir: Path) -> Future[Path]:
+        self.start()
+        if self._startup_error:
+            raise RuntimeError(f"Transcription backend failed to load: {self._startup_error}")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        future: Future[Path] = Future()
+        job_id = next(self._ids)
+        with self._lock:
+            self._futures[job_id] = future
+        self._jobs.put((job_id, str(input_path), str(output_dir)))
+        if not self._receiver.is_alive():
+            self._fail_pending("Transcription worker is not running.")
+        return future
+
+    def transcribe(self, input_path: Path, output_dir: Path, timeout: float | None = None) -> Path:
+        return self.submit(input_path, output_dir).result(timeout)
+
+    def map(self, input_paths: Iterable[Path], output_dir: Path) -> Iterator[Path]:
+        """Submit all recordings and yield transcript paths as each one finishes.
+
+        A failed recording does not stop the others: once every transcript
+        has been yielded, a ``RuntimeError`` naming the failed recordings is
+        raised, as ``batch_transcribe`` failures are re-raised in batch mode.
+        """
+        futures = {self.submit(input_path, output_dir): Path(input_path) for input_path in input_paths}
+        failures: list[tuple[Path, BaseException]] = []
+        for future in as_completed(futures):
+            try:
+                output_path = future.result()
+            except Exception as exc:
+                failures.append((futures[future], exc))
+                continue
+            yield output_path
+        if failures:
+            details = "; ".join(f"{input_path.name}: {exc}" for input_path, exc in failures)
+            raise RuntimeError(f"{len(failures)} of {len(futures)} recordings failed: {details}") from failures[0][1]
+
+    def close(self, timeout: float | None = 30.0) -> None:
+        """Finish queued jobs and stop the worker process."""
+        if self._process is None:
+            return
+        self._jobs.put(None)
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._results.put((None, "closed", None))
+        self._receiver.join()
+        self._fail_pending("Transcription worker was closed.")
+        self._process = None
+
+    def __enter__(self) -> TranscriptionWorker:
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def collect_recordings(input_dir: Path) -> list[Path]:
+    return sorted(path for path in input_dir.iterdir() if path.suffix.lower() in RECORDING_SUFFIXES)
+
+
 __all__ = [
+    "RECORDING_SUFFIXES",
+    "TRANSCRIPTION_BACKENDS",
+    "StubBackend",
+    "TranscriptionWorker",
+    "WhisperBackend",
     "add_speech_to_text_to_path",
+    "collect_recordings",
     "run_batch_transcribe",
 ]
\ No newline at end of file
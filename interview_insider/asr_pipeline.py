@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import argparse
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from interview_insider.asr_adapter import (
+    TRANSCRIPTION_BACKENDS,
+    TranscriptionWorker,
+    collect_recordings,
+    run_batch_transcribe,
+)
+from interview_insider.llm_client import AUTO_MODEL
+from interview_insider.qa_extractor import (
+    PIPELINE_SINGLE,
+    PIPELINES,
+    extract_resume_text_from_file,
+    run_qa_extraction_for_file,
+)
+from interview_insider.schema_profiles import SCHEMA_PROFILES
+
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_QUEUE_SIZE = 2
+DEFAULT_WORKERS = 2
+
+_DONE = object()
+
+
+def watch_batch_transcribe(
+    *,
+    input_dir: Path,
+    output_dir: Path,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    pattern: str = "*.txt",
+    transcribe: Callable[..., Any] = run_batch_transcribe,
+    **kwargs: Any,
+) -> Iterator[Path]:
+    """Run a batch transcription in the background and yield transcripts as they finish.
+
+    ``batch_transcribe`` only reports completion for the whole batch, so
+    per-file completion events are derived from ``output_dir``: a new file
+    matching ``pattern`` is yielded once its size and mtime are unchanged for
+    one ``poll_interval`` (or when the batch has ended). Files present before
+    the batch started are ignored. ``transcribe`` can be replaced by a stub
+    that writes transcripts itself. An exception raised by the batch is
+    re-raised after the remaining transcripts have been yielded.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    seen = set(output_dir.glob(pattern))
+    signatures: dict[Path, tuple[int, int]] = {}
+    errors: list[BaseException] = []
+
+    def _run() -> None:
+        try:
+            transcribe(input_dir=input_dir, output_dir=output_dir, **kwargs)
+        except BaseException as exc:  # re-raised in the consumer thread
+            errors.append(exc)
+
+    thread = threading.Thread(target=_run, name="batch-transcribe", daemon=True)
+    thread.start()
+    while True:
+        finished = not thread.is_alive()
+        for path in sorted(output_dir.glob(pattern)):
+            if path in seen:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if finished or signatures.get(path) == signature:
+                seen.add(path)
+                yield path
+            else:
+                signatures[path] = signature
+        if finished:
+            break
+        thread.join(poll_interval)
+    if errors:
+        raise errors[0]
+
+
+def run_pipeline(
+    transcripts: Iterable[Path],
+    *,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    workers: int = DEFAULT_WORKERS,
+    extract: Callable[..., Path] = run_qa_extraction_for_file,
+    on_result: Callable[[Path, Path | BaseException], None] | None = None,
+    **kwargs: Any,
+) -> list[tuple[Path, Path | BaseException]]:
+    """Extract QA from transcripts while the transcriber is still producing them.
+
+    ``transcripts`` is consumed in the calling thread and each finished
+    transcript is handed to ``workers`` extraction threads through a queue
+    of at most ``queue_size`` entries; when extraction falls behind, the
+    queue blocks the transcriber side instead of piling up work. ``kwargs``
+    are passed to ``extract`` (``run_qa_extraction_for_file`` by default).
+    Results are returned in completion order; failed extractions are
+    returned as exceptions instead of stopping the pipeline.
+    """
+    pending: queue.Queue[Any] = queue.Queue(maxsize=max(1, queue_size))
+    results: list[tuple[Path, Path | BaseException]] = []
+    results_lock = threading.Lock()
+
+    def _worker() -> None:
+        while True:
+            transcript_path = pending.get()
+            if transcript_path is _DONE:
+                return
+            try:
+                result: Path | BaseException = extract(transcript_path=transcript_path, **kwargs)
+            except Exception as exc:
+                result = exc
+            with results_lock:
+                results.append((transcript_path, result))
+            if on_result is not None:
+                on_result(transcript_path, result)
+
+    threads = [
+        threading.Thread(target=_worker, name=f"qa-extract-{index}", daemon=True)
+        for index in range(max(1, workers))
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for transcript_path in transcripts:
+            pending.put(transcript_path)
+    finally:
+        for _ in threads:
+            pending.put(_DONE)
+        for thread in threads:
+            thread.join()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Transcribe recordings with the speech-to-text submodule and extract QA "
+            "from each transcript as soon as it is ready."
+        )
+    )
+    parser.add_argument(
+        "--input-dir",
+        type=Path,
+        required=True,
+        help="Directory with recordings for batch_transcribe.",
+    )
+    parser.add_argument(
+        "--transcripts-dir",
+        type=Path,
+        default=Path("transcriptions"),
+        help="Directory batch_transcribe writes transcripts to (default: transcriptions).",
+    )
+    parser.add_argument(
+        "--backend",
+        default="batch",
+        choices=["batch", *TRANSCRIPTION_BACKENDS],
+        help=(
+            "batch: run the submodule's batch_transcribe; whisper/stub: one warm worker "
+            "process that loads the model once (default: batch)."
+        ),
+    )
+    parser.add_argument(
+        "--model-size",
+        default="medium",
+        help="Whisper model size passed to batch_transcribe (default: medium).",
+    )
+    parser.add_argument(
+        "--model",
+        required=True,
+        choices=["5.2", "4.1", "o4-mini", "o3", AUTO_MODEL],
+        help="LLM model alias.",
+    )
+    parser.add_argument(
+        "--vacancy",
+        default=None,
+        help="Vacancy or position name.",
+    )
+    parser.add_argument(
+        "--resume",
+        type=Path,
+        default=None,
+        help="Path to resume file (.pdf/.txt/.md).",
+    )
+    parser.add_argument(
+        "--language",
+        default="ru",
+        help="Language for the output (default: ru).",
+    )
+    parser.add_argument(
+        "--pipeline",
+        default=PIPELINE_SINGLE,
+        choices=PIPELINES,
+        help="Extraction pipeline (default: single).",
+    )
+    parser.add_argument(
+        "--lite",
+        action="store_true",
+        help="Skip what_to_fix and ideal answers (see interview_insider.deep_dive).",
+    )
+    parser.add_argument(
+        "--schema",
+        default=None,
+        choices=SCHEMA_PROFILES,
+        help="Output schema profile: minimal, standard (same as --lite) or full (default).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="interview_insider/interview_insights",
+        help="Directory for QA JSON outputs.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Concurrent extractions (default: {DEFAULT_WORKERS}).",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help=f"Finished transcripts waiting for extraction before ASR is throttled (default: {DEFAULT_QUEUE_SIZE}).",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f"Seconds between checks for finished transcripts (default: {DEFAULT_POLL_INTERVAL}).",
+    )
+    args = parser.parse_args()
+    if args.lite and args.schema:
+        parser.error("--lite is the same as --schema standard; pass only one of them")
+
+    started = time.monotonic()
+
+    def _report(transcript_path: Path, result: Path | BaseException) -> None:
+        elapsed = time.monotonic() - started
+        if isinstance(result, BaseException):
+            print(f"[{elapsed:7.1f}s] Failed: {transcript_path.name}: {result}")
+        else:
+            print(f"[{elapsed:7.1f}s] {transcript_path.name} -> {result}")
+
+    extraction_kwargs = {
+        "resume_text": extract_resume_text_from_file(args.resume),
+        "model": args.model,
+        "vacancy": args.vacancy,
+        "language": args.language,
+        "output_dir": args.output_dir,
+        "pipeline": args.pipeline,
+        "lite": args.lite,
+        "schema": args.schema,
+    }
+    if args.backend == "batch":
+        results = run_pipeline(
+            watch_batch_transcribe(
+                input_dir=args.input_dir,
+                output_dir=args.transcripts_dir,
+                poll_interval=args.poll_interval,
+                model_size=args.model_size,
+            ),
+            queue_size=args.queue_size,
+            workers=args.workers,
+            on_result=_report,
+            **extraction_kwargs,
+        )
+    else:
+        options = {"model_size": args.model_size} if args.backend == "whisper" else {}
+        with TranscriptionWorker(args.backend, **options) as worker:
+            results = run_pipeline(
+                worker.map(collect_recordings(args.input_dir), args.transcripts_dir),
+                queue_size=args.queue_size,
+                workers=args.workers,
+                on_result=_report,
+                **extraction_kwargs,
+            )
+    if any(isinstance(result, BaseException) for _, result in results):
+        raise SystemExit(1)
+
+
+__all__ = [
+    "DEFAULT_POLL_INTERVAL",
+    "DEFAULT_QUEUE_SIZE",
+    "DEFAULT_WORKERS",
+    "run_pipeline",
+    "watch_batch_transcribe",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
+
+BACKENDS_ENV = "INTERVIEW_INSIGHTS_BACKENDS"
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+DEFAULT_HEALTH_INTERVAL_SECONDS = 30.0
+DEFAULT_FAILURE_COOLDOWN_SECONDS = 30.0
+HEALTH_TIMEOUT_SECONDS = 5.0
+DEFAULT_MAX_RETRIES = 2  # the OpenAI SDK default
+
+
+def _hosted_models() -> dict[str, str]:
+    # An endpoint without ``models`` serves the hosted model names.
+    from interview_insider.llm_client import _DEFAULT_MODEL_ALIASES
+
+    return dict(_DEFAULT_MODEL_ALIASES)
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """One OpenAI-compatible server of a ``BackendPool``.
+
+    ``models`` maps the aliases used in this repo (``o4-mini``, ``5.2``...)
+    to the model names the server knows; an endpoint only gets requests for
+    its aliases. ``weight`` scales its share: outstanding requests are
+    compared per unit of weight. The API key is read from ``api_key_env``
+    (local servers that ignore it may leave it unset). ``max_retries`` is
+    passed to the endpoint's client, so a brief 429 or 5xx is retried with
+    the SDK's backoff before the call fails over and the endpoint cools down.
+    """
+
+    name: str
+    base_url: str = OPENAI_BASE_URL
+    api_key_env: str | None = "OPENAI_API_KEY"
+    models: dict[str, str] = field(default_factory=_hosted_models)
+    weight: float = 1.0
+    max_retries: int = DEFAULT_MAX_RETRIES
+    timeout: float | None = None
+
+    def api_key(self) -> str:
+        return (os.environ.get(self.api_key_env) if self.api_key_env else None) or "unused"
+
+    def client_options(self) -> dict[str, Any]:
+        options: dict[str, Any] = {"base_url": self.base_url, "api_key": self.api_key(), "max_retries": self.max_retries}
+        if self.timeout is not None:
+            options["timeout"] = self.timeout
+        return options
+
+
+@dataclass
+class _EndpointState:
+    endpoint: Endpoint
+    outstanding: int = 0
+    requests: int = 0
+    failures: int = 0
+    healthy: bool = True
+    unhealthy_until: float = 0.0
+    last_error: str = ""
+    checked_at: float | None = None
+
+
+def _should_fail_over(exc: BaseException) -> bool:
+    """Connection problems, timeouts, 429s and 5xx are the endpoint's fault; retry elsewhere."""
+    import openai
+
+    if isinstance(exc, (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)):
+        return True
+    return isinstance(exc, openai.APIStatusError) and exc.status_code >= 500
+
+
+class BackendPool:
+    """Spread structured-output calls over several OpenAI-compatible endpoints.
+
+    Each call goes to the endpoint serving the model alias with the fewest
+    outstanding requests (per unit of weight). An endpoint that fails with
+    a connection error, timeout, 429 or 5xx is taken out for
+    ``failure_cooldown_seconds`` once its client's own retries are used up,
+    and the call is retried on the next one;
+    the last error is raised once every endpoint was tried. Background
+    health checks (``GET <base_url>/models``) take failing endpoints out
+    and bring them back. When no endpoint is healthy the least recently
+    failed ones are still tried, so a flapping check does not stop all work.
+    """
+
+    def __init__(
+        self,
+        endpoints: list[Endpoint],
+        *,
+        health_interval_seconds: float = DEFAULT_HEALTH_INTERVAL_SECONDS,
+        failure_cooldown_seconds: float = DEFAULT_FAILURE_COOLDOWN_SECONDS,
+    ) -> None:
+        if not endpoints:
+            raise ValueError("A backend pool needs at least one endpoint.")
+        names = [endpoint.name for endpoint in endpoints]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Endpoint names must be unique: {', '.join(names)}")
+        self._states = [_EndpointState(endpoint) for endpoint in endpoints]
+        self.health_interval_seconds = health_interval_seconds
+        self.failure_cooldown_seconds = failure_cooldown_seconds
+        self._lock = threading.Lock()
+        self._clients: dict[str, OpenAI] = {}
+        # httpx async pools belong to the event loop that opened them.
+        self._async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncOpenAI]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._health_thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> BackendPool:
+        endpoints = []
+        for entry in config.get("endpoints") or []:
+            if not isinstance(entry, dict) or not entry.get("name"):
+                raise ValueError("Every endpoint needs a 'name'.")
+            known = {key: entry[key] for key in Endpoint.__dataclass_fields__ if key in entry}
+            unknown = sorted(set(entry) - set(known))
+            if unknown:
+                raise ValueError(f"Unknown keys for endpoint '{entry['name']}': {', '.join(unknown)}")
+            endpoints.append(Endpoint(**known))
+        return cls(
+            endpoints,
+            health_interval_seconds=float(config.get("health_interval_seconds", DEFAULT_HEALTH_INTERVAL_SECONDS)),
+            failure_cooldown_seconds=float(config.get("failure_cooldown_seconds", DEFAULT_FAILURE_COOLDOWN_SECONDS)),
+        )
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> BackendPool:
+        return cls.from_config(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    @property
+    def endpoints(self) -> list[Endpoint]:
+        return [state.endpoint for state in self._states]
+
+    def models(self) -> list[str]:
+        return sorted({alias for state in self._states for alias in state.endpoint.models})
+
+    def serves(self, model: str) -> bool:
+        return any(model in state.endpoint.models for state in self._states)
+
+    def _acquire(self, model: str, tried: set[str]) -> _EndpointState | None:
+        with self._lock:
+            now = time.monotonic()
+            candidates = [
+                state
+                for state in self._states
+                if model in state.endpoint.models and state.endpoint.name not in tried
+            ]
+            if not candidates:
+                return None
+            available = [state for state in candidates if state.healthy and state.unhealthy_until <= now]
+            if available:
+                state = min(available, key=lambda item: (item.outstanding / item.endpoint.weight, item.requests))
+            else:
+                state = min(candidates, key=lambda item: item.unhealthy_until)
+            state.outstanding += 1
+            state.requests += 1
+            return state
+
+    def _release(self, state: _EndpointState, exc: BaseException | None) -> None:
+        with self._lock:
+            state.outstanding -= 1
+            if exc is not None and _should_fail_over(exc):
+                state.failures += 1
+                state.unhealthy_until = time.monotonic() + self.failure_cooldown_seconds
+                state.last_error = f"{type(exc).__name__}: {exc}"
+
+    def _client(self, endpoint: Endpoint) -> OpenAI:
+        with self._lock:
+            client = self._clients.get(endpoint.name)
+            if client is None:
+                from openai import OpenAI
+
+                client = OpenAI(**endpoint.client_options())
+                self._clients[endpoint.name] = client
+            return client
+
+    def _async_client(self, endpoint: Endpoint) -> AsyncOpenAI:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(endpoint.name)
+            if client is None:
+                from openai import AsyncOpenAI
+
+                client = AsyncOpenAI(**endpoint.client_options())
+                clients[endpoint.name] = client
+            return client
+
+    def _no_endpoint(self, model: str, last_error: BaseException | None) -> Exception:
+        if last_error is not None:
+            return last_error
+        return ValueError(f"No endpoint serves model '{model}'. Served: {', '.join(self.models())}")
+
+    def parse(self, request: dict[str, Any]) -> Any:
+        """``responses.parse(**request)`` on the least busy endpoint, failing over on endpoint errors.
+
+        ``request["model"]`` is an alias; each endpoint gets its own model name.
+        """
+        model = request["model"]
+        tried: set[str] = set()
+        last_error: BaseException | None = None
+        while (state := self._acquire(model, tried)) is not None:
+            endpoint = state.endpoint
+            try:
+                response = self._client(endpoint).responses.parse(**{**request, "model": endpoint.models[model]})
+            except BaseException as exc:
+                self._release(state, exc)
+                if not _should_fail_over(exc):
+                    raise
+                tried.add(endpoint.name)
+                last_error = exc
+                continue
+            self._release(state, None)
+            return response
+        raise self._no_endpoint(model, last_error)
+
+    async def aparse(self, request: dict[str, Any]) -> Any:
+        """Async ``parse``; one client per endpoint and event loop."""
+        model = request["model"]
+        tried: set[str] = set()
+        last_error: BaseException | None = None
+        while (state := self._acquire(model, tried)) is not None:
+            endpoint = state.endpoint
+            try:
+                response = await self._async_client(endpoint).responses.parse(
+                    **{**request, "model": endpoint.models[model]}
+                )
+            except BaseException as exc:
+                self._release(state, exc)
+                if not _should_fail_over(exc):
+                    raise
+                tried.add(endpoint.name)
+                last_error = exc
+                continue
+            self._release(state, None)
+            return response
+        raise self._no_endpoint(model, last_error)
+
+    def check_health(self) -> dict[str, bool]:
+        """Probe every endpoint once and update its health; returns name -> healthy."""
+        from urllib.error import HTTPError
+        from urllib.request import Request, urlopen
+
+        results = {}
+        for state in self._states:
+            endpoint = state.endpoint
+            request = Request(
+                f"{endpoint.base_url.rstrip('/')}/models",
+                headers={"Authorization": f"Bearer {endpoint.api_key()}"},
+            )
+            error = ""
+            try:
+                with urlopen(request, timeout=HEALTH_TIMEOUT_SECONDS) as response:
+                    healthy = 200 <= response.status < 300
+            except HTTPError as exc:
+                healthy, error = False, f"HTTP {exc.code}"
+            except OSError as exc:
+                healthy, error = False, str(getattr(exc, "reason", exc))
+            with self._lock:
+                # A passing probe does not lift a cooldown after failed calls.
+                state.healthy = healthy
+                state.checked_at = time.time()
+                if not healthy:
+                    state.last_error = f"health check: {error}"
+            results[endpoint.name] = healthy
+        return results
+
+    def start_health_checks(self) -> BackendPool:
+        """Check health every ``health_interval_seconds`` on a daemon thread (0 disables)."""
+        if self.health_interval_seconds <= 0 or self._health_thread is not None:
+            return self
+
+        def run() -> None:
+            while True:
+                self.check_health()
+                if self._stop.wait(self.health_interval_seconds):
+                    return
+
+        self._health_thread = threading.Thread(target=run, name="backend-health", daemon=True)
+        self._health_thread.start()
+        return self
+
+    def stop_health_checks(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> list[dict[str, Any]]:
+        with self._lock:
+            now = time.monotonic()
+            return [
+                {
+                    "name": state.endpoint.name,
+                    "base_url": state.endpoint.base_url,
+                    "models": ", ".join(sorted(state.endpoint.models)),
+                    "healthy": state.healthy and state.unhealthy_until <= now,
+                    "outstanding": state.outstanding,
+                    "requests": state.requests,
+                    "failures": state.failures,
+                    "last_error": state.last_error,
+                }
+                for state in self._states
+            ]
+
+
+_DEFAULT_POOL: BackendPool | None = None
+_DEFAULT_POOL_PATH: str | None = None
+_DEFAULT_POOL_LOCK = threading.Lock()
+
+
+def default_backend_pool() -> BackendPool | None:
+    """The pool configured by ``INTERVIEW_INSIGHTS_BACKENDS`` (a JSON file), shared by the process.
+
+    ``None`` when the variable is unset, so clients use the single default
+    OpenAI endpoint.
+    """
+    global _DEFAULT_POOL, _DEFAULT_POOL_PATH
+    path = os.environ.get(BACKENDS_ENV)
+    if not path:
+        return None
+    with _DEFAULT_POOL_LOCK:
+        if _DEFAULT_POOL is None or _DEFAULT_POOL_PATH != path:
+            if _DEFAULT_POOL is not None:
+                _DEFAULT_POOL.stop_health_checks()
+            _DEFAULT_POOL = BackendPool.from_file(path).start_health_checks()
+            _DEFAULT_POOL_PATH = path
+        return _DEFAULT_POOL
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check the endpoints of a backend pool configuration.")
+    parser.add_argument(
+        "--config",
+        default=os.environ.get(BACKENDS_ENV),
+        help=f"Pool configuration JSON (default: ${BACKENDS_ENV}).",
+    )
+    args = parser.parse_args()
+    if not args.config:
+        parser.error(f"--config or {BACKENDS_ENV} is required.")
+
+    pool = BackendPool.from_file(args.config)
+    pool.check_health()
+    for row in pool.stats():
+        status = "up" if row["healthy"] else f"DOWN ({row['last_error']})"
+        print(f"{row['name']:<16} {row['base_url']:<40} {status}")
+        print(f"{'':<16} models: {row['models']}")
+
+
+__all__ = [
+    "BACKENDS_ENV",
+    "BackendPool",
+    "Endpoint",
+    "default_backend_pool",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import argparse
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from interview_insider.llm_client import AUTO_MODEL, DEFAULT_CASCADE_POLICY, LLMClient
+from interview_insider.qa_markdown_exporter import save_markdown_for_qa_json
+from interview_insider.question_index import (
+    REUSABLE_FIELDS,
+    index_ideal_answers,
+    reuse_ideal_answers,
+)
+from interview_insider.storage import write_json_atomic
+from interview_insider.usage_rollup import merge_usage, record_usage, usage_record_from_payload
+
+DEEP_DIVE_FIELDS = ("what_to_fix", "the_ideal_answer_example_eng", "the_ideal_answer_example_ru")
+DEFAULT_DEEP_DIVE_MODEL = "o4-mini"
+DEFAULT_MAX_WORKERS = 4
+
+
+def is_deep_dive_pending(item: dict[str, Any]) -> bool:
+    """Missing deferred fields, or ideal answers reused from another question (which a deep dive replaces)."""
+    return bool(item.get("reused_from")) or any(not str(item.get(field) or "").strip() for field in DEEP_DIVE_FIELDS)
+
+
+def pending_deep_dive_items(qa_json: dict[str, Any]) -> list[int]:
+    """Return 0-based indexes of items still missing ``DEEP_DIVE_FIELDS``."""
+    items = qa_json.get("items") or []
+    return [
+        index
+        for index, item in enumerate(items)
+        if isinstance(item, dict) and is_deep_dive_pending(item)
+    ]
+
+
+def _item_message(item: dict[str, Any]) -> str:
+    errors = "\n".join(f"- {error}" for error in item.get("errors_and_problems") or [])
+    return (
+        f"#QUESTION: {item.get('question') or ''}\n"
+        f"#CANDIDATE ANSWER: {item.get('candidates_answer') or ''}\n"
+        f"#EVALUATION: {item.get('short_candidate_answer_evaluation') or ''}\n"
+        f"#ERRORS:\n{errors or '-'}\n"
+        f"#KEY IDEA: {item.get('key_idea') or ''}"
+    )
+
+
+def deep_dive_items(
+    json_path: Path,
+    item_indexes: list[int],
+    *,
+    model: str = DEFAULT_DEEP_DIVE_MODEL,
+    language: str | None = None,
+    llm_client: LLMClient | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    reuse_answers: bool = False,
+) -> dict[str, Any]:
+    """Generate the deferred fields for selected items and cache them in place.
+
+    Items that already have every deep-dive field are skipped; ideal answers
+    reused from another question (``reused_from``) are rejected and
+    generated for the item itself. With ``reuse_answers`` ideal answers of
+    near-duplicate questions from the question index are reused and only
+    ``what_to_fix`` is generated. The QA JSON
+    and its Markdown are rewritten, and the calls are appended to
+    ``deep_dives`` in the ``.usage.json`` so the usage rollup prices them.
+    """
+    qa_json = json.loads(json_path.read_text(encoding="utf-8"))
+    items = qa_json.get("items") or []
+    usage_path = json_path.with_suffix(".usage.json")
+    usage_payload: dict[str, Any] = {}
+    if usage_path.exists():
+        usage_payload = json.loads(usage_path.read_text(encoding="utf-8"))
+
+    targets = [
+        index
+        for index in dict.fromkeys(item_indexes)
+        if 0 <= index < len(items) and isinstance(items[index], dict) and is_deep_dive_pending(items[index])
+    ]
+    if not targets:
+        return qa_json
+
+    index_vacancy = usage_payload.get("vacancy") or qa_json.get("vacancy")
+    index_language = usage_payload.get("language") or "ru"
+    output_dir = json_path.parent
+    rejected = [index for index in targets if items[index].get("reused_from")]
+    for index in rejected:
+        items[index].pop("reused_from")
+        for field in REUSABLE_FIELDS:
+            items[index][field] = ""
+    if reuse_answers:
+        reuse_ideal_answers(
+            output_dir,
+            [items[index] for index in targets if index not in rejected],
+            vacancy=index_vacancy,
+            language=index_language,
+            source=json_path.name,
+        )
+
+    from interview_insider.prompts.extracton_models_and_prompts import (
+        QAItemDeepDive,
+        QAItemFix,
+        prompt_QA_deep_dive,
+    )
+
+    if model == AUTO_MODEL:
+        model = DEFAULT_CASCADE_POLICY.tiers[0]
+    llm_client = llm_client or LLMClient()
+    system_prompt = prompt_QA_deep_dive.format(
+        vacancy=qa_json.get("vacancy") or usage_payload.get("vacancy") or "unknown",
+        language=language or usage_payload.get("language") or "ru",
+    )
+
+    def _generate(index: int) -> tuple[dict[str, Any], dict[str, Any]]:
+        has_ideal_answers = all(str(items[index].get(field) or "").strip() for field in REUSABLE_FIELDS)
+        details, usage = llm_client.call_structured_llm(
+            system_prompt=system_prompt,
+            user_message=_item_message(items[index]),
+            model=model,
+            response_model=QAItemFix if has_ideal_answers else QAItemDeepDive,
+        )
+        return details.model_dump(), usage
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as executor:
+        results = list(executor.map(_generate, targets))
+
+    total_usage: dict[str, Any] = {}
+    for index, (details, usage) in zip(targets, results):
+        items[index].update(details)
+        total_usage = merge_usage(total_usage, usage)
+
+    index_ideal_answers(
+        output_dir,
+        [items[index] for index in targets],
+        vacancy=index_vacancy,
+        language=index_language,
+        source=json_path.name,
+    )
+
+    write_json_atomic(json_path, qa_json)
+    save_markdown_for_qa_json(qa_json, json_path)
+
+    if not usage_payload:
+        usage_payload = {
+            "usage": {},
+            "model": model,
+            "vacancy": qa_json.get("vacancy"),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+    usage_payload.setdefault("deep_dives", []).append(
+        {
+            "model": model,
+            "items": targets,
+            "usage": total_usage,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+    )
+    write_json_atomic(usage_path, usage_payload)
+    record_usage(output_dir, json_path.name, usage_record_from_payload(usage_payload))
+    return qa_json
+
+
+def _parse_item_numbers(value: str) -> list[int]:
+    indexes = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            indexes.extend(range(int(start) - 1, int(end)))
+        else:
+            indexes.append(int(part) - 1)
+    return indexes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate fixes and ideal answers for selected items of a saved QA JSON."
+    )
+    parser.add_argument(
+        "--qa-json",
+        type=Path,
+        required=True,
+        help="Path to a saved *_qa.json file.",
+    )
+    selection = parser.add_mutually_exclusive_group(required=True)
+    selection.add_argument(
+        "--items",
+        help="Item numbers as shown in the output (Q1, Q2, ...), e.g. '1,3,5-7'.",
+    )
+    selection.add_argument(
+        "--all-pending",
+        action="store_true",
+        help="Deep dive every item that is still missing the deferred fields.",
+    )
+    parser.add_argument(
+        "--model",
+        default=DEFAULT_DEEP_DIVE_MODEL,
+        choices=["5.2", "4.1", "o4-mini", "o3", AUTO_MODEL],
+        help=f"LLM model alias (default: {DEFAULT_DEEP_DIVE_MODEL}).",
+    )
+    parser.add_argument(
+        "--language",
+        default=None,
+        help="Language for what_to_fix (default: the extraction's language).",
+    )
+    parser.add_argument(
+        "--reuse-answers",
+        action="store_true",
+        help="Reuse ideal answers of near-duplicate questions from the question index.",
+    )
+    args = parser.parse_args()
+
+    if not args.qa_json.exists():
+        raise FileNotFoundError(f"QA JSON not found: {args.qa_json}")
+    if args.all_pending:
+        item_indexes = pending_deep_dive_items(json.loads(args.qa_json.read_text(encoding="utf-8")))
+    else:
+        item_indexes = _parse_item_numbers(args.items)
+
+    deep_dive_items(
+        args.qa_json,
+        item_indexes,
+        model=args.model,
+        language=args.language,
+        reuse_answers=args.reuse_answers,
+    )
+
+
+__all__ = [
+    "DEEP_DIVE_FIELDS",
+    "DEFAULT_DEEP_DIVE_MODEL",
+    "deep_dive_items",
+    "is_deep_dive_pending",
+    "pending_deep_dive_items",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Any, Callable
+
+DEFAULT_MAX_WORKERS = 4
+
+_Task = tuple[Future, Callable[..., Any], tuple[Any, ...], dict[str, Any]]
+
+
+class FairExecutor:
+    """Thread pool that starts queued work round-robin across owners.
+
+    An owner is whoever submits (e.g. one app session). At most
+    ``max_workers`` tasks run at once across all owners; when a worker frees
+    up it takes the oldest task of the next owner in turn, so an owner that
+    queued ten files does not hold back one that queued a single file.
+    Worker threads are started on demand and live for the process.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, *, thread_name_prefix: str = "fair-executor") -> None:
+        self.max_workers = max(1, max_workers)
+        self._thread_name_prefix = thread_name_prefix
+        self._queues: OrderedDict[str, deque[_Task]] = OrderedDict()
+        self._threads: list[threading.Thread] = []
+        self._running = 0
+        self._condition = threading.Condition()
+
+    def submit(self, owner: str, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        with self._condition:
+            self._queues.setdefault(owner, deque()).append((future, fn, args, kwargs))
+            if len(self._threads) < self.max_workers and self._running + self._queued() > len(self._threads):
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self._thread_name_prefix}-{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+            self._condition.notify()
+        return future
+
+    def _queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def queue_position(self, future: Future) -> int | None:
+        """1-based place of a queued task in the start order; ``None`` once it started."""
+        with self._condition:
+            queues = list(self._queues.values())
+            for order, queue in enumerate(queues):
+                for index, task in enumerate(queue):
+                    if task[0] is not future:
+                        continue
+                    # Round r starts the r-th task of every owner in turn.
+                    ahead = sum(
+                        min(len(other), index + (1 if other_order < order else 0))
+                        for other_order, other in enumerate(queues)
+                        if other_order != order
+                    )
+                    return 1 + index + ahead
+        return None
+
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {
+                "max_workers": self.max_workers,
+                "running": self._running,
+                "queued": self._queued(),
+                "owners_waiting": len(self._queues),
+            }
+
+    def _next_task(self) -> _Task:
+        with self._condition:
+            while not self._queues:
+                self._condition.wait()
+            owner, queue = self._queues.popitem(last=False)
+            task = queue.popleft()
+            if queue:
+                # The owner goes to the back of the line for its next task.
+                self._queues[owner] = queue
+            self._running += 1
+            return task
+
+    def _work(self) -> None:
+        while True:
+            future, fn, args, kwargs = self._next_task()
+            try:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+            finally:
+                with self._condition:
+                    self._running -= 1
+
+
+__all__ = [
+    "DEFAULT_MAX_WORKERS",
+    "FairExecutor",
+]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Entry points that must start without network SDKs or PDF parsing:
+# CLI --help / --dry-run, usage reports, Markdown re-export, index stats.
+ENTRY_POINTS = (
+    "interview_insider.qa_extractor",
+    "interview_insider.usage_rollup",
+    "interview_insider.qa_markdown_exporter",
+    "interview_insider.question_index",
+    "interview_insider.deep_dive",
+)
+FORBIDDEN_MODULES = ("openai", "pypdf", "pydantic", "streamlit", "httpx")
+DEFAULT_BUDGET_MS = 150.0
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def measure_import(module: str) -> tuple[float, set[str]]:
+    """Import ``module`` in a fresh interpreter under ``-X importtime``.
+
+    Returns the module's cumulative import time in milliseconds and the set
+    of top-level packages that were imported along the way.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = 0
+    imported: set[str] = set()
+    for line in completed.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        name = match.group(4)
+        imported.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(match.group(2))
+    return cumulative_us / 1000, imported
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fail if no-network entry points import heavy dependencies or exceed an import-time budget."
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"Maximum cumulative import time per entry point (default: {DEFAULT_BUDGET_MS:.0f} ms).",
+    )
+    args = parser.parse_args()
+
+    failures = []
+    for module in ENTRY_POINTS:
+        elapsed_ms, imported = measure_import(module)
+        heavy = sorted(imported.intersection(FORBIDDEN_MODULES))
+        status = "ok"
+        if heavy:
+            status = f"imports {', '.join(heavy)}"
+            failures.append(module)
+        elif elapsed_ms > args.budget_ms:
+            status = f"over budget ({args.budget_ms:.0f} ms)"
+            failures.append(module)
+        print(f"{module:45} {elapsed_ms:8.1f} ms  {status}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
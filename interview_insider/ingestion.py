@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import codecs
+import io
+import logging
+import mmap
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+SAMPLE_BYTES = 64 * 1024
+CHUNK_BYTES = 1024 * 1024
+FALLBACK_ENCODING = "cp1251"
+
+logger = logging.getLogger(__name__)
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def detect_encoding(sample: bytes) -> str:
+    """Guess the encoding of a transcript from a prefix of its bytes.
+
+    A BOM wins; otherwise the sample must decode as UTF-8 (a character cut
+    at the end of the sample is fine), else ``FALLBACK_ENCODING`` is used.
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+    return "utf-8"
+
+
+def decode_chunks(chunks: Iterable[bytes | memoryview], encoding: str, *, errors: str = "strict") -> str:
+    """Decode byte chunks into one stripped string with ``\\n`` newlines.
+
+    Decoding and normalization are incremental: leading whitespace is dropped
+    as it arrives and trailing whitespace of each chunk is held back until
+    the next chunk shows whether it is trailing for the whole text (this
+    also keeps ``\\r\\n`` pairs split across chunks together). The only full
+    copy is the final join. With the default ``errors`` an invalid byte
+    anywhere raises ``UnicodeDecodeError``.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    parts: list[str] = []
+    pending = ""
+    started = False
+
+    def _feed(text: str) -> None:
+        nonlocal pending, started
+        text = pending + text
+        if not started:
+            text = text.lstrip()
+            if not text:
+                pending = ""
+                return
+            started = True
+        body = text.rstrip()
+        pending = text[len(body) :]
+        if body:
+            parts.append(body.replace("\r\n", "\n").replace("\r", "\n"))
+
+    for chunk in chunks:
+        _feed(decoder.decode(chunk))
+    _feed(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+def _iter_buffer(buffer: memoryview, chunk_bytes: int) -> Iterator[memoryview]:
+    for offset in range(0, len(buffer), chunk_bytes):
+        yield buffer[offset : offset + chunk_bytes]
+
+
+def _decode_buffer(buffer: memoryview, chunk_bytes: int, name: str) -> str:
+    """Decode with the detected encoding; if a byte past the sample is invalid, start over with the fallback."""
+    encoding = detect_encoding(bytes(buffer[:SAMPLE_BYTES]))
+    chunks: Callable[[], Iterator[memoryview]] = lambda: _iter_buffer(buffer, chunk_bytes)  # noqa: E731
+    # Only the message is kept: a live exception would pin slices of the
+    # buffer through its traceback and the caller could not release it.
+    try:
+        return decode_chunks(chunks(), encoding)
+    except UnicodeDecodeError as exc:
+        error = str(exc)
+    if encoding != FALLBACK_ENCODING:
+        try:
+            return decode_chunks(chunks(), FALLBACK_ENCODING)
+        except UnicodeDecodeError as exc:
+            error = str(exc)
+    logger.warning("%s is not valid %s (%s); undecodable bytes were replaced.", name, FALLBACK_ENCODING, error)
+    return decode_chunks(chunks(), FALLBACK_ENCODING, errors="replace")
+
+
+def read_text_file(path: Path, *, chunk_bytes: int = CHUNK_BYTES) -> str:
+    """Read a text file once through a memory map and return normalized text."""
+    with path.open("rb") as file_handle:
+        if path.stat().st_size == 0:
+            return ""
+        with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as buffer:
+                return _decode_buffer(buffer, chunk_bytes, str(path))
+
+
+def read_text_stream(stream: BinaryIO, *, chunk_bytes: int = CHUNK_BYTES, close: bool = True) -> str:
+    """Decode a binary stream (e.g. a Streamlit upload) without copying it whole.
+
+    In-memory streams are read through ``getbuffer()``; other streams are
+    read into memory first, since decoding may have to start over with the
+    fallback encoding. With ``close`` the stream is closed afterwards so an
+    upload's buffer can be freed before the next file is processed.
+    """
+    name = str(getattr(stream, "name", None) or "upload")
+    try:
+        stream.seek(0)
+        getbuffer = getattr(stream, "getbuffer", None)
+        if getbuffer is None:
+            getbuffer = io.BytesIO(stream.read()).getbuffer
+        with getbuffer() as buffer:
+            return _decode_buffer(buffer, chunk_bytes, name)
+    finally:
+        if close:
+            stream.close()
+
+
+__all__ = [
+    "CHUNK_BYTES",
+    "FALLBACK_ENCODING",
+    "SAMPLE_BYTES",
+    "decode_chunks",
+    "detect_encoding",
+    "read_text_file",
+    "read_text_stream",
+]
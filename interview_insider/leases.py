@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+CLAIMS_DIRNAME = "_claims"
+DEFAULT_LEASE_SECONDS = 300.0
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _read_claim(path: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _is_expired(path: Path, default_lease_seconds: float) -> bool:
+    """A claim expires when its mtime (the last heartbeat) is older than its lease."""
+    try:
+        heartbeat = path.stat().st_mtime
+    except FileNotFoundError:
+        return True
+    claim = _read_claim(path) or {}
+    lease_seconds = float(claim.get("lease_seconds") or default_lease_seconds)
+    return time.time() - heartbeat > lease_seconds
+
+
+class LeaseLostError(RuntimeError):
+    """The claim expired and was taken over while the work was still running."""
+
+
+@dataclass
+class Lease:
+    """A claim on one unit of work, kept alive by touching its claim file."""
+
+    path: Path
+    owner: str
+    lease_seconds: float
+    lost: bool = False
+    _stop: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def is_owned(self) -> bool:
+        claim = _read_claim(self.path)
+        return claim is not None and claim.get("owner") == self.owner
+
+    def renew(self) -> bool:
+        """Heartbeat: push the expiry forward. Returns False if the lease was lost."""
+        if not self.is_owned():
+            self.lost = True
+            return False
+        os.utime(self.path)
+        return True
+
+    def ensure_owned(self) -> None:
+        """Renew the claim, or raise ``LeaseLostError`` if it is no longer ours."""
+        if self.lost or not self.renew():
+            raise LeaseLostError(f"Claim {self.path.name} was taken over by another worker.")
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(self.lease_seconds / 3):
+            if not self.renew():
+                return
+
+    def release(self) -> None:
+        """Stop heartbeating and remove the claim if it is still ours.
+
+        As in ``_break_expired``, the claim is renamed to a unique tombstone
+        before the owner is checked again, so a claim another worker took
+        over after the first check is linked back instead of deleted.
+        """
+        self._stop.set()
+        if not self.is_owned():
+            return
+        tombstone = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.released")
+        try:
+            os.rename(self.path, tombstone)
+        except FileNotFoundError:
+            return
+        try:
+            claim = _read_claim(tombstone)
+            if claim is None or claim.get("owner") != self.owner:
+                try:
+                    os.link(tombstone, self.path)
+                except FileExistsError:
+                    pass
+        finally:
+            tombstone.unlink(missing_ok=True)
+
+
+def _break_expired(path: Path, lease_seconds: float) -> bool:
+    """Remove an expired claim left by a crashed worker.
+
+    The claim is renamed to a unique tombstone first, so of several workers
+    racing to break it only one succeeds. If the renamed claim turns out to
+    be fresh (another worker re-claimed between our check and the rename),
+    it is linked back. Returns True when the caller should retry the claim.
+    """
+    if not _is_expired(path, lease_seconds):
+        return False
+    tombstone = path.with_name(f".{path.name}.{uuid.uuid4().hex}.expired")
+    try:
+        os.rename(path, tombstone)
+    except FileNotFoundError:
+        return True
+    try:
+        if not _is_expired(tombstone, lease_seconds):
+            try:
+                os.link(tombstone, path)
+            except FileExistsError:
+                pass
+            return False
+        return True
+    finally:
+        tombstone.unlink(missing_ok=True)
+
+
+def try_claim(
+    claims_dir: Path,
+    key: str,
+    *,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    owner: str | None = None,
+) -> Lease | None:
+    """Atomically claim ``key``; returns ``None`` if another live worker holds it.
+
+    Claims are ``<claims_dir>/<key>.claim`` files created with ``O_EXCL``,
+    which is atomic on a volume shared by several containers. Claims whose
+    heartbeat is older than their lease are recovered.
+    """
+    claims_dir.mkdir(parents=True, exist_ok=True)
+    path = claims_dir / f"{key}.claim"
+    owner = owner or worker_id()
+    for _ in range(3):
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if not _break_expired(path, lease_seconds):
+                return None
+            continue
+        with os.fdopen(fd, "w", encoding="utf-8") as file_handle:
+            json.dump(
+                {"owner": owner, "lease_seconds": lease_seconds, "claimed_at": time.time()},
+                file_handle,
+            )
+        return Lease(path=path, owner=owner, lease_seconds=lease_seconds)
+    return None
+
+
+@contextmanager
+def claimed(
+    claims_dir: Path,
+    key: str,
+    *,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    owner: str | None = None,
+) -> Iterator[Lease | None]:
+    """Claim ``key`` for the block, heartbeating every third of the lease.
+
+    Yields ``None`` when the work is claimed elsewhere. The claim is released
+    on exit, also on errors, so failed work can be retried by any worker.
+    """
+    lease = try_claim(claims_dir, key, lease_seconds=lease_seconds, owner=owner)
+    if lease is None:
+        yield None
+        return
+    heartbeat = threading.Thread(target=lease._heartbeat, name=f"lease-{key}", daemon=True)
+    heartbeat.start()
+    try:
+        yield lease
+    finally:
+        lease.release()
+        heartbeat.join()
+
+
+__all__ = [
+    "CLAIMS_DIRNAME",
+    "DEFAULT_LEASE_SECONDS",
+    "Lease",
+    "LeaseLostError",
+    "claimed",
+    "try_claim",
+    "worker_id",
+]
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
-from typing import Literal, Type, TypeVar, Any
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal, Type, TypeVar, Any
 
-from openai import OpenAI
-from pydantic import BaseModel
+from interview_insider.usage_rollup import extract_usage_numbers, merge_usage
 
-from interview_insider.prompts.extracton_models_and_prompts import QAExtraction
+if TYPE_CHECKING:
+    # The OpenAI SDK and pydantic are imported on first use so CLI help,
+    # dry runs and the Streamlit app start without paying for them.
+    from openai import AsyncOpenAI, OpenAI
+    from pydantic import BaseModel
+
+    from interview_insider.backend_pool import BackendPool
 
 ModelChoice = Literal["5.2", "4.1", "o4-mini", "o3"]
-T = TypeVar("T", bound=BaseModel)
+T = TypeVar("T", bound="BaseModel")
+
+AUTO_MODEL = "auto"
 
 _DEFAULT_MODEL_ALIASES: dict[str, str] = {
     "5.2": "gpt-5.2",
@@ -20,17 +34,240 @@ _DEFAULT_MODEL_ALIASES: dict[str, str] = {
 }
 
 
-class LLMClient:
+class StructuredOutputError(ValueError):
+    """The response had no parsed structured output (truncated or schema-invalid).
+
+    Keeps the raw output text and the usage that was still billed, so callers
+    can salvage the valid part instead of paying for a full rerun.
+    """
+
+    def __init__(self, message: str, *, raw_text: str = "", usage: dict[str, Any] | None = None) -> None:
+        super().__init__(message)
+        self.raw_text = raw_text
+        self.usage = usage or {}
+
+
+@dataclass(frozen=True)
+class CascadePolicy:
+    """How ``AUTO_MODEL`` routes a transcript through increasingly strong models.
+
+    Transcripts longer than ``long_transcript_chars`` (or with more than
+    ``complex_question_marks`` question marks) skip the first tier. A tier's
+    output is accepted when it passes ``validate_qa_extraction``.
+    """
+
+    tiers: tuple[str, ...] = ("o4-mini", "o3")
+    long_transcript_chars: int = 60_000
+    complex_question_marks: int = 120
+    chars_per_expected_item: int = 6_000
+    min_items: int = 1
+    max_empty_ratio: float = 0.25
+
+
+DEFAULT_CASCADE_POLICY = CascadePolicy()
+
+
+def select_start_tier(transcript_text: str, policy: CascadePolicy = DEFAULT_CASCADE_POLICY) -> int:
+    if len(policy.tiers) < 2:
+        return 0
+    if len(transcript_text) > policy.long_transcript_chars:
+        return 1
+    if transcript_text.count("?") > policy.complex_question_marks:
+        return 1
+    return 0
+
+
+def validate_qa_extraction(
+    result: dict[str, Any],
+    transcript_text: str,
+    policy: CascadePolicy = DEFAULT_CASCADE_POLICY,
+) -> list[str]:
+    """Return the reasons an extraction looks too weak to keep (empty if fine)."""
+    problems: list[str] = []
+    items = [item for item in result.get("items") or [] if isinstance(item, dict)]
+    expected = max(policy.min_items, len(transcript_text) // policy.chars_per_expected_item)
+    if len(items) < expected:
+        problems.append(f"too few items: {len(items)} < {expected}")
+    if items:
+        # Fields left out of the schema profile (e.g. ``minimal``) do not count as empty.
+        empty = sum(
+            1
+            for item in items
+            if ("candidates_answer" in item and not str(item.get("candidates_answer") or "").strip())
+            or not str(item.get("short_candidate_answer_evaluation") or "").strip()
+        )
+        if empty / len(items) > policy.max_empty_ratio:
+            problems.append(f"empty evaluations: {empty}/{len(items)}")
+    return problems
+
+
+@dataclass
+class _CascadeRun:
+    """Bookkeeping shared by the sync and async cascade loops."""
+
+    transcript_text: str
+    policy: CascadePolicy
+    start: int = 0
+    attempts: list[dict[str, Any]] = field(default_factory=list)
+    total_usage: dict[str, Any] = field(default_factory=dict)
+    result: dict[str, Any] | None = None
+    served: dict[str, Any] = field(default_factory=dict)
+    last_error: Exception | None = None
+
+    def __post_init__(self) -> None:
+        self.start = select_start_tier(self.transcript_text, self.policy)
+
+    def tiers(self) -> list[tuple[int, str]]:
+        return [(tier, self.policy.tiers[tier]) for tier in range(self.start, len(self.policy.tiers))]
+
+    def record_error(self, tier: int, model: str, exc: Exception) -> None:
+        self.last_error = exc
+        usage = getattr(exc, "usage", None) or {}
+        self.total_usage = merge_usage(self.total_usage, usage)
+        self.attempts.append({"model": model, "tier": tier, "problems": [str(exc)], "usage": usage})
+
+    def record_result(self, tier: int, model: str, candidate: dict[str, Any], usage: dict[str, Any]) -> bool:
+        """Store a tier's output; return True when it is good enough to stop."""
+        self.total_usage = merge_usage(self.total_usage, usage)
+        problems = validate_qa_extraction(candidate, self.transcript_text, self.policy)
+        self.attempts.append({"model": model, "tier": tier, "problems": problems, "usage": usage})
+        self.result, self.served = candidate, self.attempts[-1]
+        return not problems
+
+    def finish(self) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+        if self.result is None:
+            raise ValueError("No cascade tier returned structured output.") from self.last_error
+        routing = {
+            "mode": "cascade",
+            "served_by": self.served["model"],
+            "tier": self.served["tier"],
+            "start_tier": self.start,
+            "escalated": self.served["tier"] > self.start,
+            "attempts": self.attempts,
+        }
+        return self.result, self.total_usage, routing
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When ``call_structured_llm`` sends a backup request for a slow call.
+
+    Once ``min_samples`` latencies of a model are known, a call still
+    running after their ``percentile`` (never less than
+    ``min_delay_seconds``) gets a backup request to
+    ``fallback_model`` (the same model when ``None``); the first response
+    wins. Hedging stops while more than ``max_hedge_rate`` of calls were
+    hedged, so an overloaded provider does not get twice the traffic.
+    """
+
+    percentile: float = 0.9
+    min_samples: int = 10
+    min_delay_seconds: float = 2.0
+    fallback_model: str | None = None
+    max_hedge_rate: float = 0.2
+
+
+class LatencyHistory:
+    """Recent successful call latencies per resolved model name (thread-safe)."""
+
+    def __init__(self, size: int = 200) -> None:
+        self._size = size
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(model, deque(maxlen=self._size)).append(seconds)
+
+    def count(self, model: str) -> int:
+        with self._lock:
+            return len(self._samples.get(model, ()))
+
+    def percentile(self, model: str, percentile: float) -> float | None:
+        with self._lock:
+            samples = sorted(self._samples.get(model, ()))
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(percentile * len(samples)) - 1))
+        return samples[index]
+
+
+# Shared by every client in the process, so clients created per extraction
+# (as ``run_qa_extraction`` does) still hedge on the full history.
+LATENCY_HISTORY = LatencyHistory()
+
+
+@dataclass
+class HedgeStats:
+    """Counters for hedged calls; ``extra_*`` are tokens billed for losing requests."""
+
+    calls: int = 0
+    hedged: int = 0
+    backup_wins: int = 0
+    extra_input_tokens: int = 0
+    extra_output_tokens: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def hedge_rate(self) -> float:
+        return self.hedged / self.calls if self.calls else 0.0
+
+    def count_call(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def count_hedge(self) -> None:
+        with self._lock:
+            self.hedged += 1
+
+    def count_backup_win(self) -> None:
+        with self._lock:
+            self.backup_wins += 1
+
+    def add_extra_usage(self, usage: dict[str, Any]) -> None:
+        numbers = extract_usage_numbers(usage)
+        with self._lock:
+            self.extra_input_tokens += int(numbers.get("input_tokens", 0))
+            self.extra_output_tokens += int(numbers.get("output_tokens", 0))
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hedged": self.hedged,
+                "hedge_rate": round(self.hedge_rate(), 4),
+                "backup_wins": self.backup_wins,
+                "extra_input_tokens": self.extra_input_tokens,
+                "extra_output_tokens": self.extra_output_tokens,
+            }
+
+
+def _default_response_model() -> Type[BaseModel]:
+    from interview_insider.prompts.extracton_models_and_prompts import QAExtraction
+
+    return QAExtraction
+
+
+class _BaseLLMClient:
     def __init__(
         self,
         *,
-        client: OpenAI | None = None,
         model_aliases: dict[str, str] | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        latency_history: LatencyHistory | None = None,
+        pool: BackendPool | None = None,
     ) -> None:
-        self._client = client or OpenAI()
         self._model_aliases = model_aliases or _DEFAULT_MODEL_ALIASES
+        # With a pool, requests keep the alias and each endpoint maps it.
+        self._pool = pool
+        self.hedge_policy = hedge_policy
+        self.latency_history = latency_history or LATENCY_HISTORY
+        self.hedge_stats = HedgeStats()
 
     def resolve_model(self, model: str) -> str:
+        if self._pool is not None:
+            if not self._pool.serves(model):
+                raise ValueError(f"Unsupported model '{model}'. Supported: {', '.join(self._pool.models())}")
+            return model
         resolved = self._model_aliases.get(model)
         if not resolved:
             supported = ", ".join(sorted({*("5.2", "4.1", "o4-mini", "o3")}))
@@ -50,6 +287,125 @@ class LLMClient:
             return {key: value for key, value in usage.__dict__.items() if not key.startswith("_")}
         return {}
 
+    def _request(self, *, system_prompt: str, user_message: str, model: str, response_model: Type[BaseModel]) -> dict[str, Any]:
+        return {
+            "model": self.resolve_model(model),
+            "input": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message},
+            ],
+            "text_format": response_model,
+        }
+
+    def _parsed(self, response: Any) -> tuple[Any, dict[str, Any]]:
+        if response.output_parsed is None:
+            raise StructuredOutputError(
+                "Model did not return structured output.",
+                raw_text=getattr(response, "output_text", None) or "",
+                usage=self._usage_to_dict(getattr(response, "usage", None)),
+            )
+        return response.output_parsed, self._usage_to_dict(response.usage)
+
+    def _hedge_delay(self, model: str) -> float | None:
+        """Seconds to wait before hedging a call to ``model``; ``None`` to not hedge."""
+        policy = self.hedge_policy
+        if policy is None or self.hedge_stats.hedge_rate() > policy.max_hedge_rate:
+            return None
+        if self.latency_history.count(model) < policy.min_samples:
+            return None
+        return max(policy.min_delay_seconds, self.latency_history.percentile(model, policy.percentile) or 0.0)
+
+    def _backup_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        fallback = self.hedge_policy.fallback_model if self.hedge_policy else None
+        return {**request, "model": self.resolve_model(fallback)} if fallback else request
+
+
+def _configured_pool() -> BackendPool | None:
+    from interview_insider.backend_pool import default_backend_pool
+
+    return default_backend_pool()
+
+
+class LLMClient(_BaseLLMClient):
+    """Structured-output calls on one ``OpenAI`` client or a ``BackendPool``.
+
+    Without either, the pool configured by ``INTERVIEW_INSIGHTS_BACKENDS``
+    is used when set, else the default ``OpenAI()`` endpoint.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: OpenAI | None = None,
+        model_aliases: dict[str, str] | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        latency_history: LatencyHistory | None = None,
+        pool: BackendPool | None = None,
+    ) -> None:
+        if client is None and pool is None:
+            pool = _configured_pool()
+        super().__init__(
+            model_aliases=model_aliases,
+            hedge_policy=hedge_policy,
+            latency_history=latency_history,
+            pool=pool,
+        )
+        if client is None and pool is None:
+            from openai import OpenAI
+
+            client = OpenAI()
+        self._client = client
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._hedge_executor_lock = threading.Lock()
+
+    def _timed_parse(self, request: dict[str, Any]) -> tuple[Any, dict[str, Any]]:
+        started = time.monotonic()
+        if self._pool is not None:
+            response = self._pool.parse(request)
+        else:
+            response = self._client.responses.parse(**request)
+        parsed = self._parsed(response)
+        self.latency_history.record(request["model"], time.monotonic() - started)
+        return parsed
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._hedge_executor_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="llm-hedge")
+            return self._hedge_executor
+
+    def _count_loser(self, future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            self.hedge_stats.add_extra_usage(future.result()[1])
+
+    def _hedged_parse(self, request: dict[str, Any], delay: float) -> tuple[Any, dict[str, Any]]:
+        """Send ``request``; after ``delay`` seconds also send a backup and take the first success.
+
+        A blocking HTTP call cannot be interrupted from another thread, so
+        the losing request is left to finish in the background; its tokens
+        are added to ``hedge_stats`` when it lands.
+        """
+        executor = self._executor()
+        primary = executor.submit(self._timed_parse, request)
+        if wait([primary], timeout=delay).done:
+            return primary.result()
+        self.hedge_stats.count_hedge()
+        backup = executor.submit(self._timed_parse, self._backup_request(request))
+        pending = {primary, backup}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in (primary, backup) if future in done and future.exception() is None), None)
+            if winner is not None:
+                break
+        else:
+            return primary.result()  # both failed: raise the primary's error
+        if winner is backup:
+            self.hedge_stats.count_backup_win()
+        loser = primary if winner is backup else backup
+        if not loser.cancel():
+            loser.add_done_callback(self._count_loser)
+        return winner.result()
+
     def call_structured_llm(
         self,
         *,
@@ -58,17 +414,17 @@ class LLMClient:
         model: ModelChoice | str,
         response_model: Type[T],
     ) -> tuple[T, dict[str, Any]]:
-        response = self._client.responses.parse(
-            model=self.resolve_model(model),
-            input=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message},
-            ],
-            text_format=response_model,
+        request = self._request(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            model=model,
+            response_model=response_model,
         )
-        if response.output_parsed is None:
-            raise ValueError("Model did not return structured output.")
-        return response.output_parsed, self._usage_to_dict(response.usage)
+        self.hedge_stats.count_call()
+        delay = self._hedge_delay(request["model"])
+        if delay is None:
+            return self._timed_parse(request)
+        return self._hedged_parse(request, delay)
 
     def extract_qa_json(
         self,
@@ -76,11 +432,181 @@ class LLMClient:
         system_prompt: str,
         user_message: str,
         model: ModelChoice | str,
+        response_model: Type[BaseModel] | None = None,
     ) -> tuple[dict[str, Any], dict[str, Any]]:
         extracted, usage = self.call_structured_llm(
             system_prompt=system_prompt,
             user_message=user_message,
             model=model,
-            response_model=QAExtraction,
+            response_model=response_model or _default_response_model(),
+        )
+        return extracted.model_dump(), usage
+
+    def extract_qa_json_cascade(
+        self,
+        *,
+        system_prompt: str,
+        user_message: str,
+        transcript_text: str,
+        policy: CascadePolicy = DEFAULT_CASCADE_POLICY,
+        response_model: Type[BaseModel] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+        """Run the cheapest suitable tier first and escalate on weak output.
+
+        Returns the extraction, the usage summed over all attempts and a
+        routing record with the tier that served the result.
+        """
+        run = _CascadeRun(transcript_text, policy)
+        for tier, model in run.tiers():
+            try:
+                candidate, usage = self.extract_qa_json(
+                    system_prompt=system_prompt,
+                    user_message=user_message,
+                    model=model,
+                    response_model=response_model,
+                )
+            except ValueError as exc:
+                run.record_error(tier, model, exc)
+                continue
+            if run.record_result(tier, model, candidate, usage):
+                break
+        return run.finish()
+
+
+class AsyncLLMClient(_BaseLLMClient):
+    """``LLMClient`` counterpart on ``AsyncOpenAI``.
+
+    ``max_concurrency`` caps in-flight requests across every coroutine that
+    shares this client, so one event loop can drive many extractions.
+    ``client`` and ``pool`` (or ``INTERVIEW_INSIGHTS_BACKENDS``) work as in
+    ``LLMClient``.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncOpenAI | None = None,
+        model_aliases: dict[str, str] | None = None,
+        max_concurrency: int = 16,
+        hedge_policy: HedgePolicy | None = None,
+        latency_history: LatencyHistory | None = None,
+        pool: BackendPool | None = None,
+    ) -> None:
+        if client is None and pool is None:
+            pool = _configured_pool()
+        super().__init__(
+            model_aliases=model_aliases,
+            hedge_policy=hedge_policy,
+            latency_history=latency_history,
+            pool=pool,
+        )
+        if client is None and pool is None:
+            from openai import AsyncOpenAI
+
+            client = AsyncOpenAI()
+        self._client = client
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call_structured_llm(
+        self,
+        *,
+        system_prompt: str,
+        user_message: str,
+        model: ModelChoice | str,
+        response_model: Type[T],
+    ) -> tuple[T, dict[str, Any]]:
+        request = self._request(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            model=model,
+            response_model=response_model,
+        )
+        self.hedge_stats.count_call()
+        delay = self._hedge_delay(request["model"])
+        if delay is None:
+            return await self._timed_parse(request)
+        return await self._hedged_parse(request, delay)
+
+    async def _timed_parse(self, request: dict[str, Any]) -> tuple[Any, dict[str, Any]]:
+        async with self._semaphore:
+            started = time.monotonic()
+            try:
+                if self._pool is not None:
+                    response = await self._pool.aparse(request)
+                else:
+                    response = await self._client.responses.parse(**request)
+            except asyncio.CancelledError:
+                # A cancelled loser took at least this long; keeping the
+                # sample stops the percentile from drifting down.
+                self.latency_history.record(request["model"], time.monotonic() - started)
+                raise
+        parsed = self._parsed(response)
+        self.latency_history.record(request["model"], time.monotonic() - started)
+        return parsed
+
+    async def _hedged_parse(self, request: dict[str, Any], delay: float) -> tuple[Any, dict[str, Any]]:
+        """Send ``request``; after ``delay`` seconds also send a backup and take the first success.
+
+        The losing request is cancelled, which closes its connection.
+        """
+        primary = asyncio.ensure_future(self._timed_parse(request))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+        self.hedge_stats.count_hedge()
+        backup = asyncio.ensure_future(self._timed_parse(self._backup_request(request)))
+        pending = {primary, backup}
+        winner = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in (primary, backup) if task in done and task.exception() is None), None)
+        finally:
+            for task in pending:
+                task.cancel()
+        if winner is None:
+            return primary.result()  # both failed: raise the primary's error
+        if winner is backup:
+            self.hedge_stats.count_backup_win()
+        return winner.result()
+
+    async def extract_qa_json(
+        self,
+        *,
+        system_prompt: str,
+        user_message: str,
+        model: ModelChoice | str,
+        response_model: Type[BaseModel] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        extracted, usage = await self.call_structured_llm(
+            system_prompt=system_prompt,
+            user_message=user_message,
+            model=model,
+            response_model=response_model or _default_response_model(),
         )
         return extracted.model_dump(), usage
+
+    async def extract_qa_json_cascade(
+        self,
+        *,
+        system_prompt: str,
+        user_message: str,
+        transcript_text: str,
+        policy: CascadePolicy = DEFAULT_CASCADE_POLICY,
+        response_model: Type[BaseModel] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+        run = _CascadeRun(transcript_text, policy)
+        for tier, model in run.tiers():
+            try:
+                candidate, usage = await self.extract_qa_json(
+                    system_prompt=system_prompt,
+                    user_message=user_message,
+                    model=model,
+                    response_model=response_model,
+                )
+            except ValueError as exc:
+                run.record_error(tier, model, exc)
+                continue
+            if run.record_result(tier, model, candidate, usage):
+                break
+        return run.finish()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+MANIFEST_FIELDS = ("transcript", "resume", "vacancy", "language")
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    transcript: Path
+    resume: Path | None = None
+    vacancy: str | None = None
+    language: str | None = None
+
+
+def _entry(row: dict[str, Any], *, base_dir: Path, location: str) -> ManifestEntry:
+    values = {field: str(row.get(field) or "").strip() or None for field in MANIFEST_FIELDS}
+    if not values["transcript"]:
+        raise ValueError(f"{location}: 'transcript' is required.")
+    resume = values["resume"]
+    return ManifestEntry(
+        transcript=base_dir / values["transcript"],
+        resume=base_dir / resume if resume else None,
+        vacancy=values["vacancy"],
+        language=values["language"],
+    )
+
+
+def load_manifest(path: Path) -> list[ManifestEntry]:
+    """Read a ``.csv`` (with a header row) or ``.jsonl`` manifest.
+
+    Each row maps a transcript to its resume, vacancy and language; only
+    ``transcript`` is required. Relative paths are resolved against the
+    manifest's directory.
+    """
+    base_dir = path.parent
+    entries = []
+    if path.suffix.lower() == ".jsonl":
+        with path.open(encoding="utf-8") as file_handle:
+            for line_number, line in enumerate(file_handle, start=1):
+                if not line.strip():
+                    continue
+                entries.append(_entry(json.loads(line), base_dir=base_dir, location=f"{path}:{line_number}"))
+    elif path.suffix.lower() == ".csv":
+        with path.open(encoding="utf-8-sig", newline="") as file_handle:
+            for line_number, row in enumerate(csv.DictReader(file_handle), start=2):
+                entries.append(_entry(row, base_dir=base_dir, location=f"{path}:{line_number}"))
+    else:
+        raise ValueError(f"Unsupported manifest format: {path.suffix} (expected .csv or .jsonl)")
+    return entries
+
+
+def prompt_prefix_key(entry: ManifestEntry, *, vacancy: str | None, language: str) -> tuple[str, str, str]:
+    """Key of the prompt prefix a run shares with others.
+
+    The system prompt depends on vacancy and language and the user message
+    starts with the resume, so runs with equal keys send identical prefixes
+    and benefit from the provider's prompt cache when sent back to back.
+    """
+    return (
+        entry.language or language,
+        entry.vacancy or vacancy or "",
+        str(entry.resume or ""),
+    )
+
+
+__all__ = [
+    "MANIFEST_FIELDS",
+    "ManifestEntry",
+    "load_manifest",
+    "prompt_prefix_key",
+]
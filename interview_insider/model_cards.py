@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+MODEL_CARDS = [
+    {
+        "name": "o3",
+        "summary": "Reasoning model for complex tasks.",
+        "tagline": "Reasoning first",
+        "reasoning": "5/5",
+        "speed": "1/3",
+        "reasoning_supported": True,
+        "reasoning_tokens": True,
+        "theme": "sunset",
+        "pricing": {
+            "input": "$2.00",
+            "cached_input": "$0.50",
+            "output": "$8.00",
+        },
+    },
+    {
+        "name": "5.2",
+        "summary": "Best for coding and agentic tasks.",
+        "tagline": "Agentic coding",
+        "reasoning": "5/5",
+        "speed": "3/3",
+        "reasoning_supported": True,
+        "reasoning_tokens": True,
+        "theme": "ocean",
+        "pricing": {
+            "input": "$1.75",
+            "cached_input": "$0.18",
+            "output": "$14.00",
+        },
+    },
+    {
+        "name": "o4-mini",
+        "summary": "Fast, cost-efficient reasoning model.",
+        "tagline": "Fast + efficient",
+        "reasoning": "4/5",
+        "speed": "3/3",
+        "reasoning_supported": True,
+        "reasoning_tokens": True,
+        "theme": "dawn",
+        "pricing": {
+            "input": "$1.10",
+            "cached_input": "$0.28",
+            "output": "$4.40",
+        },
+    },
+    {
+        "name": "4.1",
+        "summary": "Strongest non-reasoning model.",
+        "tagline": "Pure intelligence",
+        "intelligence": "4/5",
+        "speed": "3/3",
+        "reasoning_supported": False,
+        "reasoning_tokens": False,
+        "theme": "cloud",
+        "pricing": {
+            "input": "$2.00",
+            "cached_input": "$0.50",
+            "output": "$8.00",
+        },
+    },
+]
+
+
+def parse_price(value: Any) -> float:
+    """Convert a card price such as ``"$1.75"`` into USD per 1M tokens."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value or "").strip().lstrip("$").replace(",", "")
+    try:
+        return float(text)
+    except ValueError:
+        return 0.0
+
+
+def get_model_card(name: str) -> dict[str, Any] | None:
+    for card in MODEL_CARDS:
+        if card.get("name") == name:
+            return card
+    return None
+
+
+def get_model_pricing(name: str) -> dict[str, float]:
+    """Return per-1M-token USD prices for a model alias (zeros when unknown)."""
+    card = get_model_card(name) or {}
+    pricing = card.get("pricing") or {}
+    return {
+        key: parse_price(pricing.get(key))
+        for key in ("input", "cached_input", "output")
+    }
+
+
+__all__ = [
+    "MODEL_CARDS",
+    "get_model_card",
+    "get_model_pricing",
+    "parse_price",
+]
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from interview_insider.ingestion import read_text_file
+from interview_insider.llm_client import LLMClient
+from interview_insider.model_cards import MODEL_CARDS
+from interview_insider.qa_extractor import (
+    PIPELINE_SINGLE,
+    PIPELINES,
+    extract_resume_text_from_file,
+    run_qa_extraction,
+)
+from interview_insider.schema_profiles import SCHEMA_PROFILES
+from interview_insider.storage import file_lock
+from interview_insider.usage_rollup import usage_record_from_payload
+
+COMPARISONS_DIRNAME = "_comparisons"
+HISTORY_FILENAME = "history.jsonl"
+COMPARE_MODELS = tuple(card["name"] for card in MODEL_CARDS)
+SPEED_SCALE = 3
+
+SCOREBOARD_COLUMNS = [
+    ("model", "Model"),
+    ("seconds", "Seconds"),
+    ("items", "Items"),
+    ("input_tokens", "Input"),
+    ("cached_input_tokens", "Cached"),
+    ("output_tokens", "Output"),
+    ("reasoning_tokens", "Reasoning"),
+    ("cost_usd", "Cost $"),
+    ("error", "Error"),
+]
+
+
+def comparisons_dir(output_dir: str | Path) -> Path:
+    return Path(output_dir) / COMPARISONS_DIRNAME
+
+
+def _run_one(
+    *,
+    model: str,
+    transcript_text: str,
+    run_dir: Path,
+    stem: str,
+    llm_client: LLMClient | None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    row: dict[str, Any] = {"model": model, "transcript_chars": len(transcript_text)}
+    started = time.monotonic()
+    try:
+        qa_path = run_qa_extraction(
+            transcript_text=transcript_text,
+            model=model,
+            output_dir=run_dir,
+            output_name=f"{stem}_{model}_qa.json",
+            reuse_answers=False,
+            llm_client=llm_client,
+            **kwargs,
+        )
+    except Exception as exc:
+        row.update(seconds=round(time.monotonic() - started, 2), error=f"{type(exc).__name__}: {exc}")
+        return row
+    row["seconds"] = round(time.monotonic() - started, 2)
+    payload = json.loads(qa_path.with_suffix(".usage.json").read_text(encoding="utf-8"))
+    record = usage_record_from_payload(payload)
+    for key in ("input_tokens", "cached_input_tokens", "output_tokens", "reasoning_tokens", "total_tokens"):
+        row[key] = record[key]
+    row["cost_usd"] = round(record["cost_usd"], 6)
+    qa_json = json.loads(qa_path.read_text(encoding="utf-8"))
+    row["items"] = len(qa_json.get("items") or [])
+    row["output"] = str(qa_path)
+    return row
+
+
+def compare_models(
+    transcript_text: str,
+    *,
+    models: list[str] | tuple[str, ...] = COMPARE_MODELS,
+    output_dir: str | Path = "interview_insider/interview_insights",
+    name: str = "transcript",
+    llm_client: LLMClient | None = None,
+    record_history: bool = True,
+    **kwargs: Any,
+) -> list[dict[str, Any]]:
+    """Run one transcript through several models at once and measure each run.
+
+    Every model gets its own thread; outputs go to
+    ``<output_dir>/_comparisons/<name>/`` so they do not mix with regular
+    runs, and answer reuse is off so each model does all of its work.
+    ``kwargs`` (resume, vacancy, language, pipeline, lite, schema) are passed to
+    ``run_qa_extraction``. Returns one scoreboard row per model, in the
+    order of ``models``; a failed model gets an ``error`` instead of numbers.
+    Successful rows are appended to the history used by
+    ``measured_speed_ratings``.
+    """
+    run_dir = comparisons_dir(output_dir) / name
+    with ThreadPoolExecutor(max_workers=max(1, len(models)), thread_name_prefix="model-compare") as executor:
+        futures = [
+            executor.submit(
+                _run_one,
+                model=model,
+                transcript_text=transcript_text,
+                run_dir=run_dir,
+                stem=name,
+                llm_client=llm_client,
+                **kwargs,
+            )
+            for model in models
+        ]
+        rows = [future.result() for future in futures]
+    if record_history:
+        append_history(output_dir, [row for row in rows if not row.get("error")])
+    return rows
+
+
+def history_path(output_dir: str | Path) -> Path:
+    return comparisons_dir(output_dir) / HISTORY_FILENAME
+
+
+def append_history(output_dir: str | Path, rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+    path = history_path(output_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    created_at = datetime.now(timezone.utc).isoformat()
+    with file_lock(path), path.open("a", encoding="utf-8") as file_handle:
+        for row in rows:
+            entry = {
+                "created_at": created_at,
+                "model": row["model"],
+                "seconds": row["seconds"],
+                "transcript_chars": row.get("transcript_chars", 0),
+                "output_tokens": row.get("output_tokens", 0),
+            }
+            file_handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def load_history(output_dir: str | Path) -> list[dict[str, Any]]:
+    path = history_path(output_dir)
+    if not path.exists():
+        return []
+    entries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict) and entry.get("model") and entry.get("seconds"):
+            entries.append(entry)
+    return entries
+
+
+def measured_speed_ratings(output_dir: str | Path, *, min_runs: int = 1) -> dict[str, str]:
+    """Speed ratings (``"n/3"``) from measured comparison runs.
+
+    Each model's speed is its median seconds per 1K transcript characters.
+    Models within 25% of the fastest get 3/3, up to twice as slow 2/3,
+    slower ones 1/3. Models with fewer than ``min_runs`` runs are left out.
+    """
+    per_model: dict[str, list[float]] = {}
+    for entry in load_history(output_dir):
+        chars = max(1, int(entry.get("transcript_chars") or 0))
+        per_model.setdefault(entry["model"], []).append(float(entry["seconds"]) * 1000 / chars)
+    medians = {
+        model: statistics.median(values)
+        for model, values in per_model.items()
+        if len(values) >= min_runs
+    }
+    if not medians:
+        return {}
+    fastest = min(medians.values())
+    ratings = {}
+    for model, value in medians.items():
+        ratio = value / fastest if fastest else 1.0
+        stars = SPEED_SCALE if ratio <= 1.25 else SPEED_SCALE - 1 if ratio <= 2.0 else 1
+        ratings[model] = f"{stars}/{SPEED_SCALE}"
+    return ratings
+
+
+def apply_speed_ratings(cards: list[dict[str, Any]], ratings: dict[str, str]) -> list[dict[str, Any]]:
+    """Copies of ``cards`` with measured speed ratings where available."""
+    return [
+        {**card, "speed": ratings[card["name"]]} if card.get("name") in ratings else card
+        for card in cards
+    ]
+
+
+def format_scoreboard(rows: list[dict[str, Any]]) -> str:
+    def _cell(key: str, value: Any) -> str:
+        if value is None:
+            return "-"
+        if key == "cost_usd":
+            return f"{value:.4f}"
+        return str(value)
+
+    table = [[label for _, label in SCOREBOARD_COLUMNS]]
+    for row in rows:
+        table.append([_cell(key, row.get(key, "" if key == "error" else None)) for key, _ in SCOREBOARD_COLUMNS])
+    widths = [max(len(line[idx]) for line in table) for idx in range(len(SCOREBOARD_COLUMNS))]
+    lines = []
+    for line_index, line in enumerate(table):
+        cells = [
+            cell.ljust(width) if idx in (0, len(widths) - 1) else cell.rjust(width)
+            for idx, (cell, width) in enumerate(zip(line, widths))
+        ]
+        lines.append("  ".join(cells).rstrip())
+        if line_index == 0:
+            lines.append("  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run one transcript through several models concurrently and compare the results."
+    )
+    parser.add_argument(
+        "--transcript",
+        type=Path,
+        help="Path to the transcript .txt file.",
+    )
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        default=list(COMPARE_MODELS),
+        help=f"Model aliases to compare (default: {' '.join(COMPARE_MODELS)}).",
+    )
+    parser.add_argument(
+        "--vacancy",
+        default=None,
+        help="Vacancy or position name.",
+    )
+    parser.add_argument(
+        "--resume",
+        type=Path,
+        default=None,
+        help="Path to resume file (.pdf/.txt/.md).",
+    )
+    parser.add_argument(
+        "--language",
+        default="ru",
+        help="Language for the output (default: ru).",
+    )
+    parser.add_argument(
+        "--pipeline",
+        default=PIPELINE_SINGLE,
+        choices=PIPELINES,
+        help="Extraction pipeline (default: single).",
+    )
+    parser.add_argument(
+        "--lite",
+        action="store_true",
+        help="Skip what_to_fix and ideal answers (see interview_insider.deep_dive).",
+    )
+    parser.add_argument(
+        "--schema",
+        default=None,
+        choices=SCHEMA_PROFILES,
+        help="Output schema profile: minimal, standard (same as --lite) or full (default).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="interview_insider/interview_insights",
+        help="Directory for QA JSON outputs (comparisons go to its _comparisons folder).",
+    )
+    parser.add_argument(
+        "--speed-ratings",
+        action="store_true",
+        help="Print speed ratings measured over all comparison runs and exit.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the scoreboard as JSON.",
+    )
+    args = parser.parse_args()
+    if args.lite and args.schema:
+        parser.error("--lite is the same as --schema standard; pass only one of them")
+
+    if args.speed_ratings:
+        ratings = measured_speed_ratings(args.output_dir)
+        if not ratings:
+            print("No comparison runs recorded yet.")
+        for model, rating in sorted(ratings.items()):
+            print(f"{model}: {rating}")
+        return
+    if args.transcript is None:
+        parser.error("--transcript is required unless --speed-ratings is given.")
+
+    rows = compare_models(
+        read_text_file(args.transcript),
+        models=args.models,
+        output_dir=args.output_dir,
+        name=args.transcript.stem,
+        resume_text=extract_resume_text_from_file(args.resume),
+        vacancy=args.vacancy,
+        language=args.language,
+        pipeline=args.pipeline,
+        lite=args.lite,
+        schema=args.schema,
+    )
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+    else:
+        print(format_scoreboard(rows))
+
+
+__all__ = [
+    "COMPARE_MODELS",
+    "COMPARISONS_DIRNAME",
+    "append_history",
+    "apply_speed_ratings",
+    "compare_models",
+    "format_scoreboard",
+    "history_path",
+    "load_history",
+    "measured_speed_ratings",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -47,3 +47,172 @@ Please follow these guidelines:
 prompt_chat_QA_extractor = """
 Перед тобой файл с транскрибацией интервью. Учавствует 2 человека: Интервьюир и кандидат на вакансию {vacancy}. Подготовь Список вопрос - ответ из интервью в целом, примерное время на видео, когда он был задан, примерное место в тексте. список ошибок в ответе. и как нужно было правильно ответить.
 """
+
+
+class QASegment(BaseModel):
+    question: str = Field(description="A concise formulation of the question asked by the interviewer, preserving important nuances")
+    timecode: str = Field(
+        default=..., description="Timecode when the question was asked"
+    )
+    place_in_the_text: str = Field(description="semantic block reference point in the transcript text")
+    start_quote: str = Field(description="First 5-10 words of the question copied verbatim from the transcript")
+
+
+class QASegmentation(BaseModel):
+    vacancy: str | None = Field(
+        default=None, description="Vacancy or position being interviewed for"
+    )
+    employee_role_identified: str
+    stages_of_conversation_short: list[str]
+    segments: list[QASegment] = Field(
+        default_factory=list,
+        description="Interviewer questions that received an answer, in transcript order",
+    )
+
+
+class QAItemEvaluation(BaseModel):
+    candidates_answer: str = Field(description="Essence of the Answer given by the candidate")
+    short_candidate_answer_evaluation: str
+    errors_and_problems: list[str] = Field(
+        default_factory=list, description="List of errors in the candidate's answer"
+    )
+    what_to_fix: str
+    the_ideal_answer_example_eng: str
+    the_ideal_answer_example_ru: str
+    key_idea: str
+
+
+prompt_QA_segmenter = """
+You are an expert at segmenting interview transcripts.
+Given a transcript of an interview. There are two people involved: the interviewer and the candidate for the vacancy: {vacancy}.
+Your task is only to locate the questions asked by the interviewer, do not evaluate the answers.
+Please follow these guidelines:
+1. List every question asked by the interviewer in the order it appears.
+2. If a question does not have a corresponding answer, it should be omitted from the output
+3. For each question copy its first words verbatim from the transcript into start_quote.
+4. Output the results in {language} language (start_quote stays verbatim).
+"""
+
+prompt_QA_item_evaluator = """
+You are an expert interviewer evaluating one answer of a candidate for the vacancy: {vacancy}.
+You are given the question and the transcript excerpt containing the candidate's answer.
+Please follow these guidelines:
+1. Summarize the essence of the candidate's answer and evaluate it briefly.
+2. List the errors and problems in the answer and state its key idea.
+3. Fill every other field of the response schema (fixes, ideal answers) when it is present.
+4. Output the results in {language} language.
+"""
+
+
+class QAItemLite(BaseModel):
+    question: str = Field(description="A concise formulation of the question asked by the interviewer, preserving important nuances")
+    timecode: str = Field(
+        default=..., description="Timecode when the question was asked"
+    )
+    place_in_the_text: str = Field(description="semantic block reference point in the transcript text")
+    candidates_answer: str = Field(description="Essence of the Answer given by the candidate")
+    short_candidate_answer_evaluation: str
+    errors_and_problems: list[str] = Field(
+        default_factory=list, description="List of errors in the candidate's answer"
+    )
+    key_idea: str
+
+
+class QAExtractionLite(BaseModel):
+    vacancy: str | None = Field(
+        default=None, description="Vacancy or position being interviewed for"
+    )
+    employee_role_identified: str
+    stages_of_conversation_short: list[str]
+    items: list[QAItemLite] = Field(
+        default_factory=list,
+        description="List of extracted interviewer question/candidate answer pairs",
+    )
+
+
+class QAItemEvaluationLite(BaseModel):
+    candidates_answer: str = Field(description="Essence of the Answer given by the candidate")
+    short_candidate_answer_evaluation: str
+    errors_and_problems: list[str] = Field(
+        default_factory=list, description="List of errors in the candidate's answer"
+    )
+    key_idea: str
+
+
+class QAItemMinimal(BaseModel):
+    question: str = Field(description="A concise formulation of the question asked by the interviewer, preserving important nuances")
+    timecode: str = Field(
+        default=..., description="Timecode when the question was asked"
+    )
+    place_in_the_text: str = Field(description="semantic block reference point in the transcript text")
+    short_candidate_answer_evaluation: str = Field(description="One-sentence verdict on the candidate's answer")
+
+
+class QAExtractionMinimal(BaseModel):
+    vacancy: str | None = Field(
+        default=None, description="Vacancy or position being interviewed for"
+    )
+    employee_role_identified: str
+    stages_of_conversation_short: list[str]
+    items: list[QAItemMinimal] = Field(
+        default_factory=list,
+        description="List of extracted interviewer question/candidate answer pairs",
+    )
+
+
+class QAItemEvaluationMinimal(BaseModel):
+    short_candidate_answer_evaluation: str = Field(description="One-sentence verdict on the candidate's answer")
+
+
+prompt_QA_screener = """
+You are an expert at screening interview transcripts.
+Given a transcript of an interview. There are two people involved: the interviewer and the candidate for the vacancy: {vacancy}.
+Your task is to list the questions asked by the interviewer and judge each answer in one sentence.
+Please follow these guidelines:
+1. Identify each question asked by the interviewer that received an answer.
+2. Give a one-sentence verdict on the answer; do not explain or rewrite it.
+3. Output the results in {language} language.
+"""
+
+
+class QAItemDeepDive(BaseModel):
+    what_to_fix: str
+    the_ideal_answer_example_eng: str
+    the_ideal_answer_example_ru: str
+
+
+class QAItemFix(BaseModel):
+    what_to_fix: str
+
+
+prompt_QA_deep_dive = """
+You are an expert interviewer helping a candidate for the vacancy: {vacancy} improve one answer.
+You are given the interviewer's question, the essence of the candidate's answer, its evaluation and the errors found.
+Please follow these guidelines:
+1. Explain what the candidate should fix in the answer.
+2. When the response schema asks for them, give an example of the ideal answer in English and in Russian.
+3. Output what_to_fix in {language} language.
+"""
+
+
+class ResumeSummary(BaseModel):
+    headline: str = Field(description="Current role and seniority in a few words")
+    years_of_experience: str = Field(description="Total relevant experience, e.g. '5 years'")
+    skills: list[str] = Field(default_factory=list, description="Key technical skills and tools")
+    experience: list[str] = Field(
+        default_factory=list,
+        description="One line per relevant job: company, role, years and the main achievement",
+    )
+    projects: list[str] = Field(default_factory=list, description="Notable projects, one line each")
+    education: list[str] = Field(default_factory=list, description="Degrees and certificates, one line each")
+    languages: list[str] = Field(default_factory=list, description="Spoken languages with level")
+
+
+prompt_resume_summarizer = """
+You condense a candidate's resume into a compact structured summary for interview analysis.
+Keep only facts an interviewer would check against the candidate's answers: role, experience, skills, projects, education.
+Please follow these guidelines:
+1. Be terse: short phrases, no full sentences, no contact details.
+2. Keep names of technologies, companies and numbers exactly as written.
+3. Keep the language of the resume.
+"""
@@ -1,34 +1,66 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
-from pypdf import PdfReader
-
-from interview_insider.llm_client import LLMClient
-from interview_insider.prompts.extracton_models_and_prompts import prompt_QA_extractor
+from interview_insider.ingestion import read_text_file, read_text_stream
+from interview_insider.llm_client import (
+    AUTO_MODEL,
+    DEFAULT_CASCADE_POLICY,
+    AsyncLLMClient,
+    LLMClient,
+    select_start_tier,
+)
+from interview_insider.manifest import ManifestEntry, load_manifest, prompt_prefix_key
+from interview_insider.leases import CLAIMS_DIRNAME, DEFAULT_LEASE_SECONDS, LeaseLostError, claimed
 from interview_insider.qa_markdown_exporter import save_markdown_for_qa_json
+from interview_insider.question_index import index_ideal_answers, reuse_ideal_answers
+from interview_insider.resume_summary import condense_resume
+from interview_insider.salvage import extract_qa_json_salvaging, extract_qa_json_salvaging_async
+from interview_insider.schema_profiles import (
+    SCHEMA_FULL,
+    SCHEMA_MINIMAL,
+    SCHEMA_PROFILES,
+    extraction_model,
+    extractor_prompt,
+    resolve_schema,
+    schema_of_payload,
+)
+from interview_insider.segments import (
+    SEGMENTS_VERSION,
+    build_segment_index,
+    legacy_segments_path,
+    plan_regions,
+    segment_hash,
+    segments_path,
+    split_segments,
+)
+from interview_insider.storage import write_json_atomic
+from interview_insider.usage_rollup import estimate_cost_usd, merge_usage, record_usage, usage_record_from_payload
+
+PIPELINE_SINGLE = "single"
+PIPELINE_TWO_PHASE = "two-phase"
+PIPELINES = (PIPELINE_SINGLE, PIPELINE_TWO_PHASE)
+_CHARS_PER_TOKEN = 3
+# Calls sent without the resume: the two-phase segmentation call.
+_RESUMELESS_PHASES = ("segment",)
 
 
-def build_system_prompt(*, vacancy: str | None, language: str = "english") -> str:
-    return prompt_QA_extractor.format(
+def build_system_prompt(*, vacancy: str | None, language: str = "english", schema: str = SCHEMA_FULL) -> str:
+    return extractor_prompt(schema).format(
         vacancy=vacancy or "unknown",
         language=language,
     )
 
 
-def _read_text_file(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        return path.read_text(encoding="cp1251")
-
-
 def _extract_pdf_text(stream: BytesIO) -> str:
+    from pypdf import PdfReader
+
     reader = PdfReader(stream)
     pages = []
     for page in reader.pages:
@@ -44,7 +76,7 @@ def extract_resume_text_from_file(path: Path | None) -> str | None:
 
     suffix = path.suffix.lower()
     if suffix in {".txt", ".md"}:
-        return _read_text_file(path).strip()
+        return read_text_file(path)
     if suffix == ".pdf":
         with path.open("rb") as file_handle:
             return _extract_pdf_text(BytesIO(file_handle.read()))
@@ -54,7 +86,7 @@ def extract_resume_text_from_file(path: Path | None) -> str | None:
 def extract_resume_text_from_bytes(data: bytes, suffix: str) -> str:
     suffix = suffix.lower()
     if suffix in {".txt", ".md"}:
-        return data.decode("utf-8", errors="ignore").strip()
+        return read_text_stream(BytesIO(data))
     if suffix == ".pdf":
         return _extract_pdf_text(BytesIO(data))
     raise ValueError(f"Unsupported resume format: {suffix}")
@@ -70,32 +102,42 @@ def _default_output_name(source_path: Path) -> str:
     return f"{source_path.stem}_qa.json"
 
 
-def run_qa_extraction(
-    *,
-    transcript_text: str,
-    resume_text: str | None = None,
-    model: str,
-    vacancy: str | None = None,
-    language: str = "ru",
-    output_dir: str | Path = "interview_insider/interview_insights",
-    output_name: str | None = None,
-    stage_callback: Callable[[str], None] | None = None,
-) -> Path:
-    if stage_callback:
-        stage_callback("Preparing context for the LLM")
-    system_prompt = build_system_prompt(vacancy=vacancy, language=language)
-    user_message = (
+def _build_user_message(*, resume_text: str | None, transcript_text: str) -> str:
+    return (
         f"#RESUME: {resume_text or ''}\n"
         f"#INTERVIEW TRANSCRIPTION: {transcript_text}"
     )
-    llm_client = LLMClient()
-    if stage_callback:
-        stage_callback("Querying the model (LLM)")
-    result_json, usage = llm_client.extract_qa_json(
-        system_prompt=system_prompt,
-        user_message=user_message,
-        model=model,
-    )
+
+
+def _evaluate_model_for(model: str, transcript_text: str) -> str:
+    if model == AUTO_MODEL:
+        return DEFAULT_CASCADE_POLICY.tiers[select_start_tier(transcript_text)]
+    return model
+
+
+def _check_pipeline(pipeline: str) -> None:
+    if pipeline not in PIPELINES:
+        raise ValueError(f"Unsupported pipeline '{pipeline}'. Supported: {', '.join(PIPELINES)}")
+
+
+def _save_extraction(
+    *,
+    result_json: dict[str, Any],
+    usage: dict[str, Any],
+    routing: dict[str, Any] | None,
+    model: str,
+    vacancy: str | None,
+    language: str,
+    output_dir: str | Path,
+    output_name: str | None,
+    schema: str,
+    reuse_answers: bool,
+    stage_callback: Callable[[str], None] | None,
+    segments: dict[str, Any] | None = None,
+    reuse_items: list[Any] | None = None,
+    resume_summary: dict[str, Any] | None = None,
+) -> Path:
+    served_model = routing["served_by"] if routing else model
 
     if stage_callback:
         stage_callback("Post-processing / normalization")
@@ -110,23 +152,334 @@ def run_qa_extraction(
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         filename = f"qa_extraction_{timestamp}.json"
 
+    reused_answers = 0
+    index_items = (result_json.get("items") or []) if reuse_items is None else reuse_items
+    index_vacancy = vacancy or result_json.get("vacancy")
+    if reuse_answers and schema != SCHEMA_MINIMAL:
+        reused_answers = reuse_ideal_answers(
+            output_path,
+            index_items,
+            vacancy=index_vacancy,
+            language=language,
+            source=filename,
+        )
+    elif schema == SCHEMA_FULL:
+        # Only full outputs have ideal answers to offer to later runs.
+        index_ideal_answers(output_path, index_items, vacancy=index_vacancy, language=language, source=filename)
+
     if stage_callback:
         stage_callback("Saving output files")
 
     file_path = output_path / filename
-    file_path.write_text(
-        json.dumps(result_json, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    write_json_atomic(file_path, result_json)
     save_markdown_for_qa_json(result_json, file_path)
-    usage_path = file_path.with_suffix(".usage.json")
-    usage_path.write_text(
-        json.dumps({"usage": usage}, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    if segments is not None:
+        segments_path(file_path).parent.mkdir(exist_ok=True)
+        write_json_atomic(segments_path(file_path), segments)
+        legacy_segments_path(file_path).unlink(missing_ok=True)
+    usage_payload = {
+        "usage": usage,
+        "model": served_model,
+        "vacancy": vacancy,
+        "language": language,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "routing": routing,
+        "lite": schema != SCHEMA_FULL,
+        "schema": schema,
+        "reused_answers": reused_answers,
+    }
+    if resume_summary:
+        # Every request that carries the resume carried the summary instead.
+        attempts = (routing or {}).get("attempts") or [{}]
+        requests = sum(1 for attempt in attempts if attempt.get("phase") not in _RESUMELESS_PHASES)
+        chars_saved = max(0, resume_summary["raw_chars"] - resume_summary["summary_chars"])
+        usage_payload["resume"] = {
+            **resume_summary,
+            "requests": requests,
+            "input_tokens_saved": chars_saved // _CHARS_PER_TOKEN * requests,
+        }
+    # Written last: its presence marks the extraction as complete (see
+    # ``is_extracted``), and every file is replaced atomically.
+    write_json_atomic(file_path.with_suffix(".usage.json"), usage_payload)
+    record_usage(output_path, file_path.name, usage_record_from_payload(usage_payload))
     return file_path
 
 
+def _extract(
+    llm_client: LLMClient,
+    *,
+    transcript_text: str,
+    resume_text: str | None,
+    model: str,
+    vacancy: str | None,
+    language: str,
+    pipeline: str,
+    schema: str,
+    item_callback: Callable[[dict[str, Any]], None] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any] | None]:
+    """Run the LLM part of an extraction; returns the result, usage and routing."""
+    routing: dict[str, Any] | None = None
+    if pipeline == PIPELINE_TWO_PHASE:
+        evaluate_model = _evaluate_model_for(model, transcript_text)
+        from interview_insider.two_phase_extractor import extract_qa_two_phase
+
+        result_json, usage, attempts = extract_qa_two_phase(
+            llm_client,
+            transcript_text=transcript_text,
+            resume_text=resume_text,
+            vacancy=vacancy,
+            language=language,
+            model=evaluate_model,
+            schema=schema,
+            item_callback=item_callback,
+        )
+        routing = {"mode": PIPELINE_TWO_PHASE, "served_by": evaluate_model, "attempts": attempts}
+    else:
+        response_model = extraction_model(schema)
+        system_prompt = build_system_prompt(vacancy=vacancy, language=language, schema=schema)
+        user_message = _build_user_message(resume_text=resume_text, transcript_text=transcript_text)
+        if model == AUTO_MODEL:
+            result_json, usage, routing = llm_client.extract_qa_json_cascade(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                transcript_text=transcript_text,
+                response_model=response_model,
+            )
+        else:
+            result_json, usage, routing = extract_qa_json_salvaging(
+                llm_client,
+                system_prompt=system_prompt,
+                user_message=user_message,
+                transcript_text=transcript_text,
+                resume_text=resume_text,
+                model=model,
+                response_model=response_model,
+            )
+        if item_callback:
+            for index, item in enumerate(result_json.get("items") or []):
+                item_callback({"index": index, **item})
+    return result_json, usage, routing
+
+
+def run_qa_extraction(
+    *,
+    transcript_text: str,
+    resume_text: str | None = None,
+    model: str,
+    vacancy: str | None = None,
+    language: str = "ru",
+    output_dir: str | Path = "interview_insider/interview_insights",
+    output_name: str | None = None,
+    stage_callback: Callable[[str], None] | None = None,
+    pipeline: str = PIPELINE_SINGLE,
+    lite: bool = False,
+    schema: str | None = None,
+    reuse_answers: bool = False,
+    resume_summary: dict[str, Any] | None = None,
+    llm_client: LLMClient | None = None,
+    item_callback: Callable[[dict[str, Any]], None] | None = None,
+) -> Path:
+    """Extract QA pairs from a transcript and save JSON, Markdown and usage.
+
+    ``schema`` picks the output profile (see ``schema_profiles``); ``lite``
+    is shorthand for ``standard``, which skips the expensive per-item fields
+    (``deep_dive.DEEP_DIVE_FIELDS``) so they can be generated later for
+    selected items with ``deep_dive``.
+    With ``reuse_answers`` (off by default, ignored for ``minimal``) missing
+    ideal answers are filled from the same question in earlier interviews
+    (see ``question_index``) and marked with ``reused_from``; full outputs
+    are always added to the index. ``item_callback`` is called once
+    per item (with its 0-based ``index``): as each evaluation finishes in the
+    two-phase pipeline, after the single call otherwise.
+    """
+    _check_pipeline(pipeline)
+    schema = resolve_schema(schema, lite=lite)
+    if stage_callback:
+        stage_callback("Preparing context for the LLM")
+    llm_client = llm_client or LLMClient()
+    if stage_callback:
+        stage_callback("Querying the model (LLM)")
+    result_json, usage, routing = _extract(
+        llm_client,
+        transcript_text=transcript_text,
+        resume_text=resume_text,
+        model=model,
+        vacancy=vacancy,
+        language=language,
+        pipeline=pipeline,
+        schema=schema,
+        item_callback=item_callback,
+    )
+
+    return _save_extraction(
+        result_json=result_json,
+        usage=usage,
+        routing=routing,
+        model=model,
+        vacancy=vacancy,
+        language=language,
+        output_dir=output_dir,
+        output_name=output_name,
+        schema=schema,
+        reuse_answers=reuse_answers,
+        resume_summary=resume_summary,
+        stage_callback=stage_callback,
+        segments=build_segment_index(transcript_text, result_json.get("items") or []),
+    )
+
+
+def _load_previous_extraction(
+    qa_path: Path, *, schema: str, language: str
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]] | None:
+    """QA JSON, usage payload and segment index of a finished extraction, if reusable."""
+    try:
+        usage_payload = json.loads(qa_path.with_suffix(".usage.json").read_text(encoding="utf-8"))
+        qa_json = json.loads(qa_path.read_text(encoding="utf-8"))
+        index_path = segments_path(qa_path)
+        if not index_path.exists():
+            index_path = legacy_segments_path(qa_path)
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != SEGMENTS_VERSION:
+        return None
+    if schema_of_payload(usage_payload) != schema or usage_payload.get("language") != language:
+        return None
+    if len(index.get("item_starts") or []) != len(qa_json.get("items") or []):
+        return None
+    return qa_json, usage_payload, index
+
+
+def run_qa_reextraction(
+    *,
+    transcript_text: str,
+    resume_text: str | None = None,
+    model: str,
+    vacancy: str | None = None,
+    language: str = "ru",
+    output_dir: str | Path = "interview_insider/interview_insights",
+    output_name: str,
+    stage_callback: Callable[[str], None] | None = None,
+    pipeline: str = PIPELINE_SINGLE,
+    lite: bool = False,
+    schema: str | None = None,
+    reuse_answers: bool = False,
+    resume_summary: dict[str, Any] | None = None,
+    llm_client: LLMClient | None = None,
+) -> Path:
+    """Update ``output_name`` after its transcript was edited, re-extracting only what changed.
+
+    The new transcript is diffed against the segment hashes saved with the
+    previous output (see ``segments``); only the items whose segments
+    changed are re-extracted, from an excerpt of the new transcript, and
+    merged into the existing QA JSON. Markdown, usage (cumulative, so the
+    rollup keeps the original cost) and segment hashes are rewritten.
+    Unchanged transcripts return immediately. Falls back to a full
+    ``run_qa_extraction`` when there is no reusable previous output
+    (missing, older than segment hashes, other ``schema``/``language``) or
+    when every item changed.
+    """
+    schema = resolve_schema(schema, lite=lite)
+    full_run = dict(
+        transcript_text=transcript_text,
+        resume_text=resume_text,
+        model=model,
+        vacancy=vacancy,
+        language=language,
+        output_dir=output_dir,
+        output_name=output_name,
+        stage_callback=stage_callback,
+        pipeline=pipeline,
+        schema=schema,
+        reuse_answers=reuse_answers,
+        resume_summary=resume_summary,
+        llm_client=llm_client,
+    )
+    qa_path = Path(output_dir) / output_name
+    previous = _load_previous_extraction(qa_path, schema=schema, language=language)
+    if previous is None:
+        return run_qa_extraction(**full_run)
+    qa_json, usage_payload, index = previous
+    new_segments = split_segments(transcript_text)
+    if [segment_hash(segment) for segment in new_segments] == index["hashes"]:
+        return qa_path
+    items = list(qa_json.get("items") or [])
+    regions = plan_regions(index, new_segments)
+    if not regions or sum(region.items[1] - region.items[0] for region in regions) == len(items):
+        return run_qa_extraction(**full_run)
+
+    _check_pipeline(pipeline)
+    if stage_callback:
+        stage_callback("Preparing context for the LLM")
+    llm_client = llm_client or LLMClient()
+    usage = usage_payload.get("usage") or {}
+    previous_routing = usage_payload.get("routing") or {}
+    attempts = list(previous_routing.get("attempts") or [{"model": usage_payload.get("model"), "usage": usage}])
+    new_items: list[Any] = []
+    region_log = []
+    if stage_callback:
+        stage_callback("Querying the model (LLM)")
+    # Back to front, so earlier item positions stay valid while splicing.
+    for region in reversed(regions):
+        excerpt = "\n".join(new_segments[region.segments[0] : region.segments[1]])
+        region_items: list[Any] = []
+        if excerpt.strip():
+            result_json, region_usage, region_routing = _extract(
+                llm_client,
+                transcript_text=excerpt,
+                resume_text=resume_text,
+                model=model,
+                vacancy=vacancy,
+                language=language,
+                pipeline=pipeline,
+                schema=schema,
+            )
+            region_items = list(result_json.get("items") or [])
+            usage = merge_usage(usage, region_usage)
+            attempts.extend(
+                (region_routing or {}).get("attempts") or [{"model": model, "usage": region_usage}]
+            )
+        items[region.items[0] : region.items[1]] = region_items
+        new_items.extend(region_items)
+        region_log.insert(
+            0,
+            {
+                "replaced_items": region.items[1] - region.items[0],
+                "new_items": len(region_items),
+                "segments": list(region.segments),
+            },
+        )
+    replaced = sum(entry["replaced_items"] for entry in region_log)
+    result_json = {**qa_json, "items": items}
+    routing = {
+        "mode": "incremental",
+        "served_by": usage_payload.get("model") or model,
+        "attempts": attempts,
+        "incremental": {
+            "regions": region_log,
+            "kept_items": len(items) - len(new_items),
+            "reextracted_items": len(new_items),
+            "replaced_items": replaced,
+        },
+    }
+    return _save_extraction(
+        result_json=result_json,
+        usage=usage,
+        routing=routing,
+        model=model,
+        vacancy=vacancy,
+        language=language,
+        output_dir=output_dir,
+        output_name=output_name,
+        schema=schema,
+        reuse_answers=reuse_answers,
+        resume_summary=resume_summary,
+        stage_callback=stage_callback,
+        segments=build_segment_index(transcript_text, items),
+        reuse_items=new_items,
+    )
+
+
 def run_qa_extraction_for_file(
     *,
     transcript_path: Path,
@@ -136,10 +489,40 @@ def run_qa_extraction_for_file(
     language: str,
     output_dir: str | Path,
     stage_callback: Callable[[str], None] | None = None,
+    pipeline: str = PIPELINE_SINGLE,
+    lite: bool = False,
+    schema: str | None = None,
+    reuse_answers: bool = False,
+    resume_summary: dict[str, Any] | None = None,
+    llm_client: LLMClient | None = None,
+    incremental: bool = False,
 ) -> Path:
-    transcript_text = _read_text_file(transcript_path).strip()
+    """Extract QA from a transcript file into ``<stem>_qa.json``.
+
+    With ``incremental`` an existing output is updated in place and only
+    items whose transcript segments changed are re-extracted (see
+    ``run_qa_reextraction``).
+    """
+    transcript_text = read_text_file(transcript_path)
     if not transcript_text:
         raise ValueError(f"Transcript is empty: {transcript_path}")
+    if incremental:
+        return run_qa_reextraction(
+            transcript_text=transcript_text,
+            resume_text=resume_text,
+            model=model,
+            vacancy=vacancy,
+            language=language,
+            output_dir=output_dir,
+            output_name=_default_output_name(transcript_path),
+            stage_callback=stage_callback,
+            pipeline=pipeline,
+            lite=lite,
+            schema=schema,
+            reuse_answers=reuse_answers,
+            resume_summary=resume_summary,
+            llm_client=llm_client,
+        )
     return run_qa_extraction(
         transcript_text=transcript_text,
         resume_text=resume_text,
@@ -149,7 +532,415 @@ def run_qa_extraction_for_file(
         output_dir=output_dir,
         output_name=_default_output_name(transcript_path),
         stage_callback=stage_callback,
+        pipeline=pipeline,
+        lite=lite,
+        schema=schema,
+        reuse_answers=reuse_answers,
+        resume_summary=resume_summary,
+        llm_client=llm_client,
+    )
+
+
+async def run_qa_extraction_async(
+    *,
+    transcript_text: str,
+    resume_text: str | None = None,
+    model: str,
+    vacancy: str | None = None,
+    language: str = "ru",
+    output_dir: str | Path = "interview_insider/interview_insights",
+    output_name: str | None = None,
+    stage_callback: Callable[[str], None] | None = None,
+    pipeline: str = PIPELINE_SINGLE,
+    lite: bool = False,
+    schema: str | None = None,
+    reuse_answers: bool = False,
+    resume_summary: dict[str, Any] | None = None,
+    llm_client: AsyncLLMClient | None = None,
+) -> Path:
+    """Async ``run_qa_extraction``.
+
+    LLM calls go through ``AsyncLLMClient``; saving (JSON, Markdown, usage,
+    rollup and question index) runs in a worker thread so the event loop is
+    never blocked on file I/O. Share one ``llm_client`` between concurrent
+    calls to bound in-flight requests.
+    """
+    _check_pipeline(pipeline)
+    schema = resolve_schema(schema, lite=lite)
+    if stage_callback:
+        stage_callback("Preparing context for the LLM")
+    llm_client = llm_client or AsyncLLMClient()
+    routing: dict[str, Any] | None = None
+    if stage_callback:
+        stage_callback("Querying the model (LLM)")
+    if pipeline == PIPELINE_TWO_PHASE:
+        evaluate_model = _evaluate_model_for(model, transcript_text)
+        from interview_insider.two_phase_extractor import extract_qa_two_phase_async
+
+        result_json, usage, attempts = await extract_qa_two_phase_async(
+            llm_client,
+            transcript_text=transcript_text,
+            resume_text=resume_text,
+            vacancy=vacancy,
+            language=language,
+            model=evaluate_model,
+            schema=schema,
+        )
+        routing = {"mode": PIPELINE_TWO_PHASE, "served_by": evaluate_model, "attempts": attempts}
+    else:
+        response_model = extraction_model(schema)
+        system_prompt = build_system_prompt(vacancy=vacancy, language=language, schema=schema)
+        user_message = _build_user_message(resume_text=resume_text, transcript_text=transcript_text)
+        if model == AUTO_MODEL:
+            result_json, usage, routing = await llm_client.extract_qa_json_cascade(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                transcript_text=transcript_text,
+                response_model=response_model,
+            )
+        else:
+            result_json, usage, routing = await extract_qa_json_salvaging_async(
+                llm_client,
+                system_prompt=system_prompt,
+                user_message=user_message,
+                transcript_text=transcript_text,
+                resume_text=resume_text,
+                model=model,
+                response_model=response_model,
+            )
+
+    return await asyncio.to_thread(
+        _save_extraction,
+        result_json=result_json,
+        usage=usage,
+        routing=routing,
+        model=model,
+        vacancy=vacancy,
+        language=language,
+        output_dir=output_dir,
+        output_name=output_name,
+        schema=schema,
+        reuse_answers=reuse_answers,
+        resume_summary=resume_summary,
+        stage_callback=stage_callback,
+        segments=build_segment_index(transcript_text, result_json.get("items") or []),
+    )
+
+
+async def run_qa_extraction_for_file_async(
+    *,
+    transcript_path: Path,
+    resume_text: str | None,
+    model: str,
+    vacancy: str | None,
+    language: str,
+    output_dir: str | Path,
+    stage_callback: Callable[[str], None] | None = None,
+    pipeline: str = PIPELINE_SINGLE,
+    lite: bool = False,
+    schema: str | None = None,
+    reuse_answers: bool = False,
+    resume_summary: dict[str, Any] | None = None,
+    llm_client: AsyncLLMClient | None = None,
+) -> Path:
+    transcript_text = await asyncio.to_thread(read_text_file, transcript_path)
+    if not transcript_text:
+        raise ValueError(f"Transcript is empty: {transcript_path}")
+    return await run_qa_extraction_async(
+        transcript_text=transcript_text,
+        resume_text=resume_text,
+        model=model,
+        vacancy=vacancy,
+        language=language,
+        output_dir=output_dir,
+        output_name=_default_output_name(transcript_path),
+        stage_callback=stage_callback,
+        pipeline=pipeline,
+        lite=lite,
+        schema=schema,
+        reuse_answers=reuse_answers,
+        resume_summary=resume_summary,
+        llm_client=llm_client,
+    )
+
+
+async def run_qa_extractions_async(
+    transcript_paths: list[Path],
+    *,
+    max_concurrency: int = 16,
+    llm_client: AsyncLLMClient | None = None,
+    **kwargs: Any,
+) -> list[Path | BaseException]:
+    """Extract many transcripts on one event loop with bounded concurrency.
+
+    At most ``max_concurrency`` files are in flight at once (and, with the
+    default client, at most that many LLM requests). Results keep the input
+    order; failures are returned as exceptions instead of cancelling the batch.
+    """
+    llm_client = llm_client or AsyncLLMClient(max_concurrency=max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(transcript_path: Path) -> Path:
+        async with semaphore:
+            return await run_qa_extraction_for_file_async(
+                transcript_path=transcript_path,
+                llm_client=llm_client,
+                **kwargs,
+            )
+
+    return await asyncio.gather(
+        *(_run(transcript_path) for transcript_path in transcript_paths),
+        return_exceptions=True,
+    )
+
+
+def is_extracted(output_dir: str | Path, transcript_path: Path) -> bool:
+    output_path = Path(output_dir) / _default_output_name(transcript_path)
+    return output_path.with_suffix(".usage.json").exists()
+
+
+def run_qa_extractions_claimed(
+    transcript_paths: list[Path],
+    *,
+    output_dir: str | Path,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    **kwargs: Any,
+) -> list[tuple[Path, Path | BaseException]]:
+    """Extract transcripts that no other worker has done or is doing.
+
+    For workers sharing ``output_dir`` (e.g. several containers on one
+    volume): each transcript is claimed with a heartbeated lease under
+    ``<output_dir>/_claims`` before extraction and skipped when already
+    extracted or claimed by a live worker. Leases of crashed workers expire
+    after ``lease_seconds`` and the transcript is picked up again. If this
+    worker's own lease is lost mid-extraction (e.g. it stalled past the
+    lease), the result is discarded before anything is saved and the
+    transcript is left to the new owner.
+    Returns ``(transcript, result)`` pairs for the transcripts this worker
+    processed; failures are returned as exceptions.
+    """
+    claims_dir = Path(output_dir) / CLAIMS_DIRNAME
+    stage_callback = kwargs.pop("stage_callback", None)
+    results: list[tuple[Path, Path | BaseException]] = []
+    for transcript_path in transcript_paths:
+        if is_extracted(output_dir, transcript_path):
+            continue
+        with claimed(claims_dir, _default_output_name(transcript_path), lease_seconds=lease_seconds) as lease:
+            # Re-check under the claim: another worker may have finished it
+            # between the first check and our claim.
+            if lease is None or is_extracted(output_dir, transcript_path):
+                continue
+
+            # Saving starts with the "Post-processing" stage, so checking the
+            # lease on every stage also checks it right before the first write.
+            def _checked_stage(stage: str, lease=lease) -> None:
+                lease.ensure_owned()
+                if stage_callback:
+                    stage_callback(stage)
+
+            try:
+                result: Path | BaseException = run_qa_extraction_for_file(
+                    transcript_path=transcript_path,
+                    output_dir=output_dir,
+                    stage_callback=_checked_stage,
+                    **kwargs,
+                )
+            except LeaseLostError:
+                continue
+            except Exception as exc:
+                result = exc
+            results.append((transcript_path, result))
+    return results
+
+
+async def _load_resumes(entries: list[ManifestEntry]) -> dict[Path, str | BaseException]:
+    resume_paths = list(dict.fromkeys(entry.resume for entry in entries if entry.resume))
+    texts = await asyncio.gather(
+        *(asyncio.to_thread(extract_resume_text_from_file, resume_path) for resume_path in resume_paths),
+        return_exceptions=True,
     )
+    return dict(zip(resume_paths, texts))
+
+
+async def _condense_resumes(
+    resumes: dict[Path | None, str | None | BaseException],
+    *,
+    output_dir: str | Path,
+) -> dict[Path | None, dict[str, Any] | None]:
+    """Replace each loaded resume with its cached summary, in place."""
+    paths = [path for path, text in resumes.items() if not isinstance(text, BaseException)]
+    condensed = await asyncio.gather(
+        *(asyncio.to_thread(condense_resume, resumes[path], output_dir=output_dir) for path in paths),
+        return_exceptions=True,
+    )
+    summaries: dict[Path | None, dict[str, Any] | None] = {}
+    for path, result in zip(paths, condensed):
+        if isinstance(result, BaseException):
+            resumes[path] = result
+        else:
+            resumes[path], summaries[path] = result
+    return summaries
+
+
+async def run_manifest_async(
+    entries: list[ManifestEntry],
+    *,
+    model: str,
+    output_dir: str | Path,
+    resume_text: str | None = None,
+    vacancy: str | None = None,
+    language: str = "ru",
+    max_concurrency: int = 16,
+    llm_client: AsyncLLMClient | None = None,
+    condense_resumes: bool = False,
+    **kwargs: Any,
+) -> list[Path | BaseException]:
+    """Extract every manifest entry in one concurrent run.
+
+    Each distinct resume is parsed once. ``resume_text``, ``vacancy`` and
+    ``language`` are defaults for entries that leave them empty. Runs are
+    started grouped by ``prompt_prefix_key`` so requests with the same system
+    prompt and resume reach the API back to back. With ``condense_resumes``
+    every resume is replaced by its cached compact summary (see
+    ``interview_insider.resume_summary``). Results keep the manifest order;
+    failures are returned as exceptions.
+    """
+    resumes: dict[Path | None, Any] = dict(await _load_resumes(entries))
+    resumes[None] = resume_text
+    summaries: dict[Path | None, dict[str, Any] | None] = {}
+    if condense_resumes:
+        summaries = await _condense_resumes(resumes, output_dir=output_dir)
+    llm_client = llm_client or AsyncLLMClient(max_concurrency=max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(entry: ManifestEntry) -> Path:
+        entry_resume = resumes[entry.resume]
+        if isinstance(entry_resume, BaseException):
+            raise entry_resume
+        async with semaphore:
+            return await run_qa_extraction_for_file_async(
+                transcript_path=entry.transcript,
+                resume_text=entry_resume,
+                resume_summary=summaries.get(entry.resume),
+                model=model,
+                vacancy=entry.vacancy or vacancy,
+                language=entry.language or language,
+                output_dir=output_dir,
+                llm_client=llm_client,
+                **kwargs,
+            )
+
+    order = sorted(
+        range(len(entries)),
+        key=lambda index: prompt_prefix_key(entries[index], vacancy=vacancy, language=language),
+    )
+    ordered_results = await asyncio.gather(*(_run(entries[index]) for index in order), return_exceptions=True)
+    results: list[Path | BaseException] = [None] * len(entries)  # type: ignore[list-item]
+    for index, result in zip(order, ordered_results):
+        results[index] = result
+    return results
+
+
+def plan_runs(
+    transcript_paths: list[Path],
+    *,
+    resume_text: str | None,
+    model: str,
+) -> list[dict[str, Any]]:
+    """Estimate the input side of each run without calling the API.
+
+    Token counts are a rough ``_CHARS_PER_TOKEN`` heuristic; output tokens
+    are unknown up front and not included in the cost.
+    """
+    resume_chars = len(resume_text or "")
+    plan = []
+    for transcript_path in transcript_paths:
+        transcript_text = read_text_file(transcript_path)
+        planned_model = _evaluate_model_for(model, transcript_text)
+        input_tokens = (len(transcript_text) + resume_chars) // _CHARS_PER_TOKEN
+        plan.append(
+            {
+                "transcript": transcript_path.name,
+                "model": planned_model,
+                "chars": len(transcript_text),
+                "input_tokens": input_tokens,
+                "input_cost_usd": estimate_cost_usd(planned_model, {"input_tokens": input_tokens}),
+            }
+        )
+    return plan
+
+
+def format_plan(plan: list[dict[str, Any]]) -> str:
+    lines = [f"{'Transcript':40} {'Model':8} {'Chars':>9} {'~Input tok':>10} {'~Input $':>9}"]
+    for row in plan:
+        lines.append(
+            f"{row['transcript'][:40]:40} {row['model']:8} {row['chars']:>9} "
+            f"{row['input_tokens']:>10} {row['input_cost_usd']:>9.4f}"
+        )
+    total_tokens = sum(row["input_tokens"] for row in plan)
+    total_cost = sum(row["input_cost_usd"] for row in plan)
+    lines.append(f"{'TOTAL':40} {'':8} {'':>9} {total_tokens:>10} {total_cost:>9.4f}")
+    return "\n".join(lines)
+
+
+def _print_resume_savings(results: list[Any]) -> None:
+    saved = requests = 0
+    for qa_path in results:
+        if not isinstance(qa_path, Path):
+            continue
+        try:
+            payload = json.loads(qa_path.with_suffix(".usage.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        resume = payload.get("resume") or {}
+        saved += int(resume.get("input_tokens_saved") or 0)
+        requests += int(resume.get("requests") or 0)
+    print(f"Resume summaries saved ~{saved} input tokens over {requests} request(s).")
+
+
+def _run_manifest(args: argparse.Namespace, resume_text: str | None) -> None:
+    entries = load_manifest(args.manifest)
+    if not entries:
+        raise ValueError(f"Manifest is empty: {args.manifest}")
+
+    if args.dry_run:
+        resumes = asyncio.run(_load_resumes(entries))
+        plan = []
+        for entry in entries:
+            entry_resume = resumes[entry.resume] if entry.resume else resume_text
+            if isinstance(entry_resume, BaseException):
+                raise entry_resume
+            plan.extend(plan_runs([entry.transcript], resume_text=entry_resume, model=args.model))
+        print(format_plan(plan))
+        return
+
+    results = asyncio.run(
+        run_manifest_async(
+            entries,
+            model=args.model,
+            output_dir=args.output_dir,
+            resume_text=resume_text,
+            vacancy=args.vacancy,
+            language=args.language,
+            max_concurrency=max(1, args.concurrency or 16),
+            pipeline=args.pipeline,
+            lite=args.lite,
+            schema=args.schema,
+            reuse_answers=args.reuse_answers,
+            condense_resumes=args.condense_resume,
+        )
+    )
+    if args.condense_resume:
+        _print_resume_savings(results)
+    failures = [
+        (entry.transcript, result)
+        for entry, result in zip(entries, results)
+        if isinstance(result, BaseException)
+    ]
+    for transcript_path, error in failures:
+        print(f"Failed: {transcript_path}: {error}")
+    if failures:
+        raise SystemExit(1)
 
 
 def main() -> None:
@@ -175,36 +966,208 @@ def main() -> None:
     parser.add_argument(
         "--model",
         required=True,
-        choices=["5.2", "4.1", "o4-mini", "o3"],
-        help="LLM model alias.",
+        choices=["5.2", "4.1", "o4-mini", "o3", AUTO_MODEL],
+        help=f"LLM model alias ('{AUTO_MODEL}' routes per transcript: o4-mini, escalating to o3).",
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--transcript",
         type=Path,
-        required=True,
         help="Path to transcript file or directory with .txt files.",
     )
+    source.add_argument(
+        "--manifest",
+        type=Path,
+        help=(
+            "CSV (with header) or JSONL file mapping each transcript to its resume, vacancy "
+            "and language; --resume/--vacancy/--language become defaults for empty fields."
+        ),
+    )
+    parser.add_argument(
+        "--pipeline",
+        default=PIPELINE_SINGLE,
+        choices=PIPELINES,
+        help=(
+            "Extraction pipeline: one structured call, or a cheap segmentation call "
+            "followed by parallel per-question evaluation (default: single)."
+        ),
+    )
+    parser.add_argument(
+        "--lite",
+        action="store_true",
+        help=(
+            "Skip what_to_fix and ideal answers; generate them later per item with "
+            "python -m interview_insider.deep_dive."
+        ),
+    )
+    parser.add_argument(
+        "--schema",
+        default=None,
+        choices=SCHEMA_PROFILES,
+        help=(
+            "Output schema profile: minimal (question, timecode, one-sentence evaluation), "
+            "standard (same as --lite) or full (default)."
+        ),
+    )
+    parser.add_argument(
+        "--reuse-answers",
+        action="store_true",
+        help=(
+            "Fill missing ideal answers from the same question in earlier interviews "
+            "(marked with reused_from; not applied to the minimal schema)."
+        ),
+    )
+    parser.add_argument(
+        "--condense-resume",
+        action="store_true",
+        help=(
+            "Send a cached compact summary of each long resume instead of its full text "
+            "(see python -m interview_insider.resume_summary)."
+        ),
+    )
     parser.add_argument(
         "--output-dir",
         default="interview_insider/interview_insights",
         help="Directory for QA JSON outputs.",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Update existing outputs after transcripts were edited: re-extract only the items "
+            "whose transcript segments changed."
+        ),
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the planned runs with rough input token and cost estimates; no API calls.",
+    )
+    parser.add_argument(
+        "--claim",
+        action="store_true",
+        help=(
+            "Coordinate with other workers on a shared output dir: claim each transcript with a "
+            "lease, skip finished or claimed ones."
+        ),
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=DEFAULT_LEASE_SECONDS,
+        help=f"Claim lease; claims not heartbeated for this long are recovered (default: {DEFAULT_LEASE_SECONDS:.0f}).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Transcripts processed concurrently on one asyncio event loop (default: 1, or 16 with --manifest).",
+    )
     args = parser.parse_args()
+    if args.lite and args.schema:
+        parser.error("--lite is the same as --schema standard; pass only one of them")
+    if args.incremental:
+        if args.manifest:
+            parser.error("--incremental is not supported with --manifest")
+        if args.claim:
+            parser.error("--incremental is not supported with --claim")
+        if args.concurrency and args.concurrency > 1:
+            parser.error("--incremental is not supported with --concurrency above 1")
+    if args.claim and args.concurrency is not None:
+        parser.error("--concurrency is not supported with --claim")
 
     resume_text = extract_resume_text_from_file(args.resume)
+    if args.manifest:
+        _run_manifest(args, resume_text)
+        return
+
     transcript_files = _collect_transcript_files(args.transcript)
     if not transcript_files:
         raise FileNotFoundError(f"No transcript files found in {args.transcript}")
 
-    for transcript_path in transcript_files:
-        run_qa_extraction_for_file(
-            transcript_path=transcript_path,
+    if args.dry_run:
+        print(format_plan(plan_runs(transcript_files, resume_text=resume_text, model=args.model)))
+        return
+
+    resume_summary = None
+    if args.condense_resume:
+        resume_text, resume_summary = condense_resume(resume_text, output_dir=args.output_dir)
+
+    if args.claim:
+        results = run_qa_extractions_claimed(
+            transcript_files,
+            output_dir=args.output_dir,
+            lease_seconds=args.lease_seconds,
             resume_text=resume_text,
             model=args.model,
             vacancy=args.vacancy,
             language=args.language,
-            output_dir=args.output_dir,
+            pipeline=args.pipeline,
+            lite=args.lite,
+            schema=args.schema,
+            reuse_answers=args.reuse_answers,
+            resume_summary=resume_summary,
+        )
+        if resume_summary:
+            _print_resume_savings([result for _, result in results])
+        failures = [(path, result) for path, result in results if isinstance(result, BaseException)]
+        print(f"Processed {len(results) - len(failures)} transcript(s), {len(failures)} failed.")
+        for transcript_path, error in failures:
+            print(f"Failed: {transcript_path}: {error}")
+        if failures:
+            raise SystemExit(1)
+        return
+
+    if args.concurrency and args.concurrency > 1:
+        results = asyncio.run(
+            run_qa_extractions_async(
+                transcript_files,
+                max_concurrency=args.concurrency,
+                resume_text=resume_text,
+                model=args.model,
+                vacancy=args.vacancy,
+                language=args.language,
+                output_dir=args.output_dir,
+                pipeline=args.pipeline,
+                lite=args.lite,
+                schema=args.schema,
+                reuse_answers=args.reuse_answers,
+                resume_summary=resume_summary,
+            )
+        )
+        if resume_summary:
+            _print_resume_savings(results)
+        failures = [
+            (transcript_path, result)
+            for transcript_path, result in zip(transcript_files, results)
+            if isinstance(result, BaseException)
+        ]
+        for transcript_path, error in failures:
+            print(f"Failed: {transcript_path}: {error}")
+        if failures:
+            raise SystemExit(1)
+        return
+
+    results = []
+    for transcript_path in transcript_files:
+        results.append(
+            run_qa_extraction_for_file(
+                transcript_path=transcript_path,
+                resume_text=resume_text,
+                model=args.model,
+                vacancy=args.vacancy,
+                language=args.language,
+                output_dir=args.output_dir,
+                pipeline=args.pipeline,
+                lite=args.lite,
+                schema=args.schema,
+                reuse_answers=args.reuse_answers,
+                resume_summary=resume_summary,
+                incremental=args.incremental,
+            )
         )
+    if resume_summary:
+        _print_resume_savings(results)
 
 
 if __name__ == "__main__":
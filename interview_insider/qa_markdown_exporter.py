@@ -1,11 +1,15 @@
 ﻿from __future__ import annotations
 
+import argparse
 import json
 from pathlib import Path
 from typing import Any
 
+from interview_insider.segments import SEGMENTS_SUFFIX
+from interview_insider.storage import write_text_atomic
 
-def _normalize_list(value: Any) -> list[str]:
+
+def normalize_list(value: Any) -> list[str]:
     if value is None:
         return []
     if isinstance(value, list):
@@ -32,7 +36,7 @@ def qa_json_to_markdown(qa_json: dict[str, Any]) -> str:
         lines.append(f"**Role identified:** {role}")
         lines.append("")
 
-    stages = _normalize_list(qa_json.get("stages_of_conversation_short"))
+    stages = normalize_list(qa_json.get("stages_of_conversation_short"))
     if stages:
         lines.append("**Conversation stages:**")
         lines.extend(f"- {stage}" for stage in stages)
@@ -75,13 +79,13 @@ def qa_json_to_markdown(qa_json: dict[str, Any]) -> str:
             lines.append("**Key idea:**")
             lines.append(key_idea)
 
-        errors = _normalize_list(item.get("errors_and_problems"))
+        errors = normalize_list(item.get("errors_and_problems"))
         if errors:
             lines.append("")
             lines.append("**Issues:**")
             lines.extend(f"- {error}" for error in errors)
 
-        improvements = _normalize_list(item.get("what_to_fix"))
+        improvements = normalize_list(item.get("what_to_fix"))
         if improvements:
             lines.append("")
             lines.append("**How to improve the answer:**")
@@ -92,6 +96,12 @@ def qa_json_to_markdown(qa_json: dict[str, Any]) -> str:
         if ideal_ru or ideal_en:
             lines.append("")
             lines.append("**Ideal answer examples:**")
+            reused_from = item.get("reused_from")
+            if isinstance(reused_from, dict):
+                lines.append(
+                    f"*Reused from \"{reused_from.get('question') or ''}\" "
+                    f"({reused_from.get('source') or 'unknown file'}).*"
+                )
             lines.append("*RU:*")
             lines.append(f"> {ideal_ru or '—'}")
             lines.append("*EN:*")
@@ -107,10 +117,34 @@ def qa_json_to_markdown(qa_json: dict[str, Any]) -> str:
 def save_markdown_for_qa_json(qa_json: dict[str, Any], json_path: Path) -> Path:
     markdown_text = qa_json_to_markdown(qa_json)
     output_path = json_path.with_suffix(".md")
-    output_path.write_text(markdown_text, encoding="utf-8")
+    write_text_atomic(output_path, markdown_text)
     return output_path
 
 
 def save_markdown_for_qa_json_path(json_path: Path) -> Path:
     qa_json = json.loads(json_path.read_text(encoding="utf-8"))
     return save_markdown_for_qa_json(qa_json, json_path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Re-export Markdown for saved QA JSON file(s)."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="QA JSON files or directories with *.json outputs.",
+    )
+    args = parser.parse_args()
+
+    for path in args.paths:
+        json_paths = sorted(path.glob("*.json")) if path.is_dir() else [path]
+        for json_path in json_paths:
+            if json_path.name.endswith((".usage.json", SEGMENTS_SUFFIX)):
+                continue
+            print(save_markdown_for_qa_json_path(json_path))
+
+
+if __name__ == "__main__":
+    main()
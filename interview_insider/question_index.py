@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from interview_insider.storage import file_lock, write_json_atomic
+
+INDEX_DIRNAME = "_index"
+INDEX_FILENAME = "questions.json"
+INDEX_VERSION = 2
+REUSABLE_FIELDS = ("the_ideal_answer_example_eng", "the_ideal_answer_example_ru")
+DEFAULT_THRESHOLD = 0.85
+
+# Filler words two phrasings of one question may differ in. Any other
+# differing word ("LEFT" vs "RIGHT", "HAVING" vs "QUALIFY") makes it a
+# different question, however similar the rest is.
+_FILLER_WORDS = frozenset(
+    """
+    a an the is are was be do does did can could would should you your we i me my to of in on for
+    with and or vs versus between what whats how why when which please tell explain describe about
+    this that these those there it its give example examples some any
+    а в во и или ли что как зачем почему когда какой какая какие каких чем про о об на по с со для
+    между это этот эта эти ты вы вам тебе мне расскажите расскажи объясните объясни опишите опиши
+    приведите пример примеры можно можете есть
+    """.split()
+)
+_NUM_PERM = 32
+_BANDS = 8
+_ROWS = _NUM_PERM // _BANDS
+_EMPTY = (1 << 64) - 1
+_DENSIFY_OFFSET = 1 << 59
+
+
+def normalize_question(text: str) -> str:
+    text = re.sub(r"[^\w\s]", " ", str(text or "").lower())
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def index_key(vacancy: str | None, language: str | None) -> str:
+    return f"{normalize_question(vacancy or '') or 'unknown'}|{(language or 'unknown').strip().lower()}"
+
+
+def _shingles(normalized: str) -> set[str]:
+    # Whole words: character n-grams rate "LEFT JOIN vs INNER JOIN" and
+    # "RIGHT JOIN vs INNER JOIN" as near-duplicates.
+    return set(normalized.split())
+
+
+def _same_terms(left: set[str], right: set[str]) -> bool:
+    return (left ^ right) <= _FILLER_WORDS
+
+
+def _signature(shingles: set[str]) -> list[int]:
+    # One-permutation MinHash: a single hash per shingle picks the bin and the
+    # value, and empty bins borrow the next non-empty bin (rotation
+    # densification). Keeps signatures cheap enough for sub-millisecond lookups.
+    bins = [_EMPTY] * _NUM_PERM
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+        slot, value = value % _NUM_PERM, value // _NUM_PERM
+        if value < bins[slot]:
+            bins[slot] = value
+    if all(value == _EMPTY for value in bins):
+        return bins
+    signature = list(bins)
+    for slot in range(_NUM_PERM):
+        distance = 1
+        while signature[slot] == _EMPTY:
+            neighbour = bins[(slot + distance) % _NUM_PERM]
+            if neighbour != _EMPTY:
+                signature[slot] = neighbour + distance * _DENSIFY_OFFSET
+            distance += 1
+    return signature
+
+
+def _bands(signature: list[int]) -> list[tuple[int, ...]]:
+    return [tuple(signature[band * _ROWS : (band + 1) * _ROWS]) for band in range(_BANDS)]
+
+
+def _jaccard(left: set[str], right: set[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+@dataclass
+class QuestionMatch:
+    question: str
+    answers: dict[str, str]
+    similarity: float
+    source: str | None = None
+
+
+class QuestionIndex:
+    """MinHash/LSH index of interview questions, partitioned by vacancy and language.
+
+    Candidates come from LSH band collisions and are confirmed with the exact
+    Jaccard similarity of the questions' words, so a lookup touches only a
+    handful of entries regardless of index size. A match must also contain
+    the same words apart from filler (``_FILLER_WORDS``).
+    """
+
+    def __init__(self, *, threshold: float = DEFAULT_THRESHOLD) -> None:
+        self.threshold = threshold
+        self._entries: dict[str, list[dict[str, Any]]] = {}
+        self._buckets: dict[tuple[str, int, tuple[int, ...]], list[int]] = {}
+        self._shingle_cache: dict[tuple[str, int], set[str]] = {}
+        self.stats: dict[str, dict[str, int]] = {}
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def _stats_for(self, key: str) -> dict[str, int]:
+        return self.stats.setdefault(key, {"lookups": 0, "hits": 0, "added": 0})
+
+    def _insert(self, key: str, entry: dict[str, Any]) -> None:
+        entries = self._entries.setdefault(key, [])
+        entries.append(entry)
+        entry_id = len(entries) - 1
+        for band_index, band in enumerate(_bands(entry["signature"])):
+            self._buckets.setdefault((key, band_index, band), []).append(entry_id)
+
+    def _entry_shingles(self, key: str, entry_id: int) -> set[str]:
+        cached = self._shingle_cache.get((key, entry_id))
+        if cached is None:
+            cached = _shingles(self._entries[key][entry_id]["normalized"])
+            self._shingle_cache[(key, entry_id)] = cached
+        return cached
+
+    def _best_match(self, key: str, normalized: str, signature: list[int]) -> tuple[int, float] | None:
+        query_shingles = _shingles(normalized)
+        candidates: set[int] = set()
+        for band_index, band in enumerate(_bands(signature)):
+            candidates.update(self._buckets.get((key, band_index, band), ()))
+        best: tuple[int, float] | None = None
+        for entry_id in candidates:
+            entry_shingles = self._entry_shingles(key, entry_id)
+            if not _same_terms(query_shingles, entry_shingles):
+                continue
+            similarity = _jaccard(query_shingles, entry_shingles)
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (entry_id, similarity)
+        return best
+
+    def lookup(self, key: str, question: str) -> QuestionMatch | None:
+        normalized = normalize_question(question)
+        stats = self._stats_for(key)
+        stats["lookups"] += 1
+        self.dirty = True
+        if not normalized:
+            return None
+        best = self._best_match(key, normalized, _signature(_shingles(normalized)))
+        if best is None:
+            return None
+        stats["hits"] += 1
+        entry = self._entries[key][best[0]]
+        return QuestionMatch(
+            question=entry["question"],
+            answers=dict(entry["answers"]),
+            similarity=best[1],
+            source=entry.get("source"),
+        )
+
+    def add(self, key: str, question: str, answers: dict[str, Any], source: str | None = None) -> bool:
+        """Store the reusable answers for a question; near-duplicates are skipped."""
+        normalized = normalize_question(question)
+        answers = {field: str(answers.get(field) or "").strip() for field in REUSABLE_FIELDS}
+        if not normalized or not all(answers.values()):
+            return False
+        signature = _signature(_shingles(normalized))
+        if self._best_match(key, normalized, signature) is not None:
+            return False
+        self._insert(
+            key,
+            {
+                "question": question,
+                "normalized": normalized,
+                "signature": signature,
+                "answers": answers,
+                "source": source,
+            },
+        )
+        self._stats_for(key)["added"] += 1
+        self.dirty = True
+        return True
+
+    def add_items(self, key: str, items: list[Any], source: str | None = None) -> int:
+        # Reused answers already are in the index under their own question.
+        return sum(
+            1
+            for item in items
+            if isinstance(item, dict)
+            and not item.get("reused_from")
+            and self.add(key, str(item.get("question") or ""), item, source)
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": INDEX_VERSION,
+            "num_perm": _NUM_PERM,
+            "groups": self._entries,
+            "stats": self.stats,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], *, threshold: float = DEFAULT_THRESHOLD) -> "QuestionIndex":
+        index = cls(threshold=threshold)
+        current = data.get("version") == INDEX_VERSION and data.get("num_perm") == _NUM_PERM
+        for key, entries in (data.get("groups") or {}).items():
+            for entry in entries:
+                if not current:
+                    # Older indexes hashed character shingles; rehash the words.
+                    entry = {**entry, "signature": _signature(_shingles(entry.get("normalized") or ""))}
+                index._insert(key, entry)
+        index.stats = {key: dict(value) for key, value in (data.get("stats") or {}).items()}
+        return index
+
+
+def index_path(output_dir: str | Path) -> Path:
+    return Path(output_dir) / INDEX_DIRNAME / INDEX_FILENAME
+
+
+def load_question_index(output_dir: str | Path) -> QuestionIndex:
+    path = index_path(output_dir)
+    if not path.exists():
+        return QuestionIndex()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return QuestionIndex()
+    return QuestionIndex.from_dict(data if isinstance(data, dict) else {})
+
+
+def save_question_index(output_dir: str | Path, index: QuestionIndex) -> None:
+    path = index_path(output_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json_atomic(path, index.to_dict())
+    index.dirty = False
+
+
+def reuse_ideal_answers(
+    output_dir: str | Path,
+    items: list[Any],
+    *,
+    vacancy: str | None,
+    language: str | None,
+    source: str | None = None,
+) -> int:
+    """Fill missing ideal answers from near-duplicate questions, then index new ones.
+
+    Reused answers are marked with ``reused_from`` (the matched question,
+    its output file and the similarity) so they can be shown and rejected
+    with a deep dive. Returns the number of items whose ideal answers were
+    reused. Lookups, hits and additions are counted per vacancy/language in
+    the index stats.
+    """
+    items = [item for item in items if isinstance(item, dict)]
+    if not items:
+        return 0
+    key = index_key(vacancy, language)
+    path = index_path(output_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    reused = 0
+    with file_lock(path):
+        index = load_question_index(output_dir)
+        for item in items:
+            if all(str(item.get(field) or "").strip() for field in REUSABLE_FIELDS):
+                continue
+            match = index.lookup(key, str(item.get("question") or ""))
+            if match is None:
+                continue
+            item.update(match.answers)
+            item["reused_from"] = {
+                "question": match.question,
+                "source": match.source,
+                "similarity": round(match.similarity, 3),
+            }
+            reused += 1
+        index.add_items(key, items, source)
+        if index.dirty:
+            save_question_index(output_dir, index)
+    return reused
+
+
+def index_ideal_answers(
+    output_dir: str | Path,
+    items: list[Any],
+    *,
+    vacancy: str | None,
+    language: str | None,
+    source: str | None = None,
+) -> int:
+    """Add items with ideal answers to the index without counting lookups."""
+    path = index_path(output_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(path):
+        index = load_question_index(output_dir)
+        added = index.add_items(index_key(vacancy, language), items, source)
+        if index.dirty:
+            save_question_index(output_dir, index)
+    return added
+
+
+def hit_rate_summary(index: QuestionIndex) -> dict[str, int | float]:
+    lookups = sum(stats.get("lookups", 0) for stats in index.stats.values())
+    hits = sum(stats.get("hits", 0) for stats in index.stats.values())
+    return {
+        "questions": len(index),
+        "lookups": lookups,
+        "hits": hits,
+        "hit_rate": hits / lookups if lookups else 0.0,
+    }
+
+
+def format_stats(index: QuestionIndex) -> str:
+    lines = []
+    for key, stats in sorted(index.stats.items()):
+        lookups = stats.get("lookups", 0)
+        hits = stats.get("hits", 0)
+        rate = hits / lookups * 100 if lookups else 0.0
+        size = len(index._entries.get(key, []))
+        lines.append(f"{key}: {size} questions, {hits}/{lookups} hits ({rate:.1f}%)")
+    return "\n".join(lines) or "Index is empty."
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Inspect or rebuild the near-duplicate question index used to reuse ideal answers."
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="interview_insider/interview_insights",
+        help="Directory with QA JSON outputs.",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild the index from every saved *_qa.json with ideal answers.",
+    )
+    parser.add_argument(
+        "--query",
+        default=None,
+        help="Look up a question (requires --vacancy/--language to pick the partition).",
+    )
+    parser.add_argument("--vacancy", default=None, help="Vacancy partition for --query.")
+    parser.add_argument("--language", default="ru", help="Language partition for --query (default: ru).")
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    if args.rebuild:
+        index = QuestionIndex()
+        for json_path in sorted(output_dir.glob("*.json")):
+            if json_path.name.endswith(".usage.json"):
+                continue
+            try:
+                qa_json = json.loads(json_path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError):
+                continue
+            usage_path = json_path.with_suffix(".usage.json")
+            usage_payload: dict[str, Any] = {}
+            if usage_path.exists():
+                try:
+                    usage_payload = json.loads(usage_path.read_text(encoding="utf-8"))
+                except (json.JSONDecodeError, OSError):
+                    usage_payload = {}
+            key = index_key(
+                usage_payload.get("vacancy") or qa_json.get("vacancy"),
+                usage_payload.get("language") or "ru",
+            )
+            index.add_items(key, qa_json.get("items") or [], json_path.name)
+        save_question_index(output_dir, index)
+    else:
+        index = load_question_index(output_dir)
+
+    if args.query:
+        match = index.lookup(index_key(args.vacancy, args.language), args.query)
+        if match is None:
+            print("No near-duplicate found.")
+        else:
+            print(f"{match.similarity:.2f}  {match.question}  ({match.source})")
+    print(format_stats(index))
+
+
+__all__ = [
+    "DEFAULT_THRESHOLD",
+    "QuestionIndex",
+    "QuestionMatch",
+    "hit_rate_summary",
+    "index_ideal_answers",
+    "index_key",
+    "load_question_index",
+    "normalize_question",
+    "reuse_ideal_answers",
+    "save_question_index",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from interview_insider.llm_client import LLMClient
+from interview_insider.storage import write_json_atomic
+from interview_insider.usage_rollup import build_usage_record, record_usage
+
+RESUMES_DIRNAME = "_resumes"
+SUMMARY_VERSION = 1
+DEFAULT_SUMMARY_MODEL = "o4-mini"
+# Shorter resumes cost about as much to summarize as they would save.
+MIN_RESUME_CHARS = 2_000
+
+_SUMMARY_SECTIONS = (
+    ("skills", "Skills"),
+    ("experience", "Experience"),
+    ("projects", "Projects"),
+    ("education", "Education"),
+    ("languages", "Languages"),
+)
+
+_SUMMARY_LOCKS: dict[str, threading.Lock] = {}
+_SUMMARY_LOCKS_GUARD = threading.Lock()
+
+
+def resume_hash(resume_text: str) -> str:
+    normalized = " ".join(resume_text.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def summary_path(output_dir: str | Path, content_hash: str) -> Path:
+    return Path(output_dir) / RESUMES_DIRNAME / f"{content_hash[:32]}.json"
+
+
+def format_resume_summary(summary: dict[str, Any]) -> str:
+    """Render a ``ResumeSummary`` as the compact text sent in ``#RESUME``."""
+    lines = []
+    headline = " | ".join(
+        str(summary.get(key) or "").strip() for key in ("headline", "years_of_experience") if summary.get(key)
+    )
+    if headline:
+        lines.append(headline)
+    for key, label in _SUMMARY_SECTIONS:
+        values = [str(value).strip() for value in summary.get(key) or [] if str(value).strip()]
+        if not values:
+            continue
+        if key in ("skills", "languages"):
+            lines.append(f"{label}: {', '.join(values)}")
+        else:
+            lines.append(f"{label}:")
+            lines.extend(f"- {value}" for value in values)
+    return "\n".join(lines)
+
+
+def _summary_lock(content_hash: str) -> threading.Lock:
+    with _SUMMARY_LOCKS_GUARD:
+        return _SUMMARY_LOCKS.setdefault(content_hash, threading.Lock())
+
+
+def load_resume_summary(output_dir: str | Path, content_hash: str) -> dict[str, Any] | None:
+    try:
+        cached = json.loads(summary_path(output_dir, content_hash).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if cached.get("version") != SUMMARY_VERSION or cached.get("hash") != content_hash:
+        return None
+    return cached
+
+
+def condense_resume(
+    resume_text: str | None,
+    *,
+    output_dir: str | Path,
+    llm_client: LLMClient | None = None,
+    model: str = DEFAULT_SUMMARY_MODEL,
+    min_chars: int = MIN_RESUME_CHARS,
+) -> tuple[str | None, dict[str, Any] | None]:
+    """Return the compact summary to send instead of ``resume_text``, and its metadata.
+
+    Summaries are made once per resume content hash and cached in
+    ``<output_dir>/_resumes/``; the one-off summarization call is added to
+    the usage rollup. Resumes shorter than ``min_chars`` are returned
+    unchanged with ``None`` metadata. The metadata (``hash``, ``raw_chars``,
+    ``summary_chars``, ``cached``) is passed to the extraction so its
+    ``.usage.json`` records the input tokens saved.
+    """
+    if not resume_text or len(resume_text) < min_chars:
+        return resume_text, None
+    content_hash = resume_hash(resume_text)
+    summary_path(output_dir, content_hash).parent.mkdir(parents=True, exist_ok=True)
+    cached_summary = load_resume_summary(output_dir, content_hash)
+    cached = cached_summary is not None
+    if cached_summary is None:
+        # Concurrent runs for one candidate in this process wait for a
+        # single summarization call and then read its result.
+        with _summary_lock(content_hash):
+            cached_summary = load_resume_summary(output_dir, content_hash)
+            cached = cached_summary is not None
+            if cached_summary is None:
+                cached_summary = _summarize(resume_text, content_hash, output_dir=output_dir, llm_client=llm_client, model=model)
+    text = cached_summary["text"]
+    if len(text) >= len(resume_text):
+        return resume_text, None
+    return text, {
+        "hash": content_hash,
+        "model": cached_summary.get("model"),
+        "raw_chars": len(resume_text),
+        "summary_chars": len(text),
+        "cached": cached,
+    }
+
+
+def _summarize(
+    resume_text: str,
+    content_hash: str,
+    *,
+    output_dir: str | Path,
+    llm_client: LLMClient | None,
+    model: str,
+) -> dict[str, Any]:
+    from interview_insider.prompts.extracton_models_and_prompts import ResumeSummary, prompt_resume_summarizer
+
+    llm_client = llm_client or LLMClient()
+    summary, usage = llm_client.call_structured_llm(
+        system_prompt=prompt_resume_summarizer,
+        user_message=f"#RESUME: {resume_text}",
+        model=model,
+        response_model=ResumeSummary,
+    )
+    summary_json = summary.model_dump()
+    payload = {
+        "version": SUMMARY_VERSION,
+        "hash": content_hash,
+        "model": model,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "summary": summary_json,
+        "text": format_resume_summary(summary_json),
+        "raw_chars": len(resume_text),
+        "usage": usage,
+    }
+    write_json_atomic(summary_path(output_dir, content_hash), payload)
+    record_usage(
+        output_dir,
+        f"{RESUMES_DIRNAME}/{content_hash[:32]}",
+        build_usage_record(usage=usage, model=model, vacancy=None),
+    )
+    return payload
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Condense a resume into the cached compact summary sent with extractions."
+    )
+    parser.add_argument(
+        "--resume",
+        type=Path,
+        required=True,
+        help="Path to resume file (.pdf/.txt/.md).",
+    )
+    parser.add_argument(
+        "--model",
+        default=DEFAULT_SUMMARY_MODEL,
+        help=f"Model alias for the summary (default: {DEFAULT_SUMMARY_MODEL}).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="interview_insider/interview_insights",
+        help="Directory for QA JSON outputs (summaries are cached in its _resumes folder).",
+    )
+    args = parser.parse_args()
+
+    from interview_insider.qa_extractor import extract_resume_text_from_file
+
+    resume_text = extract_resume_text_from_file(args.resume)
+    text, meta = condense_resume(resume_text, output_dir=args.output_dir, model=args.model, min_chars=0)
+    print(text or "")
+    if meta:
+        state = "cached" if meta["cached"] else "new"
+        print(f"\n[{state} summary: {meta['raw_chars']} -> {meta['summary_chars']} chars]")
+
+
+__all__ = [
+    "DEFAULT_SUMMARY_MODEL",
+    "MIN_RESUME_CHARS",
+    "RESUMES_DIRNAME",
+    "condense_resume",
+    "format_resume_summary",
+    "load_resume_summary",
+    "resume_hash",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from interview_insider.llm_client import AsyncLLMClient, LLMClient, StructuredOutputError
+from interview_insider.usage_rollup import extract_usage_numbers, merge_usage
+
+DEFAULT_MAX_CONTINUATIONS = 2
+HEADER_FIELDS = ("vacancy", "employee_role_identified", "stages_of_conversation_short")
+
+_ITEMS_RE = re.compile(r'"items"\s*:\s*\[')
+_SEPARATORS = " \t\r\n,"
+
+
+def _validate_item(item: Any, response_model: Any) -> dict[str, Any] | None:
+    if not isinstance(item, dict):
+        return None
+    try:
+        validated = response_model.model_validate(
+            {"vacancy": None, "employee_role_identified": "", "stages_of_conversation_short": [], "items": [item]}
+        )
+    except ValueError:
+        return None
+    return validated.model_dump()["items"][0]
+
+
+def salvage_partial_extraction(raw_text: str, response_model: Any) -> dict[str, Any]:
+    """Recover header fields and every complete, schema-valid item from raw output.
+
+    The output is read like a stream: header values and items are decoded
+    one JSON value at a time, stopping at the first truncated or malformed
+    item. Returns ``{"header": {...}, "items": [...], "chars": n}`` where
+    ``chars`` is how much of the raw text the recovered items span.
+    """
+    decoder = json.JSONDecoder()
+    header: dict[str, Any] = {}
+    for name in HEADER_FIELDS:
+        match = re.search(rf'"{name}"\s*:\s*', raw_text)
+        if not match:
+            continue
+        try:
+            header[name], _ = decoder.raw_decode(raw_text, match.end())
+        except ValueError:
+            continue
+
+    items: list[dict[str, Any]] = []
+    chars = 0
+    match = _ITEMS_RE.search(raw_text)
+    if match:
+        position = match.end()
+        while True:
+            while position < len(raw_text) and raw_text[position] in _SEPARATORS:
+                position += 1
+            if position >= len(raw_text) or raw_text[position] != "{":
+                break
+            try:
+                item, end = decoder.raw_decode(raw_text, position)
+            except ValueError:
+                break
+            validated = _validate_item(item, response_model)
+            if validated is None:
+                break
+            items.append(validated)
+            chars += end - position
+            position = end
+    return {"header": header, "items": items, "chars": chars}
+
+
+def _normalize_question(question: Any) -> str:
+    return " ".join(str(question or "").lower().split())
+
+
+def _tail_start(transcript_text: str, item: dict[str, Any]) -> int:
+    """Where the transcript should resume: at the last recovered question."""
+    for needle in (str(item.get("timecode") or "").strip(), str(item.get("place_in_the_text") or "").strip()):
+        if needle:
+            position = transcript_text.rfind(needle)
+            if position >= 0:
+                return transcript_text.rfind("\n", 0, position) + 1
+    return 0
+
+
+@dataclass
+class _SalvageRun:
+    """Bookkeeping shared by the sync and async salvage loops."""
+
+    user_message: str
+    transcript_text: str
+    resume_text: str | None
+    model: str
+    items: list[dict[str, Any]] = field(default_factory=list)
+    header: dict[str, Any] = field(default_factory=dict)
+    attempts: list[dict[str, Any]] = field(default_factory=list)
+    total_usage: dict[str, Any] = field(default_factory=dict)
+    recovered_output_tokens: float = 0.0
+    failures: int = 0
+    complete: bool = True
+    result: dict[str, Any] | None = None
+
+    def message(self) -> str:
+        if not self.items:
+            return self.user_message
+        last = self.items[-1]
+        done = "\n".join(f"- {item.get('question')}" for item in self.items)
+        tail = self.transcript_text[_tail_start(self.transcript_text, last) :]
+        return (
+            f"#RESUME: {self.resume_text or ''}\n"
+            f"#CONTINUATION: an earlier response was cut off. These questions are already extracted; "
+            f"do not repeat them and continue after the last one ({last.get('timecode') or '?'}):\n{done}\n"
+            f"#INTERVIEW TRANSCRIPTION (from {last.get('timecode') or 'the last question'}): {tail}"
+        )
+
+    def _merge(self, header: dict[str, Any], items: list[dict[str, Any]]) -> int:
+        for name in HEADER_FIELDS:
+            if not self.header.get(name) and header.get(name):
+                self.header[name] = header[name]
+        seen = {_normalize_question(item.get("question")) for item in self.items}
+        added = 0
+        for item in items:
+            key = _normalize_question(item.get("question"))
+            if key in seen:
+                continue
+            seen.add(key)
+            self.items.append(item)
+            added += 1
+        return added
+
+    def record_error(self, exc: StructuredOutputError, response_model: Any) -> bool:
+        """Salvage a failed response; return True when a continuation makes sense."""
+        self.total_usage = merge_usage(self.total_usage, exc.usage)
+        partial = salvage_partial_extraction(exc.raw_text, response_model)
+        recovered = self._merge(partial["header"], partial["items"])
+        output_tokens = extract_usage_numbers(exc.usage).get("output_tokens", 0)
+        if exc.raw_text:
+            self.recovered_output_tokens += output_tokens * partial["chars"] / len(exc.raw_text)
+        self.failures += 1
+        self.attempts.append(
+            {
+                "model": self.model,
+                "phase": "continuation" if len(self.attempts) else "extract",
+                "problems": [f"{exc}; recovered {recovered} item(s)"],
+                "usage": exc.usage,
+            }
+        )
+        return recovered > 0
+
+    def record_result(self, result: dict[str, Any], usage: dict[str, Any]) -> None:
+        self.result = result
+        self.total_usage = merge_usage(self.total_usage, usage)
+        self._merge({name: result.get(name) for name in HEADER_FIELDS}, result.get("items") or [])
+        self.attempts.append(
+            {"model": self.model, "phase": "continuation" if self.attempts else "extract", "problems": [], "usage": usage}
+        )
+
+    def finish(self) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any] | None]:
+        if not self.failures and self.result is not None:
+            return self.result, self.total_usage, None
+        result = {
+            "vacancy": self.header.get("vacancy"),
+            "employee_role_identified": self.header.get("employee_role_identified") or "",
+            "stages_of_conversation_short": self.header.get("stages_of_conversation_short") or [],
+            "items": self.items,
+        }
+        # Without salvage every failure would have been a full rerun that
+        # re-sends the whole transcript and regenerates the recovered items.
+        full_input = extract_usage_numbers(self.attempts[0]["usage"]).get("input_tokens", 0)
+        continuation_input = sum(
+            extract_usage_numbers(attempt["usage"]).get("input_tokens", 0) for attempt in self.attempts[1:]
+        )
+        input_saved = max(0, full_input * self.failures - continuation_input)
+        output_saved = int(self.recovered_output_tokens)
+        routing = {
+            "mode": "salvage",
+            "served_by": self.model,
+            "attempts": self.attempts,
+            "salvage": {
+                "failures": self.failures,
+                "complete": self.complete,
+                "recovered_items": len(self.items),
+                "input_tokens_saved": input_saved,
+                "output_tokens_saved_estimate": output_saved,
+                "tokens_saved": input_saved + output_saved,
+            },
+        }
+        return result, self.total_usage, routing
+
+
+def extract_qa_json_salvaging(
+    llm_client: LLMClient,
+    *,
+    system_prompt: str,
+    user_message: str,
+    transcript_text: str,
+    resume_text: str | None,
+    model: str,
+    response_model: Any,
+    max_continuations: int = DEFAULT_MAX_CONTINUATIONS,
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any] | None]:
+    """``extract_qa_json`` that survives truncated or schema-invalid output.
+
+    ``user_message`` is sent first. When a response has no parsed output,
+    the valid items in its raw text are kept and only the rest of the transcript (from the last recovered
+    question on) is requested again, up to ``max_continuations`` times. The
+    system prompt stays identical so it is served from the prompt cache.
+    Returns the result, the total usage and a ``routing`` dict with salvage
+    metrics (``None`` when the first call succeeded). When continuations run
+    out or stop yielding new items, the items recovered so far are returned
+    with ``routing["salvage"]["complete"]`` set to False; the original error
+    is raised only when nothing could be recovered.
+    """
+    run = _SalvageRun(
+        user_message=user_message,
+        transcript_text=transcript_text,
+        resume_text=resume_text,
+        model=model,
+    )
+    for _ in range(max_continuations + 1):
+        try:
+            result, usage = llm_client.extract_qa_json(
+                system_prompt=system_prompt,
+                user_message=run.message(),
+                model=model,
+                response_model=response_model,
+            )
+        except StructuredOutputError as exc:
+            if run.record_error(exc, response_model) and len(run.attempts) <= max_continuations:
+                continue
+            if not run.items:
+                raise
+            run.complete = False
+            break
+        run.record_result(result, usage)
+        break
+    return run.finish()
+
+
+async def extract_qa_json_salvaging_async(
+    llm_client: AsyncLLMClient,
+    *,
+    system_prompt: str,
+    user_message: str,
+    transcript_text: str,
+    resume_text: str | None,
+    model: str,
+    response_model: Any,
+    max_continuations: int = DEFAULT_MAX_CONTINUATIONS,
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any] | None]:
+    """Async ``extract_qa_json_salvaging``."""
+    run = _SalvageRun(
+        user_message=user_message,
+        transcript_text=transcript_text,
+        resume_text=resume_text,
+        model=model,
+    )
+    for _ in range(max_continuations + 1):
+        try:
+            result, usage = await llm_client.extract_qa_json(
+                system_prompt=system_prompt,
+                user_message=run.message(),
+                model=model,
+                response_model=response_model,
+            )
+        except StructuredOutputError as exc:
+            if run.record_error(exc, response_model) and len(run.attempts) <= max_continuations:
+                continue
+            if not run.items:
+                raise
+            run.complete = False
+            break
+        run.record_result(result, usage)
+        break
+    return run.finish()
+
+
+__all__ = [
+    "DEFAULT_MAX_CONTINUATIONS",
+    "extract_qa_json_salvaging",
+    "extract_qa_json_salvaging_async",
+    "salvage_partial_extraction",
+]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Any
+
+SCHEMA_MINIMAL = "minimal"
+SCHEMA_STANDARD = "standard"
+SCHEMA_FULL = "full"
+SCHEMA_PROFILES = (SCHEMA_MINIMAL, SCHEMA_STANDARD, SCHEMA_FULL)
+
+# Per-item fields each profile asks the model to generate. ``standard`` is
+# what ``lite`` runs produce; its missing fields can be filled later with
+# ``deep_dive``.
+SCHEMA_ITEM_FIELDS = {
+    SCHEMA_MINIMAL: ("question", "timecode", "place_in_the_text", "short_candidate_answer_evaluation"),
+    SCHEMA_STANDARD: (
+        "question",
+        "timecode",
+        "place_in_the_text",
+        "candidates_answer",
+        "short_candidate_answer_evaluation",
+        "errors_and_problems",
+        "key_idea",
+    ),
+    SCHEMA_FULL: (
+        "question",
+        "timecode",
+        "place_in_the_text",
+        "candidates_answer",
+        "short_candidate_answer_evaluation",
+        "errors_and_problems",
+        "what_to_fix",
+        "the_ideal_answer_example_eng",
+        "the_ideal_answer_example_ru",
+        "key_idea",
+    ),
+}
+SCHEMA_DESCRIPTIONS = {
+    SCHEMA_MINIMAL: "quick screening: question, timecode and a one-sentence evaluation",
+    SCHEMA_STANDARD: "answers, evaluations, errors and key ideas; no fixes or ideal answers (same as --lite)",
+    SCHEMA_FULL: "everything, including fixes and bilingual ideal answers",
+}
+
+
+def resolve_schema(schema: str | None, *, lite: bool = False) -> str:
+    """The profile to extract with; ``lite`` is the older spelling of ``standard``."""
+    if schema is None:
+        return SCHEMA_STANDARD if lite else SCHEMA_FULL
+    if schema not in SCHEMA_PROFILES:
+        raise ValueError(f"Unsupported schema '{schema}'. Supported: {', '.join(SCHEMA_PROFILES)}")
+    return schema
+
+
+def schema_of_payload(usage_payload: dict[str, Any]) -> str:
+    """The profile recorded in a ``.usage.json`` (older files only have ``lite``)."""
+    return usage_payload.get("schema") or (SCHEMA_STANDARD if usage_payload.get("lite") else SCHEMA_FULL)
+
+
+def extraction_model(schema: str) -> Any:
+    from interview_insider.prompts import extracton_models_and_prompts as prompts
+
+    return {
+        SCHEMA_MINIMAL: prompts.QAExtractionMinimal,
+        SCHEMA_STANDARD: prompts.QAExtractionLite,
+        SCHEMA_FULL: prompts.QAExtraction,
+    }[schema]
+
+
+def evaluation_model(schema: str) -> Any:
+    """Per-item response model of the two-phase pipeline's evaluation calls."""
+    from interview_insider.prompts import extracton_models_and_prompts as prompts
+
+    return {
+        SCHEMA_MINIMAL: prompts.QAItemEvaluationMinimal,
+        SCHEMA_STANDARD: prompts.QAItemEvaluationLite,
+        SCHEMA_FULL: prompts.QAItemEvaluation,
+    }[schema]
+
+
+def extractor_prompt(schema: str) -> str:
+    """System prompt template (``{vacancy}``, ``{language}``) of single-call extraction."""
+    from interview_insider.prompts import extracton_models_and_prompts as prompts
+
+    return prompts.prompt_QA_screener if schema == SCHEMA_MINIMAL else prompts.prompt_QA_extractor
+
+
+__all__ = [
+    "SCHEMA_DESCRIPTIONS",
+    "SCHEMA_FULL",
+    "SCHEMA_ITEM_FIELDS",
+    "SCHEMA_MINIMAL",
+    "SCHEMA_PROFILES",
+    "SCHEMA_STANDARD",
+    "evaluation_model",
+    "extraction_model",
+    "extractor_prompt",
+    "resolve_schema",
+    "schema_of_payload",
+]
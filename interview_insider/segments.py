@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any
+
+SEGMENTS_DIRNAME = "_segments"
+SEGMENTS_SUFFIX = ".segments.json"
+SEGMENTS_VERSION = 1
+MAX_SEGMENT_CHARS = 2_000
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?…])\s+")
+
+
+def split_segments(transcript_text: str, max_chars: int = MAX_SEGMENT_CHARS) -> list[str]:
+    """Split a transcript into content-defined segments: lines, and sentences of long lines.
+
+    Boundaries depend only on the text around them, so fixing a word keeps
+    every other segment (and its hash) unchanged.
+    """
+    segments: list[str] = []
+    for line in transcript_text.split("\n"):
+        if len(line) <= max_chars:
+            segments.append(line)
+            continue
+        current = ""
+        for sentence in _SENTENCE_END_RE.split(line):
+            if current and len(current) + len(sentence) + 1 > max_chars:
+                segments.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        segments.append(current)
+    return segments
+
+
+def segment_hash(segment: str) -> str:
+    normalized = " ".join(segment.split())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def segments_path(qa_path: Path) -> Path:
+    """Segment index of ``qa_path``, kept in ``_segments/`` so ``*.json`` globs over outputs skip it."""
+    return qa_path.parent / SEGMENTS_DIRNAME / (qa_path.stem + SEGMENTS_SUFFIX)
+
+
+def legacy_segments_path(qa_path: Path) -> Path:
+    """Where segment indexes were written before ``_segments/``: next to the QA JSON."""
+    return qa_path.with_name(qa_path.stem + SEGMENTS_SUFFIX)
+
+
+def _locate(segments: list[str], item: dict[str, Any], start: int, stop: int) -> int | None:
+    needles = [
+        str(item.get("timecode") or "").strip(),
+        str(item.get("place_in_the_text") or "").strip()[:80],
+    ]
+    for needle in needles:
+        if not needle:
+            continue
+        for index in range(start, stop):
+            if needle in segments[index]:
+                return index
+    return None
+
+
+def locate_items(
+    segments: list[str],
+    items: list[dict[str, Any]],
+    *,
+    start: int = 0,
+    stop: int | None = None,
+) -> list[int]:
+    """Index of the segment each item starts at, searching forward in order.
+
+    Items are located by timecode, then by the quoted ``place_in_the_text``;
+    an item that cannot be found starts where the previous one did.
+    """
+    stop = len(segments) if stop is None else stop
+    starts = []
+    position = start
+    for item in items:
+        found = _locate(segments, item, position, stop)
+        if found is not None:
+            position = found
+        starts.append(position)
+    return starts
+
+
+def build_segment_index(transcript_text: str, items: list[dict[str, Any]]) -> dict[str, Any]:
+    """The per-segment hashes and item start segments saved next to a QA JSON."""
+    segments = split_segments(transcript_text)
+    item_starts = locate_items(segments, [item for item in items if isinstance(item, dict)])
+    return {
+        "version": SEGMENTS_VERSION,
+        "hashes": [segment_hash(segment) for segment in segments],
+        "item_starts": item_starts,
+    }
+
+
+@dataclass(frozen=True)
+class Region:
+    """A run of items whose transcript changed, to be re-extracted as one excerpt.
+
+    ``items`` is the slice of old items to replace; ``segments`` is the
+    matching slice of the new transcript's segments.
+    """
+
+    items: tuple[int, int]
+    segments: tuple[int, int]
+
+
+def _map_boundary(opcodes: list[tuple[str, int, int, int, int]], position: int, *, end: bool = False) -> int:
+    """New-transcript position of an old segment boundary.
+
+    Text inserted at a boundary belongs to the item before it (see
+    ``plan_regions``), so an ``end`` boundary is moved past such an insert.
+    """
+    if end:
+        for tag, i1, _, _, j2 in opcodes:
+            if tag == "insert" and i1 == position:
+                return j2
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal" and i1 <= position <= i2:
+            return j1 + position - i1
+        if position == i1:
+            return j1
+        if position == i2:
+            return j2
+    return opcodes[-1][4] if opcodes else 0
+
+
+def plan_regions(index: dict[str, Any], new_segments: list[str]) -> list[Region]:
+    """Diff the saved segment hashes against a new transcript.
+
+    Each item owns the segments from its start to the next item's start
+    (the first item also owns everything before it). An item is dirty when
+    one of its segments changed or was removed, or text was inserted after
+    one of them. Adjacent dirty items are merged into one ``Region``.
+    """
+    old_hashes = list(index.get("hashes") or [])
+    starts = list(index.get("item_starts") or [])
+    if not starts:
+        return []
+    new_hashes = [segment_hash(segment) for segment in new_segments]
+    opcodes = SequenceMatcher(None, old_hashes, new_hashes, autojunk=False).get_opcodes()
+    spans = [
+        (0 if number == 0 else start, starts[number + 1] if number + 1 < len(starts) else len(old_hashes))
+        for number, start in enumerate(starts)
+    ]
+    dirty = [False] * len(spans)
+    for tag, i1, i2, _, _ in opcodes:
+        if tag == "equal":
+            continue
+        for number, (begin, end) in enumerate(spans):
+            if i1 < i2 and i1 < end and begin < i2:
+                dirty[number] = True
+            elif i1 == i2 and (begin < i1 <= end if i1 else number == 0):
+                dirty[number] = True
+    # An item that could not be located owns no segments of its own; it
+    # goes with the item it was merged into.
+    for number in range(len(spans) - 2, -1, -1):
+        if spans[number][0] == spans[number][1] and dirty[number + 1]:
+            dirty[number] = True
+    regions: list[Region] = []
+    number = 0
+    while number < len(spans):
+        if not dirty[number]:
+            number += 1
+            continue
+        first = number
+        while number < len(spans) and dirty[number]:
+            number += 1
+        begin, end = spans[first][0], spans[number - 1][1]
+        regions.append(
+            Region(
+                items=(first, number),
+                segments=(_map_boundary(opcodes, begin), _map_boundary(opcodes, end, end=True)),
+            )
+        )
+    return regions
+
+
+__all__ = [
+    "MAX_SEGMENT_CHARS",
+    "Region",
+    "SEGMENTS_DIRNAME",
+    "SEGMENTS_SUFFIX",
+    "build_segment_index",
+    "legacy_segments_path",
+    "locate_items",
+    "plan_regions",
+    "segment_hash",
+    "segments_path",
+    "split_segments",
+]
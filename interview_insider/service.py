@@ -0,0 +1,442 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import re
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from interview_insider.llm_client import AUTO_MODEL, LLMClient
+from interview_insider.qa_extractor import PIPELINE_SINGLE, PIPELINES, run_qa_extraction
+from interview_insider.schema_profiles import resolve_schema
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8503
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_QUEUED = 64
+DEFAULT_MAX_JOBS = 1000
+MAX_BODY_BYTES = 64 * 1024 * 1024
+TOKEN_ENV = "INTERVIEW_INSIGHTS_API_TOKEN"
+MODELS = ("5.2", "4.1", "o4-mini", "o3", AUTO_MODEL)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+# Request fields that determine the extraction result and where it is
+# saved; equal values are de-duplicated onto one job.
+_KEY_FIELDS = ("transcript_text", "resume_text", "vacancy", "language", "model", "pipeline", "schema", "output_name")
+# Dropped from a job's request once it finishes; finished jobs are kept
+# for status and results only.
+_TEXT_FIELDS = ("transcript_text", "resume_text")
+_OUTPUT_NAME_RE = re.compile(r"^[\w.\-]+\.json$")
+
+
+class QueueFullError(RuntimeError):
+    pass
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def normalize_job_request(payload: Any) -> dict[str, Any]:
+    """Validate a job submission and fill defaults; raises ``ValueError``."""
+    if not isinstance(payload, dict):
+        raise ValueError("Request body must be a JSON object.")
+    transcript_text = str(payload.get("transcript_text") or "").strip()
+    if not transcript_text:
+        raise ValueError("'transcript_text' is required.")
+    model = payload.get("model") or AUTO_MODEL
+    if model not in MODELS:
+        raise ValueError(f"Unsupported model '{model}'. Supported: {', '.join(MODELS)}")
+    pipeline = payload.get("pipeline") or PIPELINE_SINGLE
+    if pipeline not in PIPELINES:
+        raise ValueError(f"Unsupported pipeline '{pipeline}'. Supported: {', '.join(PIPELINES)}")
+    output_name = payload.get("output_name")
+    if output_name is not None and not _OUTPUT_NAME_RE.match(str(output_name)):
+        raise ValueError("'output_name' must be a plain file name ending in .json.")
+    return {
+        "transcript_text": transcript_text,
+        "resume_text": str(payload.get("resume_text") or "").strip() or None,
+        "vacancy": str(payload.get("vacancy") or "").strip() or None,
+        "language": str(payload.get("language") or "ru"),
+        "model": model,
+        "pipeline": pipeline,
+        "schema": resolve_schema(payload.get("schema") or None, lite=bool(payload.get("lite"))),
+        "output_name": output_name,
+    }
+
+
+def job_key(request: dict[str, Any]) -> str:
+    canonical = json.dumps({name: request.get(name) for name in _KEY_FIELDS}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class Job:
+    job_id: str
+    key: str
+    request: dict[str, Any]
+    status: str = STATUS_QUEUED
+    stage: str | None = None
+    created_at: str = field(default_factory=_now)
+    started_at: str | None = None
+    finished_at: str | None = None
+    error: str | None = None
+    output: str | None = None
+    items: list[dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "stage": self.stage,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "output": self.output,
+            "items_ready": len(self.items),
+        }
+
+
+class JobManager:
+    """In-memory job registry running extractions on a bounded thread pool.
+
+    At most ``workers`` extractions run at once and at most ``max_queued``
+    wait; beyond that ``submit`` raises ``QueueFullError``. Submissions equal
+    to a queued, running or finished job (see ``job_key``) return that job.
+    Finished jobs keep no transcript or resume text, and the oldest are
+    forgotten beyond ``max_jobs``; their output files stay in ``output_dir``.
+    """
+
+    def __init__(
+        self,
+        *,
+        output_dir: str | Path,
+        workers: int = DEFAULT_WORKERS,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+        max_jobs: int = DEFAULT_MAX_JOBS,
+        llm_client: LLMClient | None = None,
+        extract: Callable[..., Path] = run_qa_extraction,
+    ) -> None:
+        self.output_dir = Path(output_dir)
+        self.max_queued = max_queued
+        self.max_jobs = max_jobs
+        self._llm_client = llm_client
+        self._extract = extract
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="qa-job")
+        self._jobs: dict[str, Job] = {}
+        self._by_key: dict[str, str] = {}
+        self._condition = threading.Condition()
+
+    def _llm(self) -> LLMClient:
+        # One client (and connection pool) shared by every job.
+        with self._condition:
+            if self._llm_client is None:
+                self._llm_client = LLMClient()
+            return self._llm_client
+
+    def counts(self) -> dict[str, int]:
+        with self._condition:
+            counts = {status: 0 for status in (*ACTIVE_STATUSES, STATUS_DONE, STATUS_FAILED)}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return counts
+
+    def submit(self, request: dict[str, Any]) -> tuple[Job, bool]:
+        """Queue ``request``; returns the job and whether it was de-duplicated."""
+        key = job_key(request)
+        with self._condition:
+            existing = self._jobs.get(self._by_key.get(key, ""))
+            if existing is not None and existing.status != STATUS_FAILED:
+                return existing, True
+            queued = sum(1 for job in self._jobs.values() if job.status == STATUS_QUEUED)
+            if queued >= self.max_queued:
+                raise QueueFullError(f"Too many queued jobs ({queued}).")
+            job = Job(job_id=uuid.uuid4().hex, key=key, request=request)
+            self._jobs[job.job_id] = job
+            self._by_key[key] = job.job_id
+            self._evict()
+        self._executor.submit(self._run, job)
+        return job, False
+
+    def _evict(self) -> None:
+        finished = [job for job in self._jobs.values() if job.status not in ACTIVE_STATUSES]
+        for job in finished[: max(0, len(self._jobs) - self.max_jobs)]:
+            del self._jobs[job.job_id]
+            if self._by_key.get(job.key) == job.job_id:
+                del self._by_key[job.key]
+
+    def get(self, job_id: str) -> Job | None:
+        with self._condition:
+            return self._jobs.get(job_id)
+
+    def _update(self, job: Job, **changes: Any) -> None:
+        with self._condition:
+            for name, value in changes.items():
+                setattr(job, name, value)
+            self._condition.notify_all()
+
+    def _add_item(self, job: Job, item: dict[str, Any]) -> None:
+        with self._condition:
+            job.items.append(item)
+            self._condition.notify_all()
+
+    def _run(self, job: Job) -> None:
+        self._update(job, status=STATUS_RUNNING, started_at=_now())
+        request = job.request
+        try:
+            output_path = self._extract(
+                transcript_text=request["transcript_text"],
+                resume_text=request["resume_text"],
+                model=request["model"],
+                vacancy=request["vacancy"],
+                language=request["language"],
+                output_dir=self.output_dir,
+                output_name=request["output_name"] or f"job_{job.job_id}_qa.json",
+                stage_callback=lambda stage, *_: self._update(job, stage=stage),
+                pipeline=request["pipeline"],
+                schema=request["schema"],
+                llm_client=self._llm(),
+                item_callback=lambda item: self._add_item(job, item),
+            )
+        except Exception as exc:
+            changes = {"status": STATUS_FAILED, "error": f"{type(exc).__name__}: {exc}"}
+        else:
+            changes = {"status": STATUS_DONE, "output": str(output_path)}
+        released = {name: value for name, value in request.items() if name not in _TEXT_FIELDS}
+        self._update(job, request=released, finished_at=_now(), **changes)
+
+    def result(self, job: Job) -> dict[str, Any]:
+        return json.loads(Path(job.output or "").read_text(encoding="utf-8"))
+
+    def iter_items(self, job: Job, *, poll_seconds: float = 15.0) -> Iterator[dict[str, Any] | None]:
+        """Yield items as they arrive until the job finishes.
+
+        ``None`` is yielded when ``poll_seconds`` pass without news, so a
+        streaming caller can send a keep-alive.
+        """
+        sent = 0
+        while True:
+            with self._condition:
+                if len(job.items) <= sent and job.status in ACTIVE_STATUSES:
+                    self._condition.wait(poll_seconds)
+                batch = job.items[sent:]
+                finished = job.status not in ACTIVE_STATUSES
+            if not batch and not finished:
+                yield None
+            yield from batch
+            sent += len(batch)
+            if finished and sent >= len(job.items):
+                return
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ExtractionRequestHandler(BaseHTTPRequestHandler):
+    """Routes:
+
+    - ``POST /jobs`` submit (202 new, 200 de-duplicated, 429 queue full)
+    - ``GET /jobs/<id>`` status
+    - ``GET /jobs/<id>/result`` QA JSON once done (409 before)
+    - ``GET /jobs/<id>/items`` NDJSON stream of items as they are ready
+    - ``GET /healthz`` job counts
+
+    With a ``token`` every route but ``/healthz`` requires
+    ``Authorization: Bearer <token>`` (401 otherwise).
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "InterviewInsights/1"
+    manager: JobManager
+    token: str | None = None
+
+    def _send_json(self, status: HTTPStatus, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error_json(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def _authorized(self) -> bool:
+        if not self.token:
+            return True
+        header = self.headers.get("Authorization") or ""
+        scheme, _, credentials = header.partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(credentials.strip().encode(), self.token.encode()):
+            return True
+        # The body is not read, so the connection cannot be reused.
+        self.close_connection = True
+        body = json.dumps({"error": "Missing or invalid bearer token."}).encode("utf-8")
+        self.send_response(HTTPStatus.UNAUTHORIZED)
+        self.send_header("WWW-Authenticate", "Bearer")
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return False
+
+    def do_POST(self) -> None:
+        if not self._authorized():
+            return
+        if self.path.rstrip("/") != "/jobs":
+            self._send_error_json(HTTPStatus.NOT_FOUND, "Not found.")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send_error_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body exceeds {MAX_BODY_BYTES} bytes.")
+            return
+        try:
+            request = normalize_job_request(json.loads(self.rfile.read(length) or b"null"))
+        except (ValueError, UnicodeDecodeError) as exc:
+            self._send_error_json(HTTPStatus.BAD_REQUEST, str(exc))
+            return
+        try:
+            job, deduplicated = self.manager.submit(request)
+        except QueueFullError as exc:
+            self._send_error_json(HTTPStatus.TOO_MANY_REQUESTS, str(exc))
+            return
+        status = HTTPStatus.OK if deduplicated else HTTPStatus.ACCEPTED
+        self._send_json(status, {**job.to_dict(), "deduplicated": deduplicated})
+
+    def do_GET(self) -> None:
+        parts = [part for part in self.path.split("?", 1)[0].split("/") if part]
+        if parts == ["healthz"]:
+            self._send_json(HTTPStatus.OK, {"status": "ok", "jobs": self.manager.counts()})
+            return
+        if not self._authorized():
+            return
+        if len(parts) not in (2, 3) or parts[0] != "jobs":
+            self._send_error_json(HTTPStatus.NOT_FOUND, "Not found.")
+            return
+        job = self.manager.get(parts[1])
+        if job is None:
+            self._send_error_json(HTTPStatus.NOT_FOUND, "Unknown job.")
+            return
+        action = parts[2] if len(parts) == 3 else None
+        if action is None:
+            self._send_json(HTTPStatus.OK, job.to_dict())
+        elif action == "result":
+            if job.status != STATUS_DONE:
+                self._send_json(HTTPStatus.CONFLICT, job.to_dict())
+                return
+            try:
+                self._send_json(HTTPStatus.OK, self.manager.result(job))
+            except (OSError, ValueError) as exc:
+                self._send_error_json(HTTPStatus.INTERNAL_SERVER_ERROR, f"Failed to read result: {exc}")
+        elif action == "items":
+            self._stream_items(job)
+        else:
+            self._send_error_json(HTTPStatus.NOT_FOUND, "Not found.")
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _stream_items(self, job: Job) -> None:
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for item in self.manager.iter_items(job):
+                # Blank lines are keep-alives while the job is still running.
+                line = "" if item is None else json.dumps({"type": "item", "item": item}, ensure_ascii=False)
+                self._write_chunk(f"{line}\n".encode("utf-8"))
+            end = {"type": "end", "status": job.status, "error": job.error}
+            self._write_chunk(f"{json.dumps(end, ensure_ascii=False)}\n".encode("utf-8"))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+
+def make_server(
+    manager: JobManager,
+    *,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    token: str | None = None,
+) -> ThreadingHTTPServer:
+    handler = type(
+        "BoundExtractionRequestHandler",
+        (ExtractionRequestHandler,),
+        {"manager": manager, "token": token},
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="HTTP service: submit QA extraction jobs, poll status, fetch or stream results."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST}).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT}).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Extractions running at once (default: {DEFAULT_WORKERS}).",
+    )
+    parser.add_argument(
+        "--max-queued",
+        type=int,
+        default=DEFAULT_MAX_QUEUED,
+        help=f"Jobs waiting for a worker before submissions get 429 (default: {DEFAULT_MAX_QUEUED}).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="interview_insider/interview_insights",
+        help="Directory for QA JSON outputs.",
+    )
+    args = parser.parse_args()
+
+    token = os.environ.get(TOKEN_ENV) or None
+    manager = JobManager(output_dir=args.output_dir, workers=args.workers, max_queued=args.max_queued)
+    server = make_server(manager, host=args.host, port=args.port, token=token)
+    print(f"Serving on http://{args.host}:{args.port}" + ("" if token else f" without auth (set {TOKEN_ENV})"))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        manager.shutdown()
+
+
+__all__ = [
+    "DEFAULT_PORT",
+    "TOKEN_ENV",
+    "ExtractionRequestHandler",
+    "Job",
+    "JobManager",
+    "QueueFullError",
+    "job_key",
+    "make_server",
+    "normalize_job_request",
+]
+
+
+if __name__ == "__main__":
+    main()
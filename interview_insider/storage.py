@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+LOCK_STALE_SECONDS = 60.0
+# One thread lock per lock file, so writers of unrelated files (rollup,
+# question index, analytics cache) do not wait for each other.
+_THREAD_LOCKS: dict[str, threading.RLock] = {}
+_THREAD_LOCKS_GUARD = threading.Lock()
+
+
+def _thread_lock(lock_path: Path) -> threading.RLock:
+    with _THREAD_LOCKS_GUARD:
+        return _THREAD_LOCKS.setdefault(os.path.abspath(lock_path), threading.RLock())
+
+
+def _lock_age(path: Path) -> float | None:
+    try:
+        return time.time() - path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def _break_stale(lock_path: Path) -> None:
+    """Remove a stale lock left by a crashed writer.
+
+    As in ``leases._break_expired``, the lock is renamed to a unique
+    tombstone first, so of several waiters only one breaks it; if the
+    renamed lock turns out to be fresh (taken again between the check and
+    the rename), it is linked back.
+    """
+    tombstone = lock_path.with_name(f".{lock_path.name}.{uuid.uuid4().hex}.stale")
+    try:
+        os.rename(lock_path, tombstone)
+    except FileNotFoundError:
+        return
+    try:
+        age = _lock_age(tombstone)
+        if age is not None and age <= LOCK_STALE_SECONDS:
+            try:
+                os.link(tombstone, lock_path)
+            except FileExistsError:
+                pass
+    finally:
+        tombstone.unlink(missing_ok=True)
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float = 10.0) -> Iterator[None]:
+    """Hold ``<path>.lock`` for the duration of the block.
+
+    Works across processes sharing a volume (``O_EXCL`` create) and across
+    threads of one process. Locks older than ``LOCK_STALE_SECONDS`` are
+    assumed to belong to a crashed writer and are broken.
+    """
+    lock_path = path.with_suffix(path.suffix + ".lock")
+    deadline = time.monotonic() + timeout
+    with _thread_lock(lock_path):
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                age = _lock_age(lock_path)
+                if age is None:
+                    continue
+                if age > LOCK_STALE_SECONDS:
+                    _break_stale(lock_path)
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {lock_path}")
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            os.close(fd)
+            lock_path.unlink(missing_ok=True)
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write via a temp file in the same directory and rename over ``path``.
+
+    The temp name carries the host name and a random id: pids and thread
+    ids repeat across containers sharing a volume.
+    """
+    tmp_path = path.with_name(f".{path.name}.{socket.gethostname()}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    write_text_atomic(path, json.dumps(data, ensure_ascii=False, indent=2))
+
+
+__all__ = [
+    "file_lock",
+    "write_json_atomic",
+    "write_text_atomic",
+]
@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8504
+_CHARS_PER_TOKEN = 4
+_FILLER = (
+    "The candidate explained the trade-offs of the approach and gave an example from a previous project "
+    "with concrete numbers, then discussed edge cases, monitoring and what they would change next time. "
+)
+
+
+@dataclass(frozen=True)
+class StubProfile:
+    """How the stub behaves: latency distribution, failures and response size.
+
+    Latency is log-normal around ``latency_ms`` (``latency_sigma`` 0 makes it
+    fixed); a ``tail_rate`` share of requests takes ``tail_ms`` instead.
+    ``error_rate`` of requests fail with 500. With ``rate_limit_rpm`` the
+    stub answers 429 with ``retry-after`` once more requests arrive within a
+    minute. Generated responses have ``items`` entries per list and about
+    ``chars_per_field`` characters per string.
+    """
+
+    latency_ms: float = 800.0
+    latency_sigma: float = 0.5
+    tail_rate: float = 0.0
+    tail_ms: float = 15_000.0
+    error_rate: float = 0.0
+    rate_limit_rpm: int = 0
+    items: int = 8
+    chars_per_field: int = 120
+
+    def sample_latency(self, rng: random.Random) -> float:
+        if self.tail_rate and rng.random() < self.tail_rate:
+            return self.tail_ms / 1000
+        if self.latency_sigma <= 0:
+            return self.latency_ms / 1000
+        return rng.lognormvariate(math.log(max(self.latency_ms, 1.0) / 1000), self.latency_sigma)
+
+
+def _resolve(schema: dict[str, Any], root: dict[str, Any]) -> dict[str, Any]:
+    while "$ref" in schema:
+        node: Any = root
+        for part in schema["$ref"].lstrip("#/").split("/"):
+            node = node[part]
+        schema = node
+    return schema
+
+
+def sample_from_schema(schema: dict[str, Any], profile: StubProfile, *, root: dict[str, Any] | None = None, name: str = "") -> Any:
+    """A value that validates against a (strict) JSON schema, sized by ``profile``."""
+    root = root if root is not None else schema
+    schema = _resolve(schema, root)
+    options = schema.get("anyOf") or schema.get("oneOf")
+    if options:
+        non_null = [option for option in options if _resolve(option, root).get("type") != "null"]
+        return sample_from_schema((non_null or options)[0], profile, root=root, name=name)
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((value for value in kind if value != "null"), "null")
+    if kind == "object":
+        return {
+            key: sample_from_schema(value, profile, root=root, name=key)
+            for key, value in (schema.get("properties") or {}).items()
+        }
+    if kind == "array":
+        count = profile.items if name in ("items", "segments") else 2
+        return [sample_from_schema(schema.get("items") or {}, profile, root=root, name=name) for _ in range(count)]
+    if kind in ("integer", "number"):
+        return 1
+    if kind == "boolean":
+        return True
+    if kind == "null":
+        return None
+    if name == "timecode":
+        return "00:12:34"
+    text = (_FILLER * (profile.chars_per_field // len(_FILLER) + 1))[: profile.chars_per_field]
+    return f"{name}: {text}".strip()
+
+
+class _RateWindow:
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._arrivals: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def admit(self) -> tuple[bool, int, float]:
+        """Whether a request may proceed, requests remaining and seconds until a slot frees."""
+        now = time.monotonic()
+        with self._lock:
+            while self._arrivals and now - self._arrivals[0] >= 60:
+                self._arrivals.popleft()
+            reset = 60 - (now - self._arrivals[0]) if self._arrivals else 0.0
+            if len(self._arrivals) >= self.limit:
+                return False, 0, reset
+            self._arrivals.append(now)
+            return True, self.limit - len(self._arrivals), reset
+
+
+class StubServer:
+    """Local OpenAI-compatible server for the Responses structured-output endpoint.
+
+    ``POST /v1/responses`` answers ``responses.parse`` requests with JSON
+    generated from the request's ``text.format`` schema after a sampled
+    delay; ``GET /v1/models`` and ``GET /health`` answer immediately. Use as
+    a context manager; point clients at ``url``.
+    """
+
+    def __init__(self, profile: StubProfile | None = None, *, host: str = DEFAULT_HOST, port: int = 0, seed: int | None = None) -> None:
+        self.profile = profile or StubProfile()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._rate = _RateWindow(self.profile.rate_limit_rpm) if self.profile.rate_limit_rpm else None
+        self._counts = {"requests": 0, "ok": 0, "errors": 0, "rate_limited": 0}
+        self._counts_lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> StubServer:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> StubServer:
+        return self.start()
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    def counts(self) -> dict[str, int]:
+        with self._counts_lock:
+            return dict(self._counts)
+
+    def _count(self, key: str) -> None:
+        with self._counts_lock:
+            self._counts[key] += 1
+
+    def _roll(self) -> tuple[float, bool]:
+        with self._rng_lock:
+            return self.profile.sample_latency(self._rng), self._rng.random() < self.profile.error_rate
+
+    def respond(self, body: dict[str, Any]) -> tuple[int, dict[str, str], dict[str, Any]]:
+        """Status, headers and JSON payload for one ``/v1/responses`` request."""
+        self._count("requests")
+        headers: dict[str, str] = {}
+        if self._rate is not None:
+            admitted, remaining, reset = self._rate.admit()
+            headers = {
+                "x-ratelimit-limit-requests": str(self._rate.limit),
+                "x-ratelimit-remaining-requests": str(remaining),
+                "x-ratelimit-reset-requests": f"{reset:.3f}s",
+            }
+            if not admitted:
+                self._count("rate_limited")
+                headers["retry-after"] = f"{max(reset, 0.001):.3f}"
+                return HTTPStatus.TOO_MANY_REQUESTS, headers, _error("Rate limit reached (stub).", "rate_limit_exceeded")
+        latency, failed = self._roll()
+        time.sleep(latency)
+        if failed:
+            self._count("errors")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, headers, _error("Injected failure (stub).", "server_error")
+        text_format = ((body.get("text") or {}).get("format")) or {}
+        schema = text_format.get("schema") or {"type": "object", "properties": {}}
+        output_text = json.dumps(sample_from_schema(schema, self.profile), ensure_ascii=False)
+        input_tokens = len(json.dumps(body.get("input") or "", ensure_ascii=False)) // _CHARS_PER_TOKEN
+        output_tokens = len(output_text) // _CHARS_PER_TOKEN
+        self._count("ok")
+        return HTTPStatus.OK, headers, {
+            "id": f"resp_{uuid.uuid4().hex}",
+            "object": "response",
+            "created_at": int(time.time()),
+            "status": "completed",
+            "model": body.get("model") or "stub",
+            "output": [
+                {
+                    "type": "message",
+                    "id": f"msg_{uuid.uuid4().hex}",
+                    "status": "completed",
+                    "role": "assistant",
+                    "content": [{"type": "output_text", "text": output_text, "annotations": []}],
+                }
+            ],
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+            "text": body.get("text") or {},
+            "usage": {
+                "input_tokens": input_tokens,
+                "input_tokens_details": {"cached_tokens": 0},
+                "output_tokens": output_tokens,
+                "output_tokens_details": {"reasoning_tokens": 0},
+                "total_tokens": input_tokens + output_tokens,
+            },
+        }
+
+
+def _error(message: str, code: str) -> dict[str, Any]:
+    return {"error": {"message": message, "type": code, "code": code, "param": None}}
+
+
+def _make_handler(server: StubServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _send(self, status: int, payload: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            path = self.path.split("?", 1)[0].rstrip("/")
+            if path in ("/health", "/v1/health"):
+                self._send(HTTPStatus.OK, {"status": "ok", **server.counts()})
+            elif path == "/v1/models":
+                self._send(HTTPStatus.OK, {"object": "list", "data": [{"id": "stub", "object": "model", "owned_by": "stub"}]})
+            else:
+                self._send(HTTPStatus.NOT_FOUND, _error("Not found.", "not_found"))
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                self._send(HTTPStatus.BAD_REQUEST, _error("Body must be JSON.", "invalid_request_error"))
+                return
+            if self.path.split("?", 1)[0].rstrip("/") != "/v1/responses":
+                self._send(HTTPStatus.NOT_FOUND, _error("Not found.", "not_found"))
+                return
+            status, headers, payload = server.respond(body)
+            self._send(status, payload, headers)
+
+    return Handler
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser, defaults: StubProfile | None = None) -> None:
+    defaults = defaults or StubProfile()
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="Median response latency in ms.")
+    parser.add_argument(
+        "--latency-sigma",
+        type=float,
+        default=defaults.latency_sigma,
+        help="Log-normal spread of the latency (0 = fixed).",
+    )
+    parser.add_argument("--tail-rate", type=float, default=defaults.tail_rate, help="Share of very slow responses.")
+    parser.add_argument("--tail-ms", type=float, default=defaults.tail_ms, help="Latency of slow responses in ms.")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="Share of requests failing with 500.")
+    parser.add_argument(
+        "--rate-limit-rpm",
+        type=int,
+        default=defaults.rate_limit_rpm,
+        help="Requests per minute before answering 429 (0 = unlimited).",
+    )
+    parser.add_argument("--items", type=int, default=defaults.items, help="Items generated per response.")
+    parser.add_argument(
+        "--chars-per-field",
+        type=int,
+        default=defaults.chars_per_field,
+        help="Characters per generated string field.",
+    )
+
+
+def profile_from_args(args: argparse.Namespace) -> StubProfile:
+    return StubProfile(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        tail_rate=args.tail_rate,
+        tail_ms=args.tail_ms,
+        error_rate=args.error_rate,
+        rate_limit_rpm=args.rate_limit_rpm,
+        items=args.items,
+        chars_per_field=args.chars_per_field,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run a local OpenAI-compatible stub of the Responses API for load tests (no API costs)."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST}).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT}).")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for latencies and failures.")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    server = StubServer(profile_from_args(args), host=args.host, port=args.port, seed=args.seed)
+    print(f"Stub Responses API on {server.url} (set OPENAI_BASE_URL to use it)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+__all__ = [
+    "DEFAULT_PORT",
+    "StubProfile",
+    "StubServer",
+    "add_profile_arguments",
+    "profile_from_args",
+    "sample_from_schema",
+]
+
+
+if __name__ == "__main__":
+    main()
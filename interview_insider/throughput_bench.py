@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from interview_insider.backend_pool import BACKENDS_ENV
+from interview_insider.qa_extractor import PIPELINE_SINGLE, PIPELINES, run_qa_extraction_for_file_async
+from interview_insider.schema_profiles import SCHEMA_PROFILES
+from interview_insider.stub_server import StubServer, add_profile_arguments, profile_from_args
+
+DEFAULT_CONCURRENCY = (1, 4, 16)
+DRIVER_PIPELINE = "pipeline"
+DRIVER_CLI = "cli"
+DRIVERS = (DRIVER_PIPELINE, DRIVER_CLI)
+
+REPORT_COLUMNS = [
+    ("concurrency", "Conc."),
+    ("files", "Files"),
+    ("failed", "Failed"),
+    ("seconds", "Seconds"),
+    ("files_per_minute", "Files/min"),
+    ("p50", "p50 s"),
+    ("p95", "p95 s"),
+    ("p99", "p99 s"),
+    ("requests", "Requests"),
+    ("server_errors", "500s"),
+    ("rate_limited", "429s"),
+]
+
+_QUESTIONS = (
+    "How would you design an idempotent ingestion job?",
+    "What is the difference between a clustered and a non-clustered index?",
+    "How do you detect data drift in production?",
+    "Explain window functions with an example.",
+    "How would you backfill a partitioned table safely?",
+)
+
+
+def synthetic_transcripts(directory: Path, count: int, chars: int) -> list[Path]:
+    """Write ``count`` interview-like transcripts of about ``chars`` characters each."""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for number in range(count):
+        lines = []
+        minute = 0
+        while sum(len(line) + 1 for line in lines) < chars:
+            question = _QUESTIONS[(number + minute) % len(_QUESTIONS)]
+            lines.append(f"[{minute // 60:02d}:{minute % 60:02d}:00] Interviewer: {question}")
+            lines.append(
+                f"[{minute // 60:02d}:{minute % 60:02d}:30] Candidate: I would start from the requirements, "
+                "then describe the trade-offs, the failure modes and how I would monitor it in production."
+            )
+            minute += 1
+        path = directory / f"bench_{number:04d}.txt"
+        path.write_text("\n".join(lines)[:chars], encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def percentile(values: list[float], fraction: float) -> float | None:
+    """Nearest-rank percentile; ``None`` for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+async def _run_pipeline_level(
+    transcript_paths: list[Path],
+    *,
+    concurrency: int,
+    base_url: str,
+    output_dir: Path,
+    max_retries: int,
+    **kwargs: Any,
+) -> tuple[list[float], int]:
+    from openai import AsyncOpenAI
+
+    from interview_insider.llm_client import AsyncLLMClient
+
+    # Same wiring as ``qa_extractor --concurrency``: one client, bounded files in flight.
+    client = AsyncOpenAI(base_url=base_url, api_key="stub", max_retries=max_retries)
+    llm_client = AsyncLLMClient(client=client, max_concurrency=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(transcript_path: Path) -> float | None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await run_qa_extraction_for_file_async(
+                    transcript_path=transcript_path,
+                    output_dir=output_dir,
+                    llm_client=llm_client,
+                    **kwargs,
+                )
+            except Exception:
+                return None
+            return time.perf_counter() - started
+
+    try:
+        results = await asyncio.gather(*(_run(path) for path in transcript_paths))
+    finally:
+        # Close while this level's event loop is still running.
+        await client.close()
+    latencies = [value for value in results if value is not None]
+    return latencies, len(results) - len(latencies)
+
+
+def _run_cli_level(
+    transcript_dir: Path,
+    transcript_count: int,
+    *,
+    concurrency: int,
+    base_url: str,
+    output_dir: Path,
+    model: str,
+    language: str,
+    pipeline: str,
+    schema: str | None,
+) -> tuple[list[float], int]:
+    command = [
+        sys.executable,
+        "-m",
+        "interview_insider.qa_extractor",
+        "--transcript",
+        str(transcript_dir),
+        "--model",
+        model,
+        "--language",
+        language,
+        "--pipeline",
+        pipeline,
+        "--output-dir",
+        str(output_dir),
+        "--concurrency",
+        str(concurrency),
+    ]
+    if schema:
+        command += ["--schema", schema]
+    # A configured backend pool would take precedence over OPENAI_BASE_URL
+    # and send the benchmark to real (paid) endpoints.
+    env = {name: value for name, value in os.environ.items() if name != BACKENDS_ENV}
+    env.update({"OPENAI_BASE_URL": base_url, "OPENAI_API_KEY": "stub"})
+    completed = subprocess.run(command, env=env, capture_output=True, text=True)
+    if completed.returncode:
+        print(
+            f"qa_extractor exited with code {completed.returncode} at concurrency {concurrency}:\n"
+            f"{completed.stderr.strip()[-4000:]}",
+            file=sys.stderr,
+        )
+    # Per-file latency is not visible from outside the process; failures are
+    # transcripts without a finished ``.usage.json``.
+    finished = len(list(output_dir.glob("*_qa.usage.json")))
+    return [], transcript_count - finished
+
+
+def run_benchmark(
+    *,
+    concurrency_levels: list[int] | tuple[int, ...] = DEFAULT_CONCURRENCY,
+    files: int = 40,
+    chars: int = 20_000,
+    server: StubServer | None = None,
+    base_url: str | None = None,
+    driver: str = DRIVER_PIPELINE,
+    model: str = "o4-mini",
+    language: str = "ru",
+    pipeline: str = PIPELINE_SINGLE,
+    schema: str | None = None,
+    max_retries: int = 2,
+    work_dir: str | Path | None = None,
+) -> list[dict[str, Any]]:
+    """Extract ``files`` synthetic transcripts at each concurrency level and measure it.
+
+    Requests go to ``base_url`` or to ``server`` (a ``StubServer``, started
+    here with default settings when neither is given), never to the paid
+    API. The ``pipeline`` driver runs the async extraction in-process and
+    times every file; the ``cli`` driver runs ``qa_extractor --concurrency``
+    as a subprocess, so only totals are known. Returns one report row per
+    level.
+    """
+    own_server = server is None and base_url is None
+    if own_server:
+        server = StubServer().start()
+    url = base_url or server.url
+    rows = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="throughput-bench-", dir=work_dir) as tmp:
+            transcript_dir = Path(tmp) / "transcripts"
+            transcript_paths = synthetic_transcripts(transcript_dir, files, chars)
+            for concurrency in concurrency_levels:
+                output_dir = Path(tmp) / f"out_c{concurrency}"
+                before = server.counts() if server is not None else {}
+                started = time.perf_counter()
+                if driver == DRIVER_CLI:
+                    latencies, failed = _run_cli_level(
+                        transcript_dir,
+                        len(transcript_paths),
+                        concurrency=concurrency,
+                        base_url=url,
+                        output_dir=output_dir,
+                        model=model,
+                        language=language,
+                        pipeline=pipeline,
+                        schema=schema,
+                    )
+                else:
+                    latencies, failed = asyncio.run(
+                        _run_pipeline_level(
+                            transcript_paths,
+                            concurrency=concurrency,
+                            base_url=url,
+                            output_dir=output_dir,
+                            max_retries=max_retries,
+                            resume_text=None,
+                            model=model,
+                            vacancy=None,
+                            language=language,
+                            pipeline=pipeline,
+                            schema=schema,
+                            reuse_answers=False,
+                        )
+                    )
+                seconds = time.perf_counter() - started
+                after = server.counts() if server is not None else {}
+                row: dict[str, Any] = {
+                    "concurrency": concurrency,
+                    "files": len(transcript_paths),
+                    "failed": failed,
+                    "seconds": round(seconds, 2),
+                    "files_per_minute": round((len(transcript_paths) - failed) / seconds * 60, 1) if seconds else 0.0,
+                }
+                for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+                    value = percentile(latencies, fraction)
+                    row[name] = round(value, 3) if value is not None else None
+                row["requests"] = after.get("requests", 0) - before.get("requests", 0) if server else None
+                row["server_errors"] = after.get("errors", 0) - before.get("errors", 0) if server else None
+                row["rate_limited"] = after.get("rate_limited", 0) - before.get("rate_limited", 0) if server else None
+                rows.append(row)
+    finally:
+        if own_server:
+            server.stop()
+    return rows
+
+
+def format_report(rows: list[dict[str, Any]]) -> str:
+    table = [[label for _, label in REPORT_COLUMNS]]
+    for row in rows:
+        table.append(["-" if row.get(key) is None else str(row[key]) for key, _ in REPORT_COLUMNS])
+    widths = [max(len(line[idx]) for line in table) for idx in range(len(REPORT_COLUMNS))]
+    lines = []
+    for line_index, line in enumerate(table):
+        lines.append("  ".join(cell.rjust(width) for cell, width in zip(line, widths)))
+        if line_index == 0:
+            lines.append("  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure end-to-end extraction throughput against a local OpenAI-compatible stub server "
+            "(no API costs): files/minute, p50/p95/p99 latency per file and failures per concurrency level."
+        )
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_CONCURRENCY),
+        help=f"Concurrency levels to run (default: {' '.join(map(str, DEFAULT_CONCURRENCY))}).",
+    )
+    parser.add_argument("--files", type=int, default=40, help="Synthetic transcripts per level (default: 40).")
+    parser.add_argument("--chars", type=int, default=20_000, help="Characters per transcript (default: 20000).")
+    parser.add_argument(
+        "--driver",
+        default=DRIVER_PIPELINE,
+        choices=DRIVERS,
+        help="pipeline: in-process async extraction with per-file latency; cli: qa_extractor subprocess.",
+    )
+    parser.add_argument("--model", default="o4-mini", help="Model alias sent to the server (default: o4-mini).")
+    parser.add_argument("--language", default="ru", help="Language for the output (default: ru).")
+    parser.add_argument("--pipeline", default=PIPELINE_SINGLE, choices=PIPELINES, help="Extraction pipeline.")
+    parser.add_argument("--schema", default=None, choices=SCHEMA_PROFILES, help="Output schema profile.")
+    parser.add_argument("--max-retries", type=int, default=2, help="Client retries on 429/5xx (default: 2).")
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="Use an already running OpenAI-compatible server instead of starting the stub.",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed of the stub server.")
+    add_profile_arguments(parser)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    args = parser.parse_args()
+
+    server = None if args.base_url else StubServer(profile_from_args(args), seed=args.seed).start()
+    try:
+        rows = run_benchmark(
+            concurrency_levels=args.concurrency,
+            files=args.files,
+            chars=args.chars,
+            server=server,
+            base_url=args.base_url,
+            driver=args.driver,
+            model=args.model,
+            language=args.language,
+            pipeline=args.pipeline,
+            schema=args.schema,
+            max_retries=args.max_retries,
+        )
+    finally:
+        if server is not None:
+            server.stop()
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(rows))
+
+
+__all__ = [
+    "DRIVERS",
+    "format_report",
+    "percentile",
+    "run_benchmark",
+    "synthetic_transcripts",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from interview_insider.llm_client import AsyncLLMClient, LLMClient
+from interview_insider.schema_profiles import evaluation_model, extraction_model, resolve_schema
+from interview_insider.usage_rollup import merge_usage
+from interview_insider.prompts.extracton_models_and_prompts import (
+    QASegmentation,
+    prompt_QA_item_evaluator,
+    prompt_QA_segmenter,
+)
+
+DEFAULT_SEGMENT_MODEL = "o4-mini"
+DEFAULT_MAX_WORKERS = 8
+
+
+def _locate(transcript_text: str, needle: str, start: int) -> int | None:
+    words = needle.split()
+    if not words:
+        return None
+    pattern = re.compile(r"\s+".join(re.escape(word) for word in words), re.IGNORECASE)
+    match = pattern.search(transcript_text, start) or pattern.search(transcript_text)
+    return match.start() if match else None
+
+
+def split_excerpts(transcript_text: str, segments: list[dict[str, Any]]) -> list[str]:
+    """Cut the transcript into one excerpt per segment.
+
+    Each segment is located by its verbatim ``start_quote`` (falling back to
+    its timecode) and runs until the next located segment. Segments that
+    cannot be located get the span between their located neighbours.
+    """
+    starts: list[int | None] = []
+    cursor = 0
+    for segment in segments:
+        position = _locate(transcript_text, str(segment.get("start_quote") or ""), cursor)
+        if position is None:
+            position = _locate(transcript_text, str(segment.get("timecode") or ""), cursor)
+        if position is not None:
+            cursor = position
+        starts.append(position)
+
+    excerpts: list[str] = []
+    for index, start in enumerate(starts):
+        begin = start
+        if begin is None:
+            begin = next((value for value in reversed(starts[:index]) if value is not None), 0)
+        end = next(
+            (value for value in starts[index + 1 :] if value is not None and value > begin),
+            len(transcript_text),
+        )
+        excerpts.append(transcript_text[begin:end].strip())
+    return excerpts
+
+
+def _context_prefix(resume_text: str | None) -> str:
+    # Shared, identical prefix for every per-question call so the provider's
+    # prompt cache can reuse it across the parallel requests.
+    return f"#RESUME: {resume_text or ''}\n"
+
+
+def _segment_request(
+    *,
+    transcript_text: str,
+    vacancy: str | None,
+    language: str,
+    segment_model: str,
+) -> dict[str, Any]:
+    return {
+        "system_prompt": prompt_QA_segmenter.format(vacancy=vacancy or "unknown", language=language),
+        "user_message": f"#INTERVIEW TRANSCRIPTION: {transcript_text}",
+        "model": segment_model,
+        "response_model": QASegmentation,
+    }
+
+
+def _evaluation_requests(
+    transcript_text: str,
+    segments: list[dict[str, Any]],
+    *,
+    resume_text: str | None,
+    vacancy: str | None,
+    language: str,
+    model: str,
+    schema: str,
+) -> list[dict[str, Any]]:
+    evaluator_prompt = prompt_QA_item_evaluator.format(vacancy=vacancy or "unknown", language=language)
+    prefix = _context_prefix(resume_text)
+    return [
+        {
+            "system_prompt": evaluator_prompt,
+            "user_message": (
+                f"{prefix}"
+                f"#QUESTION ({segment.get('timecode') or '?'}): {segment.get('question') or ''}\n"
+                f"#TRANSCRIPT EXCERPT: {excerpt}"
+            ),
+            "model": model,
+            "response_model": evaluation_model(schema),
+        }
+        for segment, excerpt in zip(segments, split_excerpts(transcript_text, segments))
+    ]
+
+
+def _assemble(
+    segmentation_json: dict[str, Any],
+    evaluations: list[tuple[dict[str, Any], dict[str, Any]]],
+    segment_usage: dict[str, Any],
+    *,
+    model: str,
+    segment_model: str,
+    schema: str,
+) -> tuple[dict[str, Any], dict[str, Any], list[dict[str, Any]]]:
+    items = []
+    for segment, (evaluation, _) in zip(segmentation_json.get("segments") or [], evaluations):
+        items.append(
+            {
+                "question": segment.get("question"),
+                "timecode": segment.get("timecode"),
+                "place_in_the_text": segment.get("place_in_the_text"),
+                **evaluation,
+            }
+        )
+    extraction = extraction_model(schema).model_validate(
+        {
+            "vacancy": segmentation_json.get("vacancy"),
+            "employee_role_identified": segmentation_json.get("employee_role_identified") or "",
+            "stages_of_conversation_short": segmentation_json.get("stages_of_conversation_short") or [],
+            "items": items,
+        }
+    )
+
+    attempts = [{"model": segment_model, "phase": "segment", "usage": segment_usage}]
+    attempts.extend({"model": model, "phase": "evaluate", "usage": usage} for _, usage in evaluations)
+    total_usage: dict[str, Any] = {}
+    for attempt in attempts:
+        total_usage = merge_usage(total_usage, attempt["usage"])
+    return extraction.model_dump(), total_usage, attempts
+
+
+def extract_qa_two_phase(
+    llm_client: LLMClient,
+    *,
+    transcript_text: str,
+    resume_text: str | None,
+    vacancy: str | None,
+    language: str,
+    model: str,
+    segment_model: str = DEFAULT_SEGMENT_MODEL,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    lite: bool = False,
+    schema: str | None = None,
+    item_callback: Callable[[dict[str, Any]], None] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any], list[dict[str, Any]]]:
+    """Segment the transcript with a cheap call, then evaluate items in parallel.
+
+    Returns a dict shaped by the ``schema`` profile (``lite`` is shorthand
+    for ``standard``, see ``schema_profiles``), the summed usage and the
+    list of per-call attempts (model + usage) for cost accounting. ``item_callback`` receives each
+    item (with its 0-based ``index``) as soon as its evaluation completes.
+    """
+    schema = resolve_schema(schema, lite=lite)
+    segmentation, segment_usage = llm_client.call_structured_llm(
+        **_segment_request(
+            transcript_text=transcript_text,
+            vacancy=vacancy,
+            language=language,
+            segment_model=segment_model,
+        )
+    )
+    segmentation_json = segmentation.model_dump()
+    segments = segmentation_json.get("segments") or []
+    requests = _evaluation_requests(
+        transcript_text,
+        segments,
+        resume_text=resume_text,
+        vacancy=vacancy,
+        language=language,
+        model=model,
+        schema=schema,
+    )
+
+    def _evaluate(index: int) -> tuple[dict[str, Any], dict[str, Any]]:
+        evaluation, usage = llm_client.call_structured_llm(**requests[index])
+        evaluation_json = evaluation.model_dump()
+        if item_callback:
+            segment = segments[index]
+            item_callback(
+                {
+                    "index": index,
+                    "question": segment.get("question"),
+                    "timecode": segment.get("timecode"),
+                    "place_in_the_text": segment.get("place_in_the_text"),
+                    **evaluation_json,
+                }
+            )
+        return evaluation_json, usage
+
+    evaluations: list[tuple[dict[str, Any], dict[str, Any]]] = []
+    if requests:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(requests)))) as executor:
+            evaluations = list(executor.map(_evaluate, range(len(requests))))
+    return _assemble(
+        segmentation_json,
+        evaluations,
+        segment_usage,
+        model=model,
+        segment_model=segment_model,
+        schema=schema,
+    )
+
+
+async def extract_qa_two_phase_async(
+    llm_client: AsyncLLMClient,
+    *,
+    transcript_text: str,
+    resume_text: str | None,
+    vacancy: str | None,
+    language: str,
+    model: str,
+    segment_model: str = DEFAULT_SEGMENT_MODEL,
+    lite: bool = False,
+    schema: str | None = None,
+) -> tuple[dict[str, Any], dict[str, Any], list[dict[str, Any]]]:
+    """Async ``extract_qa_two_phase``; concurrency is bounded by the client."""
+    schema = resolve_schema(schema, lite=lite)
+    segmentation, segment_usage = await llm_client.call_structured_llm(
+        **_segment_request(
+            transcript_text=transcript_text,
+            vacancy=vacancy,
+            language=language,
+            segment_model=segment_model,
+        )
+    )
+    segmentation_json = segmentation.model_dump()
+    requests = _evaluation_requests(
+        transcript_text,
+        segmentation_json.get("segments") or [],
+        resume_text=resume_text,
+        vacancy=vacancy,
+        language=language,
+        model=model,
+        schema=schema,
+    )
+    responses = await asyncio.gather(*(llm_client.call_structured_llm(**request) for request in requests))
+    evaluations = [(evaluation.model_dump(), usage) for evaluation, usage in responses]
+    return _assemble(
+        segmentation_json,
+        evaluations,
+        segment_usage,
+        model=model,
+        segment_model=segment_model,
+        schema=schema,
+    )
+
+
+__all__ = [
+    "DEFAULT_MAX_WORKERS",
+    "DEFAULT_SEGMENT_MODEL",
+    "extract_qa_two_phase",
+    "extract_qa_two_phase_async",
+    "split_excerpts",
+]
@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from interview_insider.model_cards import get_model_pricing
+from interview_insider.storage import file_lock, write_json_atomic
+
+ROLLUP_DIRNAME = "_rollup"
+ROLLUP_FILENAME = "usage_rollup.json"
+ROLLUP_DIMENSIONS = ("model", "day", "vacancy")
+ROLLUP_VERSION = 1
+
+_TOKEN_KEYS = (
+    "input_tokens",
+    "cached_input_tokens",
+    "output_tokens",
+    "reasoning_tokens",
+    "total_tokens",
+)
+# Tokens avoided by recovery paths and compact inputs (``routing.salvage``
+# and ``resume`` in .usage.json).
+_SAVING_KEYS = ("tokens_saved",)
+_METRIC_KEYS = ("runs", *_TOKEN_KEYS, "cost_usd", *_SAVING_KEYS)
+
+
+def extract_usage_numbers(usage: dict) -> dict[str, int]:
+    if not isinstance(usage, dict):
+        return {}
+    summary: dict[str, int] = {}
+    input_tokens = usage.get("input_tokens")
+    output_tokens = usage.get("output_tokens")
+    total_tokens = usage.get("total_tokens")
+    if isinstance(input_tokens, int):
+        summary["input_tokens"] = input_tokens
+    if isinstance(output_tokens, int):
+        summary["output_tokens"] = output_tokens
+    if isinstance(total_tokens, int):
+        summary["total_tokens"] = total_tokens
+    input_details = usage.get("input_tokens_details") or {}
+    output_details = usage.get("output_tokens_details") or {}
+    cached_tokens = input_details.get("cached_tokens")
+    reasoning_tokens = output_details.get("reasoning_tokens")
+    if isinstance(cached_tokens, int):
+        summary["cached_input_tokens"] = cached_tokens
+    if isinstance(reasoning_tokens, int):
+        summary["reasoning_tokens"] = reasoning_tokens
+    return summary
+
+
+def estimate_cost_usd(model: str, summary: dict[str, int]) -> float:
+    """Price a usage summary with the ``MODEL_CARDS`` rates (USD per 1M tokens).
+
+    Cached input is billed at the cached rate and the rest of the input at the
+    full rate; reasoning tokens are already part of ``output_tokens``.
+    """
+    pricing = get_model_pricing(model)
+    input_tokens = summary.get("input_tokens", 0)
+    cached_tokens = min(summary.get("cached_input_tokens", 0), input_tokens)
+    output_tokens = summary.get("output_tokens", 0)
+    cost = (
+        (input_tokens - cached_tokens) * pricing["input"]
+        + cached_tokens * pricing["cached_input"]
+        + output_tokens * pricing["output"]
+    )
+    return cost / 1_000_000
+
+
+def build_usage_record(
+    *,
+    usage: dict[str, Any] | None,
+    model: str | None,
+    vacancy: str | None,
+    created_at: datetime | None = None,
+    attempts: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Build the per-run rollup record.
+
+    ``attempts`` (model + usage per call, e.g. from cascade routing) prices
+    each call at its own model's rate instead of pricing the summed usage at
+    ``model``'s rate.
+    """
+    summary = extract_usage_numbers(usage or {})
+    created_at = created_at or datetime.now(timezone.utc)
+    model_name = model or "unknown"
+    record: dict[str, Any] = {
+        "model": model_name,
+        "day": created_at.strftime("%Y-%m-%d"),
+        "vacancy": (vacancy or "").strip() or "unknown",
+    }
+    for key in _TOKEN_KEYS:
+        record[key] = summary.get(key, 0)
+    if attempts:
+        record["cost_usd"] = sum(
+            estimate_cost_usd(attempt.get("model") or model_name, extract_usage_numbers(attempt.get("usage") or {}))
+            for attempt in attempts
+        )
+    else:
+        record["cost_usd"] = estimate_cost_usd(model_name, summary)
+    return record
+
+
+def merge_usage(total: dict[str, Any], usage: dict[str, Any]) -> dict[str, Any]:
+    """Sum two usage payloads field by field (nested details included)."""
+    merged = dict(total)
+    for key, value in usage.items():
+        current = merged.get(key)
+        if isinstance(value, dict):
+            merged[key] = merge_usage(current if isinstance(current, dict) else {}, value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            merged[key] = (current if isinstance(current, (int, float)) else 0) + value
+        elif key not in merged:
+            merged[key] = value
+    return merged
+
+
+def usage_record_from_payload(
+    payload: dict[str, Any],
+    *,
+    fallback_created_at: datetime | None = None,
+) -> dict[str, Any]:
+    """Build a rollup record from a saved ``.usage.json`` payload.
+
+    Follow-up calls stored under ``deep_dives`` are added on top of the
+    extraction's own usage and priced at their own models.
+    """
+    created_at = payload.get("created_at")
+    created = datetime.fromisoformat(created_at) if created_at else fallback_created_at
+    usage = payload.get("usage") or {}
+    model = payload.get("model")
+    routing = payload.get("routing") or {}
+    deep_dives = [entry for entry in payload.get("deep_dives") or [] if isinstance(entry, dict)]
+    attempts = None
+    if routing.get("attempts") or deep_dives:
+        attempts = list(routing.get("attempts") or [{"model": model, "usage": usage}])
+        for entry in deep_dives:
+            attempts.append(entry)
+            usage = merge_usage(usage, entry.get("usage") or {})
+    record = build_usage_record(
+        usage=usage,
+        model=model,
+        vacancy=payload.get("vacancy"),
+        created_at=created,
+        attempts=attempts,
+    )
+    record["tokens_saved"] = int((routing.get("salvage") or {}).get("tokens_saved") or 0) + int(
+        (payload.get("resume") or {}).get("input_tokens_saved") or 0
+    )
+    return record
+
+
+def rollup_path(output_dir: str | Path) -> Path:
+    return Path(output_dir) / ROLLUP_DIRNAME / ROLLUP_FILENAME
+
+
+def _empty_metrics() -> dict[str, float]:
+    return {key: 0 for key in _METRIC_KEYS}
+
+
+def _empty_rollup() -> dict[str, Any]:
+    rollup: dict[str, Any] = {
+        "version": ROLLUP_VERSION,
+        "updated_at": None,
+        "totals": _empty_metrics(),
+        "files": {},
+    }
+    for dimension in ROLLUP_DIMENSIONS:
+        rollup[f"by_{dimension}"] = {}
+    return rollup
+
+
+def load_rollup(output_dir: str | Path) -> dict[str, Any]:
+    path = rollup_path(output_dir)
+    if not path.exists():
+        return _empty_rollup()
+    try:
+        rollup = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return _empty_rollup()
+    if not isinstance(rollup, dict) or rollup.get("version") != ROLLUP_VERSION:
+        return _empty_rollup()
+    return rollup
+
+
+def _apply(metrics: dict[str, float], record: dict[str, Any], sign: int) -> None:
+    metrics["runs"] = metrics.get("runs", 0) + sign
+    for key in (*_TOKEN_KEYS, "cost_usd", *_SAVING_KEYS):
+        metrics[key] = metrics.get(key, 0) + sign * record.get(key, 0)
+
+
+def _apply_record(rollup: dict[str, Any], record: dict[str, Any], sign: int) -> None:
+    _apply(rollup["totals"], record, sign)
+    for dimension in ROLLUP_DIMENSIONS:
+        buckets = rollup[f"by_{dimension}"]
+        key = str(record.get(dimension) or "unknown")
+        metrics = buckets.setdefault(key, _empty_metrics())
+        _apply(metrics, record, sign)
+        if metrics["runs"] <= 0:
+            del buckets[key]
+
+
+def _write_rollup(path: Path, rollup: dict[str, Any]) -> None:
+    rollup["updated_at"] = datetime.now(timezone.utc).isoformat()
+    write_json_atomic(path, rollup)
+
+
+def record_usage(
+    output_dir: str | Path,
+    file_name: str,
+    record: dict[str, Any],
+) -> dict[str, Any]:
+    """Fold one saved run into the rollup without rescanning the directory.
+
+    Re-saving an output with the same file name replaces its previous
+    contribution, so re-runs are not double counted.
+    """
+    path = rollup_path(output_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(path):
+        rollup = load_rollup(output_dir)
+        previous = rollup["files"].get(file_name)
+        if previous:
+            _apply_record(rollup, previous, -1)
+        _apply_record(rollup, record, 1)
+        rollup["files"][file_name] = record
+        _write_rollup(path, rollup)
+    return rollup
+
+
+def rebuild_rollup(output_dir: str | Path) -> dict[str, Any]:
+    """Recreate the rollup from every ``*.usage.json`` (one-off bootstrap).
+
+    Resume summarization calls are rebuilt from the cached summaries in
+    ``_resumes/``, which keep their usage and model.
+    """
+    from interview_insider.resume_summary import RESUMES_DIRNAME
+
+    output_path = Path(output_dir)
+    path = rollup_path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rollup = _empty_rollup()
+    for summary_path in sorted((output_path / RESUMES_DIRNAME).glob("*.json")):
+        try:
+            payload = json.loads(summary_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            continue
+        if not isinstance(payload, dict) or not payload.get("usage"):
+            continue
+        fallback = datetime.fromtimestamp(summary_path.stat().st_mtime, tz=timezone.utc)
+        record = usage_record_from_payload(payload, fallback_created_at=fallback)
+        # Same key as ``resume_summary`` records the call under.
+        file_name = f"{RESUMES_DIRNAME}/{summary_path.stem}"
+        _apply_record(rollup, record, 1)
+        rollup["files"][file_name] = record
+    for usage_path in sorted(output_path.glob("*.usage.json")):
+        try:
+            payload = json.loads(usage_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            continue
+        if not isinstance(payload, dict):
+            continue
+        fallback = datetime.fromtimestamp(usage_path.stat().st_mtime, tz=timezone.utc)
+        record = usage_record_from_payload(payload, fallback_created_at=fallback)
+        file_name = usage_path.name.replace(".usage.json", ".json")
+        _apply_record(rollup, record, 1)
+        rollup["files"][file_name] = record
+    with file_lock(path):
+        _write_rollup(path, rollup)
+    return rollup
+
+
+def _with_ratios(metrics: dict[str, float]) -> dict[str, Any]:
+    row: dict[str, Any] = dict(metrics)
+    input_tokens = metrics.get("input_tokens", 0)
+    output_tokens = metrics.get("output_tokens", 0)
+    runs = metrics.get("runs", 0)
+    row["cached_input_ratio"] = (
+        metrics.get("cached_input_tokens", 0) / input_tokens if input_tokens else 0.0
+    )
+    row["reasoning_ratio"] = (
+        metrics.get("reasoning_tokens", 0) / output_tokens if output_tokens else 0.0
+    )
+    row["cost_per_run_usd"] = metrics.get("cost_usd", 0) / runs if runs else 0.0
+    return row
+
+
+def rollup_rows(rollup: dict[str, Any], dimension: str) -> list[dict[str, Any]]:
+    if dimension not in ROLLUP_DIMENSIONS:
+        raise ValueError(f"Unsupported dimension '{dimension}'. Supported: {', '.join(ROLLUP_DIMENSIONS)}")
+    buckets = rollup.get(f"by_{dimension}") or {}
+    rows = [{dimension: key, **_with_ratios(metrics)} for key, metrics in buckets.items()]
+    if dimension == "day":
+        rows.sort(key=lambda row: row["day"], reverse=True)
+    else:
+        rows.sort(key=lambda row: row["cost_usd"], reverse=True)
+    return rows
+
+
+def rollup_totals(rollup: dict[str, Any]) -> dict[str, Any]:
+    return _with_ratios(rollup.get("totals") or _empty_metrics())
+
+
+def format_report(rollup: dict[str, Any], dimension: str) -> str:
+    columns = [
+        (dimension, dimension.capitalize()),
+        ("runs", "Runs"),
+        ("input_tokens", "Input"),
+        ("cached_input_ratio", "Cached %"),
+        ("output_tokens", "Output"),
+        ("reasoning_tokens", "Reasoning"),
+        ("total_tokens", "Total"),
+        ("cost_usd", "Cost $"),
+        ("tokens_saved", "Saved"),
+    ]
+
+    def _cell(key: str, value: Any) -> str:
+        if key == "cached_input_ratio":
+            return f"{value * 100:.1f}"
+        if key == "cost_usd":
+            return f"{value:.4f}"
+        return str(value)
+
+    rows = rollup_rows(rollup, dimension)
+    totals = {dimension: "TOTAL", **rollup_totals(rollup)}
+    table = [[label for _, label in columns]]
+    for row in [*rows, totals]:
+        table.append([_cell(key, row.get(key, 0)) for key, _ in columns])
+    widths = [max(len(line[idx]) for line in table) for idx in range(len(columns))]
+    lines = []
+    for line_index, line in enumerate(table):
+        cells = [
+            cell.ljust(width) if idx == 0 else cell.rjust(width)
+            for idx, (cell, width) in enumerate(zip(line, widths))
+        ]
+        lines.append("  ".join(cells))
+        if line_index == 0 or line_index == len(table) - 2:
+            lines.append("  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Report aggregated token usage and cost across saved QA runs."
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="interview_insider/interview_insights",
+        help="Directory with QA JSON outputs.",
+    )
+    parser.add_argument(
+        "--by",
+        default="model",
+        choices=ROLLUP_DIMENSIONS,
+        help="Aggregation dimension (default: model).",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild the rollup from existing .usage.json files before reporting.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print rows as JSON instead of a table.",
+    )
+    args = parser.parse_args()
+
+    if args.rebuild:
+        rollup = rebuild_rollup(args.output_dir)
+    else:
+        rollup = load_rollup(args.output_dir)
+
+    if args.json:
+        payload = {"totals": rollup_totals(rollup), "rows": rollup_rows(rollup, args.by)}
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(rollup, args.by))
+
+
+__all__ = [
+    "ROLLUP_DIMENSIONS",
+    "build_usage_record",
+    "estimate_cost_usd",
+    "extract_usage_numbers",
+    "format_report",
+    "load_rollup",
+    "merge_usage",
+    "rebuild_rollup",
+    "record_usage",
+    "usage_record_from_payload",
+    "rollup_path",
+    "rollup_rows",
+    "rollup_totals",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from interview_insider.segments import build_segment_index, plan_regions, split_segments
+
+TRANSCRIPT = "\n".join(
+    [
+        "[00:00:00] Q0 intro?",
+        "A0 answer",
+        "[00:01:00] Q1 sql?",
+        "A1 answer",
+        "[00:02:00] Q2 joins?",
+        "A2 answer",
+        "[00:03:00] Q3 where?",
+        "A3 answer",
+    ]
+)
+ITEMS = [{"timecode": f"00:0{minute}:00"} for minute in range(4)]
+
+
+def _excerpts(new_text: str) -> list[tuple[tuple[int, int], list[str]]]:
+    segments = split_segments(new_text)
+    regions = plan_regions(build_segment_index(TRANSCRIPT, ITEMS), segments)
+    return [(region.items, segments[region.segments[0] : region.segments[1]]) for region in regions]
+
+
+def test_unchanged_transcript_has_no_regions():
+    assert _excerpts(TRANSCRIPT) == []
+
+
+def test_edited_line_reextracts_its_item():
+    assert _excerpts(TRANSCRIPT.replace("A2 answer", "A2 answr")) == [
+        ((2, 3), ["[00:02:00] Q2 joins?", "A2 answr"]),
+    ]
+
+
+def test_lines_inserted_between_items_are_in_the_excerpt():
+    new_text = TRANSCRIPT.replace("A1 answer", "A1 answer\n[00:01:30] QX new?\nAX answer")
+    assert _excerpts(new_text) == [
+        ((1, 2), ["[00:01:00] Q1 sql?", "A1 answer", "[00:01:30] QX new?", "AX answer"]),
+    ]
+
+
+def test_lines_appended_after_the_last_item_are_in_the_excerpt():
+    new_text = TRANSCRIPT + "\n[00:04:00] Q4 new?\nA4 answer"
+    assert _excerpts(new_text) == [
+        ((3, 4), ["[00:03:00] Q3 where?", "A3 answer", "[00:04:00] Q4 new?", "A4 answer"]),
+    ]